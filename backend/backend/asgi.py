@@ -13,4 +13,18 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Imported after Django is set up; WebSocket scopes go to the round hub, everything else to Django.
+from hackathon.leaderboard import warm_round_leaderboards  # noqa: E402
+from hackathon.ws import round_socket  # noqa: E402
+
+# Build the live rounds' leaderboards before the first request rather than on it
+warm_round_leaderboards()
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'websocket':
+        await round_socket(scope, receive, send)
+    else:
+        await django_application(scope, receive, send)
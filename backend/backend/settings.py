@@ -99,6 +99,9 @@ DATABASES = {
         'OPTIONS': {
             'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
         },
+        # The migrations no longer reproduce the models (see 0006), so the test
+        # database is created from the models themselves.
+        'TEST': {'MIGRATE': False},
     },
 }
 
@@ -172,3 +175,101 @@ CSRF_TRUSTED_ORIGINS = [
     "http://127.0.0.1:5173",
     "http://127.0.0.1:5174",
 ]
+
+# Word frequency write-behind buffer (hackathon/counters.py). A crash loses at most
+# WORD_FLUSH_MAX_PENDING increments or WORD_FLUSH_INTERVAL_SECONDS of answers per process.
+WORD_FLUSH_INTERVAL_SECONDS = float(os.getenv('WORD_FLUSH_INTERVAL_SECONDS', '1.0'))
+WORD_FLUSH_MAX_PENDING = int(os.getenv('WORD_FLUSH_MAX_PENDING', '200'))
+WORD_FLUSH_MAX_BACKLOG = int(os.getenv('WORD_FLUSH_MAX_BACKLOG', '10000'))
+
+# Spread each word's counter over this many rows (hackathon_word_v2 plus hackathon_counter_shard)
+# to avoid row-lock contention on hot words. 1 keeps the plain one-row-per-word layout.
+WORD_COUNTER_SHARDS = int(os.getenv('WORD_COUNTER_SHARDS', '1'))
+
+# Number of recent word-cloud change sets kept for /api/wordcloud?since=<version> deltas.
+WORDCLOUD_DELTA_HISTORY = int(os.getenv('WORDCLOUD_DELTA_HISTORY', '64'))
+
+# Server-side word-cloud layout (hackathon/layout.py), served by ?layout=1: canvas size in px, the
+# number of top words placed, and the font-size range they are scaled into.
+WORDCLOUD_LAYOUT_WIDTH = int(os.getenv('WORDCLOUD_LAYOUT_WIDTH', '1000'))
+WORDCLOUD_LAYOUT_HEIGHT = int(os.getenv('WORDCLOUD_LAYOUT_HEIGHT', '600'))
+WORDCLOUD_LAYOUT_MAX_WORDS = int(os.getenv('WORDCLOUD_LAYOUT_MAX_WORDS', '150'))
+WORDCLOUD_LAYOUT_MIN_FONT_SIZE = int(os.getenv('WORDCLOUD_LAYOUT_MIN_FONT_SIZE', '16'))
+WORDCLOUD_LAYOUT_MAX_FONT_SIZE = int(os.getenv('WORDCLOUD_LAYOUT_MAX_FONT_SIZE', '72'))
+
+# Shareable word-cloud images (/api/wordcloud.png|svg and per-round variants, hackathon/render.py).
+# Renders are keyed by cloud version and kept in memory (CACHE_SIZE entries) and on disk under
+# RENDER_DIR (at most MAX_FILES files, oldest removed first). FONT is a .ttf path; empty uses
+# Pillow's bundled font. MAX_AGE is how long clients and CDNs may reuse an image of a live cloud.
+WORDCLOUD_RENDER_DIR = os.getenv('WORDCLOUD_RENDER_DIR', str(BASE_DIR / 'render_cache'))
+WORDCLOUD_RENDER_MAX_FILES = int(os.getenv('WORDCLOUD_RENDER_MAX_FILES', '500'))
+WORDCLOUD_RENDER_CACHE_SIZE = int(os.getenv('WORDCLOUD_RENDER_CACHE_SIZE', '64'))
+WORDCLOUD_RENDER_CACHE_TTL_SECONDS = float(os.getenv('WORDCLOUD_RENDER_CACHE_TTL_SECONDS', '3600'))
+WORDCLOUD_RENDER_FONT = os.getenv('WORDCLOUD_RENDER_FONT', '')
+WORDCLOUD_RENDER_MAX_AGE_SECONDS = int(os.getenv('WORDCLOUD_RENDER_MAX_AGE_SECONDS', '60'))
+
+# Server-Sent Events streams (hackathon/streams.py): how often the shared broadcaster checks for
+# changes, and how often an idle connection gets a keepalive comment.
+STREAM_PUSH_INTERVAL_MS = int(os.getenv('STREAM_PUSH_INTERVAL_MS', '1000'))
+STREAM_KEEPALIVE_SECONDS = float(os.getenv('STREAM_KEEPALIVE_SECONDS', '15'))
+
+# Number of words served by /api/sample-wordcloud from hackathon_sample_word_total.
+SAMPLE_WORDCLOUD_LIMIT = int(os.getenv('SAMPLE_WORDCLOUD_LIMIT', '500'))
+
+# Words served by /api/round/<id>/wordcloud and the round dashboard, read from
+# hackathon_wordfrequencybyround in rank order.
+ROUND_CLOUD_TOP_N = int(os.getenv('ROUND_CLOUD_TOP_N', '200'))
+
+# Per-round ranked leaderboards (hackathon/leaderboard.py) kept in memory per process, and the
+# default / maximum page size of /api/round/<id>/leaderboard.
+ROUND_LEADERBOARD_MAX_ROUNDS = int(os.getenv('ROUND_LEADERBOARD_MAX_ROUNDS', '256'))
+ROUND_LEADERBOARD_PAGE_SIZE = int(os.getenv('ROUND_LEADERBOARD_PAGE_SIZE', '100'))
+ROUND_LEADERBOARD_MAX_PAGE_SIZE = int(os.getenv('ROUND_LEADERBOARD_MAX_PAGE_SIZE', '500'))
+
+# In-memory round leaderboards re-scan this many ids below the newest row they have read, so rows whose
+# transaction commits out of id order are still picked up; leaderboards are also rebuilt from the
+# database every ROUND_LEADERBOARD_REBUILD_SECONDS, which catches deletes and anything later still.
+ROUND_TAIL_LOOKBACK_IDS = int(os.getenv('ROUND_TAIL_LOOKBACK_IDS', '1000'))
+ROUND_LEADERBOARD_REBUILD_SECONDS = float(os.getenv('ROUND_LEADERBOARD_REBUILD_SECONDS', '60'))
+
+# Bearer-token session cache (hackathon/cache.py). Revocations made through this process are
+# applied immediately; other processes see them within SESSION_CACHE_TTL_SECONDS.
+SESSION_CACHE_SIZE = int(os.getenv('SESSION_CACHE_SIZE', '10000'))
+SESSION_CACHE_TTL_SECONDS = float(os.getenv('SESSION_CACHE_TTL_SECONDS', '60'))
+SESSION_NEGATIVE_CACHE_TTL_SECONDS = float(os.getenv('SESSION_NEGATIVE_CACHE_TTL_SECONDS', '5'))
+
+# Password checks (hackathon/auth.py) run on a bounded thread pool; once PASSWORD_HASH_WORKERS +
+# PASSWORD_HASH_MAX_QUEUED checks are in flight, check_password raises PasswordHasherBusy.
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', '2'))
+PASSWORD_HASH_MAX_QUEUED = int(os.getenv('PASSWORD_HASH_MAX_QUEUED', '16'))
+
+# OTP gateway client (hackathon/otp_gateway.py): per-call connect/read timeout, keep-alive pool
+# size, and the circuit breaker that fails fast after consecutive gateway errors.
+OTP_GATEWAY_TIMEOUT_SECONDS = float(os.getenv('OTP_GATEWAY_TIMEOUT_SECONDS', '5'))
+OTP_GATEWAY_POOL_SIZE = int(os.getenv('OTP_GATEWAY_POOL_SIZE', '10'))
+OTP_GATEWAY_BREAKER_FAILURES = int(os.getenv('OTP_GATEWAY_BREAKER_FAILURES', '5'))
+OTP_GATEWAY_BREAKER_RESET_SECONDS = float(os.getenv('OTP_GATEWAY_BREAKER_RESET_SECONDS', '30'))
+
+# Ended rounds are served from immutable snapshots (hackathon/snapshots.py): how many stay
+# decoded in each process, and the max-age sent with ended-round responses.
+ROUND_SNAPSHOT_CACHE_SIZE = int(os.getenv('ROUND_SNAPSHOT_CACHE_SIZE', '256'))
+ROUND_SNAPSHOT_CACHE_TTL_SECONDS = float(os.getenv('ROUND_SNAPSHOT_CACHE_TTL_SECONDS', '3600'))
+ROUND_SNAPSHOT_MAX_AGE_SECONDS = int(os.getenv('ROUND_SNAPSHOT_MAX_AGE_SECONDS', '31536000'))
+
+# share_token -> round lookups for the respond endpoints are cached per process. Saving a
+# GameRound (e.g. ending it) drops its entry here; other processes see the change within
+# ROUND_TOKEN_CACHE_TTL_SECONDS. Unknown tokens are remembered for the negative TTL.
+ROUND_TOKEN_CACHE_SIZE = int(os.getenv('ROUND_TOKEN_CACHE_SIZE', '4096'))
+ROUND_TOKEN_CACHE_TTL_SECONDS = float(os.getenv('ROUND_TOKEN_CACHE_TTL_SECONDS', '10'))
+ROUND_TOKEN_NEGATIVE_CACHE_TTL_SECONDS = float(os.getenv('ROUND_TOKEN_NEGATIVE_CACHE_TTL_SECONDS', '2'))
+
+# /api/round/<id>/dashboard and the round SSE stream share one details+cloud+leaderboard
+# snapshot per round, rebuilt at most once per interval in each process.
+ROUND_DASHBOARD_INTERVAL_SECONDS = float(os.getenv('ROUND_DASHBOARD_INTERVAL_SECONDS', '1'))
+ROUND_DASHBOARD_CACHE_SIZE = int(os.getenv('ROUND_DASHBOARD_CACHE_SIZE', '256'))
+
+# /api/user-score?since=<score>&wait=<seconds> long-polls under ASGI (capped at the max wait).
+# Waiters are woken in-process by new answers/shares and re-read the score every recheck
+# interval to catch writes handled by other workers.
+USER_SCORE_MAX_WAIT_SECONDS = float(os.getenv('USER_SCORE_MAX_WAIT_SECONDS', '30'))
+USER_SCORE_RECHECK_SECONDS = float(os.getenv('USER_SCORE_RECHECK_SECONDS', '5'))
@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 
 application = get_wsgi_application()
+
+# Imported after Django is set up; builds the live rounds' leaderboards before the first request.
+from hackathon.leaderboard import warm_round_leaderboards  # noqa: E402
+
+warm_round_leaderboards()
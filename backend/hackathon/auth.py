@@ -1,45 +1,78 @@
-import base64
 import hashlib
-import hmac
-import json
 import os
 import secrets
-import urllib.error
-import urllib.parse
-import urllib.request
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import timedelta
 
+from django.conf import settings
 from django.utils import timezone
 
+from .otp_gateway import CircuitBreaker, CircuitOpenError, GatewayClient, GatewayError
+from .passwords import PBKDF2_ITERATIONS, hash_password, verify_password
+
 
 SESSION_COOKIE_NAME = 'app_session'
-PBKDF2_ITERATIONS = 260000
 SESSION_TTL = timedelta(days=7)
 
 
-def _b64encode(raw: bytes) -> str:
-    return base64.b64encode(raw).decode('ascii')
+class PasswordHasherBusy(RuntimeError):
+    pass
+
+
+class PasswordHasher:
+    """Runs PBKDF2 work on a small thread pool with a bounded queue.
+
+    ``hashlib.pbkdf2_hmac`` releases the GIL, so hashing here does not stall the
+    request threads or the event loop. At most ``workers + max_queued`` jobs
+    may be in flight; beyond that, submissions raise ``PasswordHasherBusy``
+    straight away instead of queueing behind a burst of logins.
+    """
+
+    def __init__(self, *, workers: int, max_queued: int):
+        self.workers = max(1, workers)
+        self._slots = threading.BoundedSemaphore(self.workers + max(0, max_queued))
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusy('Too many password checks in progress')
+        try:
+            future = self._executor().submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def run(self, fn, *args, **kwargs):
+        return self.submit(fn, *args, **kwargs).result()
 
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='password-hasher')
+        return self._pool
 
-def _b64decode(val: str) -> bytes:
-    return base64.b64decode(val.encode('ascii'))
 
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queued=settings.PASSWORD_HASH_MAX_QUEUED,
+)
 
-def hash_password(password: str, *, salt_b64: str | None = None, iterations: int = PBKDF2_ITERATIONS) -> tuple[str, str, int]:
-    if salt_b64 is None:
-        salt = secrets.token_bytes(16)
-        salt_b64 = _b64encode(salt)
-    else:
-        salt = _b64decode(salt_b64)
 
-    dk = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations)
-    return salt_b64, _b64encode(dk), iterations
+def check_password(password: str, *, salt_b64: str, password_hash_b64: str, iterations: int) -> bool:
+    """verify_password on the bounded hasher pool; raises PasswordHasherBusy when it is full."""
+    return password_hasher.run(
+        verify_password, password, salt_b64=salt_b64, password_hash_b64=password_hash_b64, iterations=iterations
+    )
 
 
-def verify_password(password: str, *, salt_b64: str, password_hash_b64: str, iterations: int) -> bool:
-    _, computed_hash_b64, _ = hash_password(password, salt_b64=salt_b64, iterations=iterations)
-    return hmac.compare_digest(computed_hash_b64, password_hash_b64)
+def password_needs_rehash(iterations: int) -> bool:
+    return iterations != PBKDF2_ITERATIONS
 
 
 def create_session_token() -> str:
@@ -81,111 +114,142 @@ class OtpDispatchError(RuntimeError):
     pass
 
 
-def dispatch_otp(*, channel: str, identifier: str, otp: str | None = None, display_name: str | None = None) -> None:
-    # For development/testing, skip external OTP gateway
-    debug_mode = os.getenv('DEBUG', '').lower() in ('true', '1', 'yes')
-    print(f'[DEBUG] DEBUG mode: {debug_mode}')
-    if debug_mode:
-        print(f'[DEBUG] Mock OTP dispatch: channel={channel}, identifier={identifier}')
-        return
-    
+class OtpVerifyError(RuntimeError):
+    pass
+
+
+class OtpGatewayUnavailable(OtpDispatchError, OtpVerifyError):
+    pass
+
+
+_gateway_lock = threading.Lock()
+_gateway: GatewayClient | None = None
+
+
+def otp_gateway_client() -> GatewayClient:
+    """Shared pooled client for OTP_GATEWAY_URL; rebuilt if the URL or auth header changes."""
+    global _gateway
+
     url = (os.getenv('OTP_GATEWAY_URL') or '').strip()
     auth_header = (os.getenv('OTP_GATEWAY_AUTH_HEADER') or '').strip()
-
     if not url:
-        raise OtpDispatchError('Missing OTP_GATEWAY_URL environment variable')
+        raise GatewayError('Missing OTP_GATEWAY_URL environment variable')
+
+    with _gateway_lock:
+        client = _gateway
+        if client is None or (client.url, client.auth_header) != (url, auth_header):
+            if client is not None:
+                client.close()
+            client = _gateway = GatewayClient(
+                url,
+                auth_header=auth_header,
+                timeout=settings.OTP_GATEWAY_TIMEOUT_SECONDS,
+                pool_size=settings.OTP_GATEWAY_POOL_SIZE,
+                breaker=CircuitBreaker(
+                    failure_threshold=settings.OTP_GATEWAY_BREAKER_FAILURES,
+                    reset_timeout=settings.OTP_GATEWAY_BREAKER_RESET_SECONDS,
+                ),
+            )
+        return client
+
+
+def _debug_mode() -> bool:
+    return os.getenv('DEBUG', '').lower() in ('true', '1', 'yes')
+
+
+def _dispatch_payload(channel: str, identifier: str) -> dict:
     if channel not in {'whatsapp', 'email'}:
         raise OtpDispatchError('Invalid OTP channel')
     if not identifier:
         raise OtpDispatchError('Missing OTP identifier')
-
-    payload = {
+    return {
         'GenerateOTP': 'yes',
         'type': channel,
         'email_mobile': identifier,
     }
 
-    headers = {
-        'Content-Type': 'application/x-www-form-urlencoded',
-        'Accept': 'application/json',
-    }
-    if auth_header:
-        headers['Authorization'] = auth_header
-
-    raw = urllib.parse.urlencode(payload).encode('utf-8')
-    req = urllib.request.Request(url, data=raw, method='POST', headers=headers)
-
-    try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            status = getattr(resp, 'status', None) or resp.getcode()
-            if status < 200 or status >= 300:
-                raise OtpDispatchError(f'OTP gateway returned HTTP {status}')
 
-            body = resp.read().decode('utf-8')
-            try:
-                payload = json.loads(body)
-            except json.JSONDecodeError as exc:
-                raise OtpDispatchError('OTP gateway returned invalid JSON') from exc
+def _check_dispatch_response(payload: dict) -> None:
+    if (payload.get('status') or '').strip().lower() != 'success':
+        raise OtpDispatchError('OTP gateway did not return success')
 
-            if (payload.get('status') or '').strip().lower() != 'success':
-                raise OtpDispatchError('OTP gateway did not return success')
-    except urllib.error.HTTPError as exc:
-        raise OtpDispatchError(f'OTP gateway returned HTTP {exc.code}') from exc
-    except urllib.error.URLError as exc:
-        raise OtpDispatchError('Unable to reach OTP gateway') from exc
 
+def dispatch_otp(*, channel: str, identifier: str, otp: str | None = None, display_name: str | None = None) -> None:
+    # For development/testing, skip external OTP gateway
+    debug_mode = _debug_mode()
+    print(f'[DEBUG] DEBUG mode: {debug_mode}')
+    if debug_mode:
+        print(f'[DEBUG] Mock OTP dispatch: channel={channel}, identifier={identifier}')
+        return
 
-class OtpVerifyError(RuntimeError):
-    pass
+    try:
+        client = otp_gateway_client()
+        payload = _dispatch_payload(channel, identifier)
+        response = client.post(payload)
+    except CircuitOpenError as exc:
+        raise OtpGatewayUnavailable(str(exc)) from exc
+    except GatewayError as exc:
+        raise OtpDispatchError(str(exc)) from exc
+    _check_dispatch_response(response)
+
+
+async def dispatch_otp_async(*, channel: str, identifier: str, display_name: str | None = None) -> None:
+    if _debug_mode():
+        print(f'[DEBUG] Mock OTP dispatch: channel={channel}, identifier={identifier}')
+        return
 
+    try:
+        client = otp_gateway_client()
+        payload = _dispatch_payload(channel, identifier)
+        response = await client.post_async(payload)
+    except CircuitOpenError as exc:
+        raise OtpGatewayUnavailable(str(exc)) from exc
+    except GatewayError as exc:
+        raise OtpDispatchError(str(exc)) from exc
+    _check_dispatch_response(response)
 
-def verify_otp_via_gateway(*, identifier: str, otp: str) -> bool:
-    # For development/testing, accept any 6-digit OTP
-    if os.getenv('DEBUG', '').lower() in ('true', '1', 'yes'):
-        print(f'[DEBUG] Mock OTP verification: identifier={identifier}, otp={otp}')
-        return len(otp) == 6 and otp.isdigit()
-    
-    url = (os.getenv('OTP_GATEWAY_URL') or '').strip()
-    auth_header = (os.getenv('OTP_GATEWAY_AUTH_HEADER') or '').strip()
 
-    if not url:
-        raise OtpVerifyError('Missing OTP_GATEWAY_URL environment variable')
+def _verify_payload(identifier: str, otp: str) -> dict:
     if not identifier:
         raise OtpVerifyError('Missing OTP identifier')
     if not otp:
         raise OtpVerifyError('Missing OTP value')
-
-    payload = {
+    return {
         'login_verfication': 'yes',
         'email_mobile': identifier,
         'otp': otp,
         'password': '',
     }
 
-    headers = {
-        'Content-Type': 'application/x-www-form-urlencoded',
-        'Accept': 'application/json',
-    }
-    if auth_header:
-        headers['Authorization'] = auth_header
 
-    raw = urllib.parse.urlencode(payload).encode('utf-8')
-    req = urllib.request.Request(url, data=raw, method='POST', headers=headers)
+def verify_otp_via_gateway(*, identifier: str, otp: str) -> bool:
+    # For development/testing, accept any 6-digit OTP
+    if _debug_mode():
+        print(f'[DEBUG] Mock OTP verification: identifier={identifier}, otp={otp}')
+        return len(otp) == 6 and otp.isdigit()
+
+    try:
+        client = otp_gateway_client()
+        payload = _verify_payload(identifier, otp)
+        response = client.post(payload)
+    except CircuitOpenError as exc:
+        raise OtpGatewayUnavailable(str(exc)) from exc
+    except GatewayError as exc:
+        raise OtpVerifyError(str(exc)) from exc
+    return (response.get('status') or '').strip().lower() == 'success'
+
+
+async def verify_otp_via_gateway_async(*, identifier: str, otp: str) -> bool:
+    if _debug_mode():
+        print(f'[DEBUG] Mock OTP verification: identifier={identifier}, otp={otp}')
+        return len(otp) == 6 and otp.isdigit()
 
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            status = getattr(resp, 'status', None) or resp.getcode()
-            if status < 200 or status >= 300:
-                raise OtpVerifyError(f'OTP gateway returned HTTP {status}')
-
-            body = resp.read().decode('utf-8')
-            try:
-                payload = json.loads(body)
-            except json.JSONDecodeError as exc:
-                raise OtpVerifyError('OTP gateway returned invalid JSON') from exc
-
-            return (payload.get('status') or '').strip().lower() == 'success'
-    except urllib.error.HTTPError as exc:
-        raise OtpVerifyError(f'OTP gateway returned HTTP {exc.code}') from exc
-    except urllib.error.URLError as exc:
-        raise OtpVerifyError('Unable to reach OTP gateway') from exc
+        client = otp_gateway_client()
+        payload = _verify_payload(identifier, otp)
+        response = await client.post_async(payload)
+    except CircuitOpenError as exc:
+        raise OtpGatewayUnavailable(str(exc)) from exc
+    except GatewayError as exc:
+        raise OtpVerifyError(str(exc)) from exc
+    return (response.get('status') or '').strip().lower() == 'success'
@@ -0,0 +1,72 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe, size-bounded LRU cache whose entries also expire.
+
+    ``get`` returns ``MISSING`` on a miss so that ``None`` can be cached as a
+    negative result.
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float):
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            expires, value = entry
+            if expires <= now:
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# token_hash -> AuthSession (with user and member loaded), or None for unknown tokens.
+session_cache = TTLCache(maxsize=settings.SESSION_CACHE_SIZE, ttl=settings.SESSION_CACHE_TTL_SECONDS)
+
+# GameRound id -> FrozenRound; snapshots never change, so entries only age out to bound memory.
+round_snapshot_cache = TTLCache(
+    maxsize=settings.ROUND_SNAPSHOT_CACHE_SIZE,
+    ttl=settings.ROUND_SNAPSHOT_CACHE_TTL_SECONDS,
+)
+
+# GameRound share_token -> rounds.RoundRef (id, status, question text), or None for unknown tokens.
+round_token_cache = TTLCache(maxsize=settings.ROUND_TOKEN_CACHE_SIZE, ttl=settings.ROUND_TOKEN_CACHE_TTL_SECONDS)
+
+# "<cloud>-<version>.<format>" -> rendered image bytes; a key's image never changes.
+render_cache = TTLCache(maxsize=settings.WORDCLOUD_RENDER_CACHE_SIZE, ttl=settings.WORDCLOUD_RENDER_CACHE_TTL_SECONDS)
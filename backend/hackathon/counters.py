@@ -0,0 +1,290 @@
+import atexit
+import logging
+import random
+import threading
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models import F, Q, Sum
+
+from .models import (
+    CounterShard,
+    CounterVersion,
+    RoundAugmentWeight,
+    SampleWordTotal,
+    UserScore,
+    Word,
+    WordFrequencyByRound,
+)
+
+
+logger = logging.getLogger(__name__)
+
+UPSERT_BATCH_SIZE = 500
+
+
+class CounterBacklogFull(RuntimeError):
+    pass
+
+
+def normalize_cloud_word(word: str) -> str | None:
+    word = (word or '').upper()
+    if not word or ' ' in word or not word.isalnum():
+        return None
+    return word
+
+
+@dataclass(frozen=True)
+class CounterTable:
+    name: str
+    model: type
+    key_field: str
+    count_field: str
+
+
+WORD_COUNTER = CounterTable('word', Word, 'text', 'frequency')
+SAMPLE_WORD_COUNTER = CounterTable('samplecloud', SampleWordTotal, 'word', 'total')
+
+
+def _upsert_add(model, key_columns: list[str], count_column: str, rows: list[tuple]) -> None:
+    db = router.db_for_write(model) or 'default'
+    connection = connections[db]
+    qn = connection.ops.quote_name
+    table = qn(model._meta.db_table)
+    columns = ', '.join(qn(c) for c in [*key_columns, count_column])
+    count = qn(count_column)
+
+    # Sorted so concurrent flushes from other workers take row locks in the same order.
+    rows = sorted(rows)
+
+    with transaction.atomic(using=db), connection.cursor() as cursor:
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            chunk = rows[start : start + UPSERT_BATCH_SIZE]
+            placeholder = '(' + ', '.join(['%s'] * (len(key_columns) + 1)) + ')'
+            values = ', '.join([placeholder] * len(chunk))
+            if connection.vendor == 'mysql':
+                sql = (
+                    f'INSERT INTO {table} ({columns}) VALUES {values} '
+                    f'ON DUPLICATE KEY UPDATE {count} = {count} + VALUES({count})'
+                )
+            else:
+                conflict = ', '.join(qn(c) for c in key_columns)
+                sql = (
+                    f'INSERT INTO {table} ({columns}) VALUES {values} '
+                    f'ON CONFLICT ({conflict}) DO UPDATE SET {count} = {table}.{count} + excluded.{count}'
+                )
+            cursor.execute(sql, [value for row in chunk for value in row])
+
+
+def increment_counter(table: CounterTable, increments: dict[str, int], *, shards: int = 1) -> None:
+    if not increments:
+        return
+
+    # Each key lands on one random shard per call; shard 0 is the row in the counter's own table.
+    base_rows = []
+    shard_rows = []
+    decrements = []
+    for key, n in increments.items():
+        if n < 0:
+            decrements.append((key, n))
+            continue
+        shard = random.randrange(shards) if shards > 1 else 0
+        if shard == 0:
+            base_rows.append((key, n))
+        else:
+            shard_rows.append((table.name, key, shard, n))
+
+    db = router.db_for_write(table.model) or 'default'
+    with transaction.atomic(using=db):
+        if base_rows:
+            _upsert_add(table.model, [table.key_field], table.count_field, base_rows)
+        if shard_rows:
+            _upsert_add(CounterShard, ['counter', 'word', 'shard'], 'count', shard_rows)
+        for key, n in sorted(decrements):
+            _decrement_counter(table, key, n)
+    # Outside the increment transaction, so writers do not hold the version row lock while they
+    # work, and readers never see a version before the counts behind it.
+    transaction.on_commit(lambda: bump_counter_version(table.name, shards=shards), using=db)
+
+
+def _decrement_counter(table: CounterTable, key: str, n: int) -> None:
+    # Only rows the key already has are adjusted; an upsert would insert a negative count
+    # for a key that was never counted. Totals are summed over shards, so any one will do.
+    count = F(table.count_field) + n
+    if table.model.objects.filter(**{table.key_field: key}).update(**{table.count_field: count}):
+        return
+    shard_id = CounterShard.objects.filter(counter=table.name, word=key).values_list('id', flat=True).first()
+    if shard_id is not None:
+        CounterShard.objects.filter(id=shard_id).update(count=F('count') + n)
+
+
+def _version_row(name: str, shard: int) -> str:
+    return name if shard == 0 else f'{name}:{shard}'
+
+
+def bump_counter_version(name: str, *, shards: int = 1) -> None:
+    # Spread over one version row per shard, like the counts; counter_version() sums them.
+    shard = random.randrange(shards) if shards > 1 else 0
+    _upsert_add(CounterVersion, ['name'], 'version', [(_version_row(name, shard), 1)])
+
+
+def counter_version(name: str) -> int:
+    # Every bump adds one to one row, so the sum grows with each committed flush.
+    rows = CounterVersion.objects.filter(Q(name=name) | Q(name__startswith=f'{name}:'))
+    return rows.aggregate(total=Sum('version'))['total'] or 0
+
+
+def read_counter_totals(table: CounterTable) -> list[tuple[str, int]]:
+    totals: dict[str, int] = dict(table.model.objects.values_list(table.key_field, table.count_field))
+
+    shard_totals = (
+        CounterShard.objects.filter(counter=table.name)
+        .values('word')
+        .annotate(total=Sum('count'))
+        .values_list('word', 'total')
+    )
+    for key, total in shard_totals:
+        totals[key] = totals.get(key, 0) + (total or 0)
+
+    return sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+
+
+def increment_user_score(user_id: str, field: str, n: int = 1) -> None:
+    # field is 'answer_count' or 'share_count'; one upsert on the UserScore primary key.
+    if n > 0:
+        _upsert_add(UserScore, ['user_id'], field, [(str(user_id), n)])
+    elif n < 0:
+        # Like increment_round_words: a decrement never creates a row with a negative count
+        UserScore.objects.filter(user_id=str(user_id)).update(**{field: F(field) + n})
+
+
+def increment_augment_weights(round_id: int, increments: dict[str, int]) -> None:
+    rows = [(round_id, word, n) for word, n in increments.items() if n]
+    if rows:
+        _upsert_add(RoundAugmentWeight, ['round_id', 'word'], 'weight', rows)
+
+
+def increment_round_words(round_id: int, increments: dict[str, int]) -> None:
+    # Words are normalized here, once, so the round cloud reads rows as stored.
+    totals: dict[str, int] = {}
+    for word, n in increments.items():
+        word = normalize_cloud_word(word)
+        if word is not None and n:
+            totals[word] = totals.get(word, 0) + n
+    rows = [(round_id, word, n) for word, n in totals.items() if n > 0]
+    if rows:
+        _upsert_add(WordFrequencyByRound, ['round_id', 'word'], 'frequency', rows)
+
+    # Decrements only touch existing rows: an upsert would re-insert rows for a round that is
+    # being deleted (its Responses cascade first) and fail the foreign key.
+    for word, n in sorted(totals.items()):
+        if n < 0:
+            WordFrequencyByRound.objects.filter(round_id=round_id, word=word).update(frequency=F('frequency') + n)
+
+
+def upsert_word_increments(increments: dict[str, int]) -> None:
+    increment_counter(WORD_COUNTER, increments, shards=settings.WORD_COUNTER_SHARDS)
+
+
+class WriteBehindCounter:
+    """Buffers counter increments in memory and flushes them in batched upserts.
+
+    A flush happens when ``max_pending`` increments are buffered or every
+    ``flush_interval`` seconds, whichever comes first, so a crash loses at most
+    that much per process. If the database is unreachable the buffer keeps
+    growing up to ``max_backlog`` increments, after which ``add`` raises
+    ``CounterBacklogFull`` instead of accepting more.
+    """
+
+    def __init__(self, flush_fn, *, max_pending: int, flush_interval: float, max_backlog: int):
+        self.flush_fn = flush_fn
+        self.max_pending = max(1, max_pending)
+        self.flush_interval = flush_interval
+        self.max_backlog = max(self.max_pending, max_backlog)
+
+        self._pending: dict[str, int] = {}
+        self._pending_total = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._worker: threading.Thread | None = None
+
+    @property
+    def pending_total(self) -> int:
+        return self._pending_total
+
+    def add(self, key: str, n: int = 1) -> None:
+        with self._lock:
+            if self._pending_total + n > self.max_backlog:
+                raise CounterBacklogFull('Too many unflushed counter increments')
+            self._pending[key] = self._pending.get(key, 0) + n
+            self._pending_total += n
+            should_flush = self._pending_total >= self.max_pending
+
+        self._ensure_worker()
+
+        if should_flush:
+            try:
+                self.flush()
+            except Exception:
+                # The increment stays buffered; the background flush will retry it.
+                logger.exception('Counter flush failed; keeping %s increments buffered', self._pending_total)
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                flushed = self._pending_total
+                self._pending_total = 0
+
+            if not batch:
+                return 0
+
+            try:
+                self.flush_fn(batch)
+            except Exception:
+                with self._lock:
+                    for key, n in batch.items():
+                        self._pending[key] = self._pending.get(key, 0) + n
+                    self._pending_total += flushed
+                raise
+
+            return flushed
+
+    def close(self) -> None:
+        self._stopped.set()
+        worker = self._worker
+        if worker is not None and worker is not threading.current_thread():
+            worker.join(timeout=self.flush_interval + 5)
+        try:
+            self.flush()
+        except Exception:
+            logger.exception('Final counter flush failed; %s increments lost', self._pending_total)
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None or self.flush_interval <= 0:
+            return
+        with self._lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(target=self._run, name='write-behind-counter', daemon=True)
+            self._worker.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('Background counter flush failed; will retry')
+            finally:
+                connections.close_all()
+
+
+word_frequencies = WriteBehindCounter(
+    upsert_word_increments,
+    max_pending=settings.WORD_FLUSH_MAX_PENDING,
+    flush_interval=settings.WORD_FLUSH_INTERVAL_SECONDS,
+    max_backlog=settings.WORD_FLUSH_MAX_BACKLOG,
+)
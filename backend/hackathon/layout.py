@@ -0,0 +1,216 @@
+import json
+import math
+import threading
+import zlib
+from dataclasses import asdict, dataclass, replace
+
+import numpy as np
+from django.conf import settings
+
+from .snapshots import VersionedCloud, sample_word_cloud, word_cloud
+
+
+PALETTE = (
+    '#FF1493', '#8B008B', '#DC143C', '#FF4500', '#800080', '#4B0082', '#1E90FF', '#0000CD',
+    '#4169E1', '#008000', '#32CD32', '#00CED1', '#008B8B', '#2F4F4F', '#FF8C00', '#C71585',
+)
+
+# Font sizes are snapped to this many px so small frequency bumps rarely change a word's box
+SIZE_STEP = 4
+# Approximate advance of one uppercase glyph, as a fraction of the font size
+GLYPH_WIDTH = 0.62
+PADDING = 2
+# Spiral candidates tested against the placed boxes per NumPy batch
+CANDIDATE_BATCH = 1024
+
+
+@dataclass(frozen=True)
+class Placement:
+    text: str
+    frequency: int
+    # Centre of the word in canvas pixels
+    x: int
+    y: int
+    size: int
+    rotation: int
+    color: str
+
+
+@dataclass(frozen=True)
+class CloudLayout:
+    version: int
+    placements: tuple[Placement, ...]
+    body: bytes
+
+
+def _box_size(text: str, size: int, rotation: int) -> tuple[float, float]:
+    width = len(text) * size * GLYPH_WIDTH + 2 * PADDING
+    height = size + 2 * PADDING
+    return (height, width) if rotation else (width, height)
+
+
+def _box(placement: Placement) -> tuple[float, float, float, float]:
+    w, h = _box_size(placement.text, placement.size, placement.rotation)
+    return placement.x - w / 2, placement.y - h / 2, placement.x + w / 2, placement.y + h / 2
+
+
+def _overlaps(box: np.ndarray, boxes: np.ndarray) -> bool:
+    return bool(
+        ((box[0] < boxes[:, 2]) & (box[2] > boxes[:, 0]) & (box[1] < boxes[:, 3]) & (box[3] > boxes[:, 1])).any()
+    )
+
+
+class SpiralLayout:
+    """Places words along an Archimedean spiral, biggest first.
+
+    Every candidate position on the spiral is checked against all placed
+    bounding boxes at once with NumPy, in batches of ``CANDIDATE_BATCH``.
+
+    Relayout is incremental: a word whose box is unchanged since the previous
+    layout keeps its spot unless a bigger word now covers it, so a frequency
+    bump only moves the bumped word and the neighbours it grows into. Words
+    that move search outward from where they were, then from the centre.
+    A word that does not fit anywhere is left out.
+    """
+
+    def __init__(self, *, width: int, height: int, max_words: int, min_size: int, max_size: int):
+        self.width = width
+        self.height = height
+        self.max_words = max(1, max_words)
+        self.min_size = min_size
+        self.max_size = max(min_size, max_size)
+
+        # Points roughly 3px apart along r = a * t, stretched to the canvas aspect ratio,
+        # reaching far enough to cover the canvas from its centre.
+        a, spacing = 1.5, 3.0
+        t_max = height / 2 * math.hypot(1, height / width) / a
+        t = np.sqrt(2 * spacing * np.arange(int(a * t_max * t_max / (2 * spacing)) + 1) / a)
+        aspect = width / height
+        self._dx = a * t * np.cos(t) * aspect
+        self._dy = a * t * np.sin(t)
+
+    def font_size(self, frequency: int, max_frequency: int) -> int:
+        scaled = (self.max_size - self.min_size) * math.sqrt(frequency / max(1, max_frequency))
+        return self.min_size + int(scaled // SIZE_STEP) * SIZE_STEP
+
+    def layout(self, words, previous: dict[str, Placement] | None = None) -> list[Placement]:
+        words = sorted(((t, f) for t, f in words if f > 0), key=lambda item: (-item[1], item[0]))[: self.max_words]
+        if not words:
+            return []
+        previous = previous or {}
+        max_frequency = words[0][1]
+
+        placed: list[Placement] = []
+        boxes = np.empty((0, 4))
+        # Boxes that found no room; anything at least as wide and tall cannot fit either
+        misses: list[tuple[float, float]] = []
+        for text, frequency in words:
+            checksum = zlib.crc32(text.encode('utf-8'))
+            placement = Placement(
+                text=text,
+                frequency=frequency,
+                x=self.width // 2,
+                y=self.height // 2,
+                size=self.font_size(frequency, max_frequency),
+                rotation=90 if checksum % 5 == 0 else 0,
+                color=PALETTE[checksum % len(PALETTE)],
+            )
+
+            old = previous.get(text)
+            if old is not None:
+                placement = replace(placement, x=old.x, y=old.y)
+                box = np.array(_box(placement))
+                unchanged = old.size == placement.size and old.rotation == placement.rotation
+                if unchanged and not _overlaps(box, boxes):
+                    placed.append(placement)
+                    boxes = np.vstack([boxes, box])
+                    continue
+
+            w, h = _box_size(text, placement.size, placement.rotation)
+            if any(w >= mw and h >= mh for mw, mh in misses):
+                continue
+            spot = self._find_spot(w, h, placement.x, placement.y, boxes)
+            if spot is None and old is not None:
+                spot = self._find_spot(w, h, self.width // 2, self.height // 2, boxes)
+            if spot is None:
+                misses.append((w, h))
+                continue
+
+            placement = replace(placement, x=spot[0], y=spot[1])
+            placed.append(placement)
+            boxes = np.vstack([boxes, _box(placement)])
+
+        return placed
+
+    def _find_spot(self, w: float, h: float, x: int, y: int, boxes: np.ndarray) -> tuple[int, int] | None:
+        cx = np.rint(x + self._dx)
+        cy = np.rint(y + self._dy)
+        x0, y0, x1, y1 = cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2
+        inside = (x0 >= 0) & (y0 >= 0) & (x1 <= self.width) & (y1 <= self.height)
+
+        for start in range(0, len(cx), CANDIDATE_BATCH):
+            candidates = start + np.flatnonzero(inside[start:start + CANDIDATE_BATCH])
+            if candidates.size and boxes.size:
+                hits = (
+                    (x0[candidates, None] < boxes[:, 2])
+                    & (x1[candidates, None] > boxes[:, 0])
+                    & (y0[candidates, None] < boxes[:, 3])
+                    & (y1[candidates, None] > boxes[:, 1])
+                ).any(axis=1)
+                candidates = candidates[~hits]
+            if candidates.size:
+                k = candidates[0]
+                return int(cx[k]), int(cy[k])
+        return None
+
+
+class CloudLayouts:
+    """Lays out a ``VersionedCloud`` once per version and serves the same body to
+    every viewer; each new version is laid out incrementally from the last one.
+    """
+
+    def __init__(self, cloud: VersionedCloud, engine: SpiralLayout):
+        self.cloud = cloud
+        self.engine = engine
+        self._lock = threading.Lock()
+        self._latest: CloudLayout | None = None
+
+    def etag(self, version: int) -> str:
+        return f'"{self.cloud.name}-layout-{version}"'
+
+    def get(self, version: int | None = None) -> CloudLayout:
+        snapshot = self.cloud.snapshot(version)
+
+        latest = self._latest
+        if latest is not None and latest.version >= snapshot.version:
+            return latest
+
+        with self._lock:
+            latest = self._latest
+            if latest is not None and latest.version >= snapshot.version:
+                return latest
+
+            previous = {p.text: p for p in latest.placements} if latest is not None else {}
+            placements = tuple(self.engine.layout(snapshot.words, previous))
+            body = json.dumps({
+                'version': snapshot.version,
+                'layout': True,
+                'width': self.engine.width,
+                'height': self.engine.height,
+                'words': [asdict(p) for p in placements],
+            }).encode('utf-8')
+            self._latest = CloudLayout(version=snapshot.version, placements=placements, body=body)
+            return self._latest
+
+
+# Stateless apart from the precomputed spiral, so every cloud shares it
+spiral_layout = SpiralLayout(
+    width=settings.WORDCLOUD_LAYOUT_WIDTH,
+    height=settings.WORDCLOUD_LAYOUT_HEIGHT,
+    max_words=settings.WORDCLOUD_LAYOUT_MAX_WORDS,
+    min_size=settings.WORDCLOUD_LAYOUT_MIN_FONT_SIZE,
+    max_size=settings.WORDCLOUD_LAYOUT_MAX_FONT_SIZE,
+)
+
+word_cloud_layout = CloudLayouts(word_cloud, spiral_layout)
+sample_word_cloud_layout = CloudLayouts(sample_word_cloud, spiral_layout)
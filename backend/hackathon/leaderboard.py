@@ -0,0 +1,279 @@
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db.models import Count
+
+from .models import GameRound, Response, ShareEvent
+from .tailing import RowTail
+
+
+logger = logging.getLogger(__name__)
+
+CATCH_UP_BATCH_SIZE = 5000
+_MAX_LEVELS = 32
+
+
+class _Node:
+    __slots__ = ('key', 'next', 'width')
+
+    def __init__(self, key, levels: int):
+        self.key = key
+        self.next: list[_Node | None] = [None] * levels
+        # width[level] = level-0 steps to next[level] (or to one past the end when there is none)
+        self.width: list[int] = [1] * levels
+
+
+class IndexableSkiplist:
+    """Sorted set of unique, comparable keys with O(log n) insert, remove,
+    rank-of-key and access-by-rank, based on a skiplist whose links record how
+    many items they span.
+    """
+
+    def __init__(self):
+        self._head = _Node(None, _MAX_LEVELS)
+        self._levels = 1
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, key) -> None:
+        chain, steps = self._path_to(key)
+        levels = 1
+        while levels < _MAX_LEVELS and random.random() < 0.5:
+            levels += 1
+        if levels > self._levels:
+            for level in range(self._levels, levels):
+                chain[level] = self._head
+                steps[level] = 0
+                self._head.width[level] = self._size + 1
+            self._levels = levels
+
+        node = _Node(key, levels)
+        for level in range(levels):
+            prev = chain[level]
+            node.next[level] = prev.next[level]
+            prev.next[level] = node
+            # ``before`` nodes lie between ``prev`` and the new node at this level.
+            before = steps[0] - steps[level]
+            node.width[level] = prev.width[level] - before
+            prev.width[level] = before + 1
+        for level in range(levels, self._levels):
+            chain[level].width[level] += 1
+        self._size += 1
+
+    def remove(self, key) -> None:
+        chain, _ = self._path_to(key)
+        node = chain[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+        for level in range(self._levels):
+            prev = chain[level]
+            if prev.next[level] is node:
+                prev.width[level] += node.width[level] - 1
+                prev.next[level] = node.next[level]
+            else:
+                prev.width[level] -= 1
+        self._size -= 1
+
+    def rank(self, key) -> int:
+        """0-based position of ``key``; raises KeyError if it is not present."""
+        chain, steps = self._path_to(key)
+        node = chain[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+        return steps[0]
+
+    def slice(self, start: int, stop: int) -> list:
+        start = max(0, start)
+        stop = min(self._size, stop)
+        if start >= stop:
+            return []
+
+        # Walk down to the node at ``start`` using the link widths, then step along level 0.
+        node = self._head
+        remaining = start + 1
+        for level in reversed(range(self._levels)):
+            while node.next[level] is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+        keys = []
+        while node is not None and len(keys) < stop - start:
+            keys.append(node.key)
+            node = node.next[0]
+        return keys
+
+    def _path_to(self, key):
+        # For each level, the last node before ``key`` and its 1-based position (the head is 0).
+        chain: list[_Node] = [self._head] * _MAX_LEVELS
+        steps = [0] * _MAX_LEVELS
+        node = self._head
+        position = 0
+        for level in reversed(range(self._levels)):
+            while node.next[level] is not None and node.next[level].key < key:
+                position += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+            steps[level] = position
+        return chain, steps
+
+
+class RankedLeaderboard:
+    """Player scores ordered by (score desc, player_id), with O(log n) updates,
+    top-N pages and rank lookups.
+    """
+
+    def __init__(self):
+        self._scores: dict[str, int] = {}
+        self._ranking = IndexableSkiplist()
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def add(self, player_id: str, delta: int) -> None:
+        score = self._scores.get(player_id)
+        if score is not None:
+            self._ranking.remove((-score, player_id))
+        else:
+            score = 0
+        score += delta
+        self._scores[player_id] = score
+        self._ranking.insert((-score, player_id))
+
+    def page(self, offset: int = 0, limit: int | None = None) -> list[dict]:
+        stop = len(self._scores) if limit is None else offset + limit
+        return [
+            {'rank': offset + i + 1, 'player_id': player_id, 'score': -negative}
+            for i, (negative, player_id) in enumerate(self._ranking.slice(offset, stop))
+        ]
+
+    def rank_of(self, player_id: str) -> dict | None:
+        score = self._scores.get(player_id)
+        if score is None:
+            return None
+        return {'rank': self._ranking.rank((-score, player_id)) + 1, 'player_id': player_id, 'score': score}
+
+
+def _scored_responses(round_id: int):
+    return Response.objects.filter(round_id=round_id, is_augmented=False)
+
+
+def _scored_shares(round_id: int):
+    return ShareEvent.objects.filter(round_id=round_id).exclude(player_id=None)
+
+
+def exact_leaderboard(round_id: int) -> list[dict]:
+    """The round's full ranking from a GROUP BY over its rows, for results that must be exact"""
+    scores: dict[str, int] = {}
+    for queryset in (_scored_responses(round_id), _scored_shares(round_id)):
+        for player_id, n in queryset.values('player_id').annotate(n=Count('id')).values_list('player_id', 'n'):
+            scores[player_id] = scores.get(player_id, 0) + n
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+    return [{'rank': i + 1, 'player_id': player_id, 'score': score} for i, (player_id, score) in enumerate(ranked)]
+
+
+class _RoundState:
+    def __init__(self, lookback: int):
+        self.lock = threading.Lock()
+        self.lookback = lookback
+        self.reset()
+
+    def reset(self) -> None:
+        self.board = RankedLeaderboard()
+        self.responses = RowTail(self.lookback)
+        self.shares = RowTail(self.lookback)
+        self.built_at = time.monotonic()
+
+
+class RoundLeaderboards:
+    """Keeps one ranked leaderboard per round, fed from new ``Response`` and
+    ``ShareEvent`` rows.
+
+    Boards for the newest active rounds are built from the database when the
+    process starts (see ``warm_round_leaderboards``); any other round's board
+    is built the first time it is read. Afterwards a board folds in the rows it
+    has not seen yet (see ``RowTail``). Every ``rebuild_interval`` seconds it is
+    rebuilt from scratch, which also drops deleted rows and any row that
+    committed too late for the tail. Boards are evicted least-recently-used
+    beyond ``max_rounds``.
+    """
+
+    def __init__(self, *, max_rounds: int, lookback: int, rebuild_interval: float):
+        self.max_rounds = max(1, max_rounds)
+        self.lookback = lookback
+        self.rebuild_interval = rebuild_interval
+        self._lock = threading.Lock()
+        self._rounds: OrderedDict[int, _RoundState] = OrderedDict()
+
+    def page(self, round_id: int, offset: int = 0, limit: int | None = None) -> tuple[list[dict], int]:
+        state = self._state(round_id)
+        with state.lock:
+            self._catch_up(round_id, state)
+            return state.board.page(offset, limit), len(state.board)
+
+    def rank_of(self, round_id: int, player_id: str) -> dict | None:
+        state = self._state(round_id)
+        with state.lock:
+            self._catch_up(round_id, state)
+            return state.board.rank_of(player_id)
+
+    def warm(self, round_ids) -> None:
+        """Build the boards of ``round_ids`` now rather than on their first read"""
+        for round_id in round_ids:
+            state = self._state(round_id)
+            with state.lock:
+                self._catch_up(round_id, state)
+
+    def _state(self, round_id: int) -> _RoundState:
+        with self._lock:
+            state = self._rounds.get(round_id)
+            if state is None:
+                state = self._rounds[round_id] = _RoundState(self.lookback)
+                while len(self._rounds) > self.max_rounds:
+                    self._rounds.popitem(last=False)
+            else:
+                self._rounds.move_to_end(round_id)
+            return state
+
+    def _catch_up(self, round_id: int, state: _RoundState) -> None:
+        if time.monotonic() - state.built_at >= self.rebuild_interval:
+            state.reset()
+        responses = state.responses.read(_scored_responses(round_id), 'player_id', batch_size=CATCH_UP_BATCH_SIZE)
+        self._fold(state.board, responses)
+        shares = state.shares.read(_scored_shares(round_id), 'player_id', batch_size=CATCH_UP_BATCH_SIZE)
+        self._fold(state.board, shares)
+
+    @staticmethod
+    def _fold(board: RankedLeaderboard, rows: list[tuple]) -> None:
+        # One skiplist update per player
+        deltas: dict[str, int] = {}
+        for _, player_id in rows:
+            deltas[player_id] = deltas.get(player_id, 0) + 1
+        for player_id, delta in deltas.items():
+            board.add(player_id, delta)
+
+
+round_leaderboards = RoundLeaderboards(
+    max_rounds=settings.ROUND_LEADERBOARD_MAX_ROUNDS,
+    lookback=settings.ROUND_TAIL_LOOKBACK_IDS,
+    rebuild_interval=settings.ROUND_LEADERBOARD_REBUILD_SECONDS,
+)
+
+
+def warm_round_leaderboards() -> None:
+    # Called once per server process (backend/wsgi.py, backend/asgi.py) so the first request for a
+    # live round does not pay for its full rebuild; failing here only leaves the boards lazy.
+    try:
+        round_ids = list(
+            GameRound.objects.filter(status='active')
+            .order_by('-id')
+            .values_list('id', flat=True)[: round_leaderboards.max_rounds]
+        )
+        # Oldest first, so the newest rounds are the last to be evicted
+        round_leaderboards.warm(reversed(round_ids))
+    except Exception:
+        logger.exception('Warming round leaderboards failed; they will be built on first read')
@@ -0,0 +1,90 @@
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from hackathon.counters import WORD_COUNTER, increment_counter, read_counter_totals
+from hackathon.models import CounterShard, Word
+
+
+_BENCH_WORD = '__bench_hot_word__'
+
+
+def _parse_shard_counts(raw: str) -> list[int]:
+    try:
+        counts = [int(part) for part in raw.split(',') if part.strip()]
+    except ValueError as exc:
+        raise CommandError(f'Invalid --shards value: {raw!r}') from exc
+    if not counts or any(c < 1 for c in counts):
+        raise CommandError('--shards must be a comma separated list of positive integers')
+    return counts
+
+
+def _cleanup() -> None:
+    Word.objects.filter(text=_BENCH_WORD).delete()
+    CounterShard.objects.filter(counter=WORD_COUNTER.name, word=_BENCH_WORD).delete()
+
+
+class Command(BaseCommand):
+    help = 'Measure increment throughput on a single hot word for different counter shard counts'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--shards', default='1,2,4,8,16', help='Shard counts to compare (default: 1,2,4,8,16)')
+        parser.add_argument('--threads', type=int, default=16, help='Concurrent writers (default: 16)')
+        parser.add_argument('--increments', type=int, default=200, help='Increments per writer (default: 200)')
+
+    def handle(self, *args, **options):
+        shard_counts = _parse_shard_counts(options['shards'])
+        threads = options['threads']
+        increments = options['increments']
+
+        if threads < 1 or increments < 1:
+            raise CommandError('--threads and --increments must be positive')
+
+        self.stdout.write(f'{threads} writers x {increments} synchronous increments on one word')
+
+        baseline = None
+        for shards in shard_counts:
+            _cleanup()
+            elapsed, errors = self._run(shards, threads, increments)
+
+            total = dict(read_counter_totals(WORD_COUNTER)).get(_BENCH_WORD, 0)
+            expected = threads * increments - errors
+            rate = (threads * increments - errors) / elapsed if elapsed else 0.0
+            baseline = baseline or rate
+            self.stdout.write(
+                f'shards={shards:<3} {rate:10.1f} inc/s  x{rate / baseline:5.2f}  '
+                f'elapsed={elapsed:.2f}s errors={errors} total={total}/{expected}'
+            )
+            if total != expected:
+                self.stdout.write(self.style.ERROR(f'Lost increments with shards={shards}'))
+
+        _cleanup()
+
+    def _run(self, shards: int, threads: int, increments: int) -> tuple[float, int]:
+        errors = 0
+        errors_lock = threading.Lock()
+        start_barrier = threading.Barrier(threads + 1)
+
+        def writer():
+            nonlocal errors
+            start_barrier.wait()
+            try:
+                for _ in range(increments):
+                    try:
+                        increment_counter(WORD_COUNTER, {_BENCH_WORD: 1}, shards=shards)
+                    except Exception:
+                        with errors_lock:
+                            errors += 1
+            finally:
+                connections.close_all()
+
+        workers = [threading.Thread(target=writer) for _ in range(threads)]
+        for w in workers:
+            w.start()
+        start_barrier.wait()
+        started = time.perf_counter()
+        for w in workers:
+            w.join()
+        return time.perf_counter() - started, errors
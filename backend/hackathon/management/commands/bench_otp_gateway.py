@@ -0,0 +1,106 @@
+import asyncio
+import statistics
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from hackathon.otp_gateway import CircuitBreaker, GatewayClient
+from hackathon.otp_stub import StubGateway
+
+
+_PAYLOAD = {'GenerateOTP': 'yes', 'type': 'email', 'email_mobile': 'bench@example.com'}
+
+
+def _urllib_post(url: str, timeout: float) -> None:
+    # The previous dispatch path: a fresh connection per call.
+    raw = urllib.parse.urlencode(_PAYLOAD).encode('utf-8')
+    req = urllib.request.Request(url, data=raw, method='POST', headers={'Accept': 'application/json'})
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        resp.read()
+
+
+def _timed(fn) -> float | None:
+    started = time.perf_counter()
+    try:
+        fn()
+    except Exception:
+        return None
+    return time.perf_counter() - started
+
+
+class Command(BaseCommand):
+    help = 'Compare OTP gateway latency for per-call urllib connections, the pooled client and its async variant'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='', help='Gateway to hit (default: start a local stub)')
+        parser.add_argument('--requests', type=int, default=200, help='Calls per mode (default: 200)')
+        parser.add_argument('--concurrency', type=int, default=8, help='Concurrent callers (default: 8)')
+        parser.add_argument('--latency-ms', type=float, default=5, help='Stub reply delay (default: 5)')
+        parser.add_argument('--timeout', type=float, default=5, help='Per-call timeout in seconds (default: 5)')
+
+    def handle(self, *args, **options):
+        stub = None
+        url = options['url']
+        if not url:
+            stub = StubGateway(latency=options['latency_ms'] / 1000).start()
+            url = stub.url
+            self.stdout.write(f'Started stub gateway on {url}')
+
+        n = options['requests']
+        concurrency = max(1, options['concurrency'])
+        timeout = options['timeout']
+        client = GatewayClient(
+            url,
+            timeout=timeout,
+            pool_size=concurrency,
+            breaker=CircuitBreaker(failure_threshold=n + 1, reset_timeout=1),
+        )
+
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                self._report('urllib, new connection per call', pool, n, lambda: _urllib_post(url, timeout))
+                self._report('pooled client', pool, n, lambda: client.post(_PAYLOAD))
+            self._report_async('pooled client, async', client, n, concurrency)
+        finally:
+            client.close()
+            if stub is not None:
+                stub.stop()
+
+    def _report(self, label: str, pool: ThreadPoolExecutor, n: int, call) -> None:
+        started = time.perf_counter()
+        latencies = list(pool.map(lambda _: _timed(call), range(n)))
+        self._print(label, latencies, time.perf_counter() - started)
+
+    def _report_async(self, label: str, client: GatewayClient, n: int, concurrency: int) -> None:
+        async def run():
+            gate = asyncio.Semaphore(concurrency)
+
+            async def one():
+                async with gate:
+                    started = time.perf_counter()
+                    try:
+                        await client.post_async(_PAYLOAD)
+                    except Exception:
+                        return None
+                    return time.perf_counter() - started
+
+            return await asyncio.gather(*(one() for _ in range(n)))
+
+        started = time.perf_counter()
+        latencies = asyncio.run(run())
+        self._print(label, latencies, time.perf_counter() - started)
+
+    def _print(self, label: str, latencies: list[float | None], elapsed: float) -> None:
+        ok = sorted(t for t in latencies if t is not None)
+        failed = len(latencies) - len(ok)
+        if not ok:
+            self.stdout.write(f'{label:<34} all {failed} calls failed')
+            return
+        p50 = statistics.median(ok) * 1000
+        p95 = ok[min(len(ok) - 1, int(len(ok) * 0.95))] * 1000
+        self.stdout.write(
+            f'{label:<34} {len(ok) / elapsed:8.1f} req/s  p50 {p50:6.1f} ms  p95 {p95:6.1f} ms  failed {failed}'
+        )
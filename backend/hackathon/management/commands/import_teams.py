@@ -1,14 +1,20 @@
 import csv
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
+from django.utils import timezone
 
-from hackathon.auth import PBKDF2_ITERATIONS, hash_password
+from hackathon.passwords import hash_team_password
 from hackathon.models import AppUser, AppUserMember
 
 
 _TEAM_NO_RE = re.compile(r'^\s*Team\s*(\d+)\s*$', flags=re.IGNORECASE)
+BULK_BATCH_SIZE = 500
+_EXPECTED_HEADER = {'Team No.', 'Member ID', 'Name', 'Email', 'Phone'}
 
 
 def _parse_team_no(raw: str) -> int:
@@ -18,8 +24,44 @@ def _parse_team_no(raw: str) -> int:
     return int(match.group(1))
 
 
-def _format_password(team_no: int) -> str:
-    return f'Team@{team_no:03d}'
+def _parse_row(row: dict) -> tuple[int, dict] | None:
+    """Validate one CSV row; returns None for blank rows and raises ValueError otherwise."""
+    if not (row.get('Team No.') or '').strip() and not (row.get('Phone') or '').strip():
+        return None
+
+    team_no_raw = (row.get('Team No.') or '').strip()
+    member_id = (row.get('Member ID') or '').strip()
+    name = (row.get('Name') or '').strip()
+    email = (row.get('Email') or '').strip() or None
+    phone_raw = row.get('Phone')
+
+    if not team_no_raw and not name and not email and not (phone_raw or '').strip():
+        return None
+
+    if not team_no_raw:
+        raise ValueError('missing Team No.')
+    if not member_id:
+        raise ValueError('missing Member ID')
+    if not name:
+        raise ValueError('missing Name')
+
+    team_no = _parse_team_no(team_no_raw)
+    phone = _normalize_phone(phone_raw)
+    return team_no, {'member_id': member_id, 'name': name, 'email': email, 'phone': phone}
+
+
+def _open_rows(csv_path: str):
+    """Yield (row number, row) pairs from the CSV without loading it into memory."""
+    try:
+        f = open(csv_path, newline='', encoding='utf-8')
+    except FileNotFoundError as exc:
+        raise CommandError(f'CSV file not found: {csv_path}') from exc
+
+    with f:
+        reader = csv.DictReader(f)
+        if set(reader.fieldnames or []) != _EXPECTED_HEADER:
+            raise CommandError(f'CSV header must be exactly {sorted(_EXPECTED_HEADER)}. Got: {reader.fieldnames}')
+        yield from enumerate(reader, start=2)
 
 
 def _normalize_phone(raw: str) -> str:
@@ -29,6 +71,211 @@ def _normalize_phone(raw: str) -> str:
     return phone
 
 
+def _batches(items: list, size: int = BULK_BATCH_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _fetch_users(team_nos) -> dict[int, AppUser]:
+    users: dict[int, AppUser] = {}
+    for batch in _batches(list(team_nos)):
+        users.update((u.team_no, u) for u in AppUser.objects.filter(team_no__in=batch))
+    return users
+
+
+def _fetch_member_ids(user_ids: list[int]) -> list[tuple[int, str]]:
+    rows: list[tuple[int, str]] = []
+    for batch in _batches(user_ids):
+        rows.extend(AppUserMember.objects.filter(user_id__in=batch).values_list('user_id', 'member_id'))
+    return rows
+
+
+def _check_append_only(teams: dict[int, list[dict]]) -> set[int]:
+    """Reject teams that would exceed 5 members; returns the team numbers that already exist."""
+    existing_users = _fetch_users(teams)
+    member_ids_by_user: dict[int, set[str]] = {}
+    for user_id, member_id in _fetch_member_ids([u.id for u in existing_users.values()]):
+        member_ids_by_user.setdefault(user_id, set()).add(member_id)
+
+    for team_no, user in existing_users.items():
+        existing_member_ids = member_ids_by_user.get(user.id, set())
+        incoming_member_ids = {m['member_id'] for m in teams[team_no]}
+        new_member_ids = incoming_member_ids - existing_member_ids
+        total_after = len(existing_member_ids) + len(new_member_ids)
+        if total_after > 5:
+            raise CommandError(f'Team {team_no} would have {total_after} members (> 5) after append-only import.')
+    return set(existing_users)
+
+
+def _write_teams(
+    teams: dict[int, list[dict]],
+    hashes: dict[int, tuple[str, str, int]],
+    *,
+    append_only: bool,
+    partial: bool = False,
+) -> dict:
+    """Apply validated teams with a handful of set-based queries instead of several per member.
+
+    With ``partial`` the teams are one chunk of a streamed file and may be
+    missing members listed elsewhere in it: nothing is deleted, and listed
+    members that did not change still get ``updated_at`` stamped so
+    ``_delete_unlisted_members`` can tell them apart afterwards.
+    """
+    now = timezone.now()
+    stats = dict.fromkeys(('users_created', 'users_updated', 'members_created', 'members_updated', 'members_deleted'), 0)
+
+    users = _fetch_users(teams)
+
+    new_users = []
+    for team_no in sorted(teams.keys() - users.keys()):
+        # Append-only skips hashing teams that existed at validation time; one may have been deleted since.
+        salt_b64, password_hash_b64, iterations = hashes.get(team_no) or hash_team_password(team_no)[1]
+        new_users.append(
+            AppUser(
+                team_no=team_no,
+                username=f'Team {team_no}',
+                email=None,
+                phone=None,
+                password_salt_b64=salt_b64,
+                password_hash_b64=password_hash_b64,
+                password_iterations=iterations,
+                is_active=True,
+            )
+        )
+
+    if not append_only:
+        for team_no, user in users.items():
+            user.username = f'Team {team_no}'
+            user.password_salt_b64, user.password_hash_b64, user.password_iterations = hashes[team_no]
+            user.is_active = True
+            user.updated_at = now
+        AppUser.objects.bulk_update(
+            list(users.values()),
+            ['username', 'password_salt_b64', 'password_hash_b64', 'password_iterations', 'is_active', 'updated_at'],
+            batch_size=BULK_BATCH_SIZE,
+        )
+        stats['users_updated'] = len(users)
+
+    if new_users:
+        # Re-read rather than rely on bulk_create returning primary keys, which MySQL does not.
+        AppUser.objects.bulk_create(new_users, batch_size=BULK_BATCH_SIZE)
+        users.update(_fetch_users([u.team_no for u in new_users]))
+        stats['users_created'] = len(new_users)
+
+    incoming = {m['member_id']: (team_no, m) for team_no, members in teams.items() for m in members}
+    existing: dict[str, AppUserMember] = {}
+    for batch in _batches(list(incoming)):
+        existing.update((m.member_id, m) for m in AppUserMember.objects.select_related('user').filter(member_id__in=batch))
+
+    to_create = []
+    to_update = []
+    unchanged = []
+    for member_id, (team_no, m) in incoming.items():
+        user = users[team_no]
+        member = existing.get(member_id)
+        if member is None:
+            to_create.append(
+                AppUserMember(
+                    user=user,
+                    member_id=member_id,
+                    phone=m['phone'],
+                    name=m['name'],
+                    email=m['email'],
+                    email_normalized=AppUserMember.normalize_email(m['email']),
+                )
+            )
+        elif append_only:
+            if member.user_id != user.id:
+                raise CommandError(
+                    f"Member ID {member_id!r} already exists under Team {member.user.team_no}; cannot append into Team {team_no}."
+                )
+        elif (member.user_id, member.phone, member.name, member.email) != (user.id, m['phone'], m['name'], m['email']):
+            member.user = user
+            member.phone = m['phone']
+            member.name = m['name']
+            member.email = m['email']
+            member.email_normalized = AppUserMember.normalize_email(m['email'])
+            member.updated_at = now
+            to_update.append(member)
+        else:
+            unchanged.append(member.id)
+
+    if partial and not append_only:
+        for batch in _batches(unchanged):
+            AppUserMember.objects.filter(id__in=batch).update(updated_at=now)
+    elif not append_only:
+        # Members of imported teams that are no longer listed anywhere in the CSV
+        stale_ids = []
+        for batch in _batches([u.id for u in users.values()]):
+            members = AppUserMember.objects.filter(user_id__in=batch).values_list('id', 'member_id')
+            stale_ids.extend(pk for pk, member_id in members if member_id not in incoming)
+        for batch in _batches(stale_ids):
+            AppUserMember.objects.filter(id__in=batch).delete()
+        stats['members_deleted'] = len(stale_ids)
+
+    AppUserMember.objects.bulk_update(
+        to_update,
+        ['user', 'phone', 'name', 'email', 'email_normalized', 'updated_at'],
+        batch_size=BULK_BATCH_SIZE,
+    )
+    AppUserMember.objects.bulk_create(to_create, batch_size=BULK_BATCH_SIZE)
+    stats['members_updated'] = len(to_update)
+    stats['members_created'] = len(to_create)
+    return stats
+
+
+def _members_listed_since(member_ids: list[str], since) -> list[str]:
+    """Member IDs already written by this streamed import, i.e. listed in an earlier chunk."""
+    listed: list[str] = []
+    for batch in _batches(member_ids):
+        listed.extend(AppUserMember.objects.filter(member_id__in=batch, updated_at__gte=since).values_list('member_id', flat=True))
+    return listed
+
+
+def _team_conflicts(team_nos, since) -> list[str]:
+    """Teams that, counting only members written since ``since``, break the size or phone rules."""
+    team_no_by_user = {u.id: team_no for team_no, u in _fetch_users(team_nos).items()}
+    sizes: dict[int, int] = {}
+    phone_owner: dict[tuple[int, str], str] = {}
+    problems: list[str] = []
+    for batch in _batches(list(team_no_by_user)):
+        members = AppUserMember.objects.filter(user_id__in=batch, updated_at__gte=since).values_list('user_id', 'member_id', 'phone')
+        for user_id, member_id, phone in members:
+            team_no = team_no_by_user[user_id]
+            sizes[team_no] = sizes.get(team_no, 0) + 1
+            owner = phone_owner.setdefault((team_no, phone), member_id)
+            if owner != member_id:
+                problems.append(f'Team {team_no} has duplicate phone {phone!r} for Member IDs {owner!r} and {member_id!r}.')
+    problems.extend(f'Team {team_no} has {size} members (> 5).' for team_no, size in sorted(sizes.items()) if size > 5)
+    return problems
+
+
+def _delete_unlisted_members(since) -> int:
+    """Delete members of teams written since ``since`` that the import did not list."""
+    deleted = 0
+    last_id = 0
+    while True:
+        users = AppUser.objects.filter(updated_at__gte=since, id__gt=last_id).order_by('id')
+        batch = list(users.values_list('id', flat=True)[:BULK_BATCH_SIZE])
+        if not batch:
+            return deleted
+        last_id = batch[-1]
+        stale_ids = list(AppUserMember.objects.filter(user_id__in=batch, updated_at__lt=since).values_list('id', flat=True))
+        AppUserMember.objects.filter(id__in=stale_ids).delete()
+        deleted += len(stale_ids)
+
+
+def _chunks(rows, size: int):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
 class Command(BaseCommand):
     help = 'Import team accounts and members from hackathon_users.csv'
 
@@ -49,57 +296,104 @@ class Command(BaseCommand):
             action='store_true',
             help='Only create new teams/members found in CSV; do not update passwords or delete existing members',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Processes used to hash team passwords before writing (default: CPU count; 1 hashes in-process)',
+        )
+        parser.add_argument(
+            '--compare-serial',
+            action='store_true',
+            help='Also hash the same passwords one at a time in-process and report both timings',
+        )
+        parser.add_argument(
+            '--stream',
+            action='store_true',
+            help='Read the CSV twice instead of loading it, reporting every invalid row and committing in chunks',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=5000,
+            help='Rows written per transaction with --stream (default: 5000)',
+        )
+
+    def _hash_passwords(self, team_nos: list[int], workers: int) -> dict[int, tuple[str, str, int]]:
+        total = len(team_nos)
+        step = max(1, total // 10)
+        hashes: dict[int, tuple[str, str, int]] = {}
+
+        def report(done: int) -> None:
+            if done % step == 0 or done == total:
+                self.stdout.write(f'Hashed {done}/{total} passwords')
+
+        if workers <= 1 or total <= 1:
+            for team_no in team_nos:
+                _, hashes[team_no] = hash_team_password(team_no)
+                report(len(hashes))
+            return hashes
+
+        with ProcessPoolExecutor(max_workers=min(workers, total)) as pool:
+            futures = [pool.submit(hash_team_password, team_no) for team_no in team_nos]
+            for future in as_completed(futures):
+                team_no, hashed = future.result()
+                hashes[team_no] = hashed
+                report(len(hashes))
+        return hashes
+
+    def _hash_stage(self, team_nos: list[int], options) -> dict[int, tuple[str, str, int]]:
+        if not team_nos:
+            return {}
+
+        workers = options['workers']
+        started = time.perf_counter()
+        hashes = self._hash_passwords(team_nos, workers)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f'Hashed {len(hashes)} passwords in {elapsed:.2f}s with {max(1, workers)} worker(s)')
+
+        if options['compare_serial']:
+            started = time.perf_counter()
+            for team_no in team_nos:
+                hash_team_password(team_no)
+            serial = time.perf_counter() - started
+            self.stdout.write(f'Serial hashing took {serial:.2f}s (speedup {serial / elapsed:.1f}x)')
+        return hashes
+
+    def _report_stats(self, stats: dict) -> None:
+        self.stdout.write(
+            f"Teams: {stats['users_created']} created, {stats['users_updated']} updated; "
+            f"members: {stats['members_created']} created, {stats['members_updated']} updated, "
+            f"{stats['members_deleted']} deleted"
+        )
 
     def handle(self, *args, **options):
+        if options['stream']:
+            return self._handle_stream(options)
+
         csv_path = options['csv_path']
         dry_run = options['dry_run']
         append_only = options['append_only']
 
-        try:
-            with open(csv_path, newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                expected = {'Team No.', 'Member ID', 'Name', 'Email', 'Phone'}
-                if set(reader.fieldnames or []) != expected:
-                    raise CommandError(f'CSV header must be exactly {sorted(expected)}. Got: {reader.fieldnames}')
-
-                rows = [row for row in reader]
-        except FileNotFoundError as exc:
-            raise CommandError(f'CSV file not found: {csv_path}') from exc
+        rows = list(_open_rows(csv_path))
 
         teams: dict[int, list[dict]] = {}
         seen_member_ids: set[str] = set()
 
-        for idx, row in enumerate(rows, start=2):
-            if not (row.get('Team No.') or '').strip() and not (row.get('Phone') or '').strip():
-                continue
-
-            team_no_raw = (row.get('Team No.') or '').strip()
-            member_id = (row.get('Member ID') or '').strip()
-            name = (row.get('Name') or '').strip()
-            email = (row.get('Email') or '').strip() or None
-            phone_raw = row.get('Phone')
-
-            if not team_no_raw and not name and not email and not (phone_raw or '').strip():
-                continue
-
-            if not team_no_raw:
-                raise CommandError(f'Row {idx}: missing Team No.')
-            if not member_id:
-                raise CommandError(f'Row {idx}: missing Member ID')
-            if member_id in seen_member_ids:
-                raise CommandError(f'Row {idx}: duplicate Member ID {member_id!r}')
-            if not name:
-                raise CommandError(f'Row {idx}: missing Name')
-
+        for idx, row in rows:
             try:
-                team_no = _parse_team_no(team_no_raw)
-                phone = _normalize_phone(phone_raw)
+                parsed = _parse_row(row)
             except ValueError as exc:
                 raise CommandError(f'Row {idx}: {exc}') from exc
+            if parsed is None:
+                continue
 
-            seen_member_ids.add(member_id)
+            team_no, member = parsed
+            if member['member_id'] in seen_member_ids:
+                raise CommandError(f"Row {idx}: duplicate Member ID {member['member_id']!r}")
+            seen_member_ids.add(member['member_id'])
 
-            teams.setdefault(team_no, []).append({'member_id': member_id, 'name': name, 'email': email, 'phone': phone})
+            teams.setdefault(team_no, []).append(member)
 
         if not teams:
             raise CommandError('No valid team rows found in CSV.')
@@ -121,76 +415,141 @@ class Command(BaseCommand):
                     )
                 phones[m['phone']] = m['member_id']
 
-        if append_only:
-            for team_no, members in teams.items():
-                existing_user = AppUser.objects.filter(team_no=team_no).first()
-                if existing_user is None:
-                    continue
-
-                existing_member_ids = set(
-                    AppUserMember.objects.filter(user=existing_user).values_list('member_id', flat=True)
-                )
-                incoming_member_ids = {m['member_id'] for m in members}
-                new_member_ids = incoming_member_ids - existing_member_ids
-                total_after = len(existing_member_ids) + len(new_member_ids)
-                if total_after > 5:
-                    raise CommandError(
-                        f'Team {team_no} would have {total_after} members (> 5) after append-only import.'
-                    )
+        existing_team_nos = _check_append_only(teams) if append_only else set()
 
         if dry_run:
             self.stdout.write(self.style.WARNING('Dry-run enabled: no DB changes.'))
             return
 
+        # Hash every password up front so the transaction below only covers the writes.
+        # Append-only imports never touch the passwords of teams that already exist.
+        hashes = self._hash_stage(sorted(teams.keys() - existing_team_nos), options)
+
         with transaction.atomic():
-            for team_no, members in teams.items():
-                unique_by_member_id: dict[str, dict] = {}
-                for m in members:
-                    unique_by_member_id[m['member_id']] = m
-                members = list(unique_by_member_id.values())
-
-                password = _format_password(team_no)
-                salt_b64, password_hash_b64, iterations = hash_password(password, iterations=PBKDF2_ITERATIONS)
-
-                user, created = AppUser.objects.get_or_create(
-                    team_no=team_no,
-                    defaults={
-                        'username': f'Team {team_no}',
-                        'email': None,
-                        'phone': None,
-                        'password_salt_b64': salt_b64,
-                        'password_hash_b64': password_hash_b64,
-                        'password_iterations': iterations,
-                        'is_active': True,
-                    },
-                )
+            stats = _write_teams(teams, hashes, append_only=append_only)
+
+        self._report_stats(stats)
+        self.stdout.write(self.style.SUCCESS('Import completed.'))
 
-                if not append_only and not created:
-                    AppUser.objects.filter(id=user.id).update(
-                        username=f'Team {team_no}',
-                        password_salt_b64=salt_b64,
-                        password_hash_b64=password_hash_b64,
-                        password_iterations=iterations,
-                        is_active=True,
+    def _handle_stream(self, options):
+        """Two passes over the file, each holding at most one chunk of rows.
+
+        The first pass validates every row, and the rows of each chunk against
+        each other, reporting all errors before anything is written. The second
+        commits the file chunk by chunk; a team may span chunks. Conflicts
+        between chunks (a repeated Member ID, or a team that ends up with more
+        than five members or a repeated phone) are found against what earlier
+        chunks wrote, using ``updated_at`` from the start of the pass, and
+        roll back the chunk that raised them. Earlier chunks stay committed, and
+        rerunning the same file is safe. Members of imported teams that the
+        file does not list are deleted once every chunk is in.
+        """
+        csv_path = options['csv_path']
+        dry_run = options['dry_run']
+        append_only = options['append_only']
+        chunk_size = max(1, options['chunk_size'])
+
+        errors = 0
+        rows_found = 0
+
+        def row_error(idx: int, message: str) -> None:
+            nonlocal errors
+            errors += 1
+            self.stderr.write(f'Row {idx}: {message}')
+
+        def checked_rows():
+            for idx, row in _open_rows(csv_path):
+                try:
+                    parsed = _parse_row(row)
+                except ValueError as exc:
+                    row_error(idx, str(exc))
+                    continue
+                if parsed is not None:
+                    yield idx, *parsed
+
+        for chunk in _chunks(checked_rows(), chunk_size):
+            rows_found += len(chunk)
+            seen_member_ids: set[str] = set()
+            phone_owner: dict[tuple[int, str], str] = {}
+            team_sizes: dict[int, int] = {}
+            for idx, team_no, member in chunk:
+                if member['member_id'] in seen_member_ids:
+                    row_error(idx, f"duplicate Member ID {member['member_id']!r}")
+                    continue
+                owner = phone_owner.setdefault((team_no, member['phone']), member['member_id'])
+                if owner != member['member_id']:
+                    row_error(
+                        idx,
+                        f"Team {team_no} has duplicate phone {member['phone']!r} for Member IDs {owner!r} and {member['member_id']!r}.",
                     )
+                    continue
+                seen_member_ids.add(member['member_id'])
+                team_sizes[team_no] = team_sizes.get(team_no, 0) + 1
+            for team_no, size in sorted(team_sizes.items()):
+                if size > 5:
+                    errors += 1
+                    self.stderr.write(f'Team {team_no} has {size} members (> 5).')
+
+        if errors:
+            raise CommandError(f'{errors} validation error(s) in {csv_path}; nothing was written.')
+        if not rows_found:
+            raise CommandError('No valid team rows found in CSV.')
 
-                if not append_only:
-                    AppUserMember.objects.filter(user=user).exclude(member_id__in=[m['member_id'] for m in members]).delete()
-
-                for m in members:
-                    if append_only:
-                        member, created_member = AppUserMember.objects.get_or_create(
-                            member_id=m['member_id'],
-                            defaults={'user': user, 'phone': m['phone'], 'name': m['name'], 'email': m['email']},
-                        )
-                        if not created_member and member.user_id != user.id:
-                            raise CommandError(
-                                f"Member ID {m['member_id']!r} already exists under Team {member.user.team_no}; cannot append into Team {team_no}."
-                            )
-                    else:
-                        AppUserMember.objects.update_or_create(
-                            member_id=m['member_id'],
-                            defaults={'user': user, 'phone': m['phone'], 'name': m['name'], 'email': m['email']},
-                        )
+        self.stdout.write(f'Total members found: {rows_found}')
+
+        changed = CommandError(f'{csv_path} changed while it was being imported.')
+
+        def reread_rows():
+            for idx, row in _open_rows(csv_path):
+                try:
+                    parsed = _parse_row(row)
+                except ValueError as exc:
+                    raise changed from exc
+                if parsed is not None:
+                    yield idx, *parsed
+
+        started_at = timezone.now()
+        totals = dict.fromkeys(('users_created', 'users_updated', 'members_created', 'members_updated', 'members_deleted'), 0)
+        chunks = 0
+
+        for chunk in _chunks(reread_rows(), chunk_size):
+            chunks += 1
+            teams: dict[int, list[dict]] = {}
+            row_by_member_id: dict[str, int] = {}
+            for idx, team_no, member in chunk:
+                teams.setdefault(team_no, []).append(member)
+                row_by_member_id[member['member_id']] = idx
+
+            existing_team_nos = _check_append_only(teams) if append_only else set()
+            if dry_run:
+                continue
+            hashes = self._hash_stage(sorted(teams.keys() - existing_team_nos), options)
 
-        self.stdout.write(self.style.SUCCESS('Import completed.'))
+            with transaction.atomic():
+                repeated = sorted(_members_listed_since(list(row_by_member_id), started_at), key=row_by_member_id.get)
+                if repeated:
+                    raise CommandError(
+                        f'Row {row_by_member_id[repeated[0]]}: duplicate Member ID {repeated[0]!r}; '
+                        f'chunk {chunks} was rolled back and earlier chunks are committed.'
+                    )
+                stats = _write_teams(teams, hashes, append_only=append_only, partial=True)
+                problems = _team_conflicts(teams, started_at)
+                if problems:
+                    raise CommandError(f'{problems[0]} Chunk {chunks} was rolled back and earlier chunks are committed.')
+
+            for key, value in stats.items():
+                totals[key] += value
+            self.stdout.write(f'Chunk {chunks}: {len(teams)} teams, {len(chunk)} members committed')
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING('Dry-run enabled: no DB changes.'))
+            self.stdout.write('Conflicts between chunks are only detected when the chunks are written.')
+            return
+
+        if not append_only:
+            # A team spanning several chunks was updated once per chunk
+            totals['users_updated'] = AppUser.objects.filter(updated_at__gte=started_at).count() - totals['users_created']
+            totals['members_deleted'] = _delete_unlisted_members(started_at)
+
+        self._report_stats(totals)
+        self.stdout.write(self.style.SUCCESS(f'Import completed in {chunks} chunk(s).'))
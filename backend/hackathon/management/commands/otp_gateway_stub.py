@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from hackathon.otp_stub import StubGateway
+
+
+class Command(BaseCommand):
+    help = 'Run a local stub of the OTP gateway (point OTP_GATEWAY_URL at it)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8025)
+        parser.add_argument('--latency-ms', type=float, default=0, help='Delay added to every reply')
+        parser.add_argument('--fail-rate', type=float, default=0, help='Fraction of requests answered with HTTP 503')
+        parser.add_argument('--otp', default='123456', help='The only OTP the stub accepts')
+
+    def handle(self, *args, **options):
+        stub = StubGateway(
+            host=options['host'],
+            port=options['port'],
+            latency=options['latency_ms'] / 1000,
+            fail_rate=options['fail_rate'],
+            otp=options['otp'],
+        )
+        self.stdout.write(f'Stub OTP gateway listening on {stub.url} (Ctrl+C to stop)')
+        try:
+            stub.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stub.stop()
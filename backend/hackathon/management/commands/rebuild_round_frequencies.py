@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from hackathon.counters import normalize_cloud_word
+from hackathon.models import Response, RoundAugmentWeight, WordFrequencyByRound
+
+
+class Command(BaseCommand):
+    help = 'Recompute WordFrequencyByRound from Response rows and augmentation weights'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--round', type=int, dest='round_id', help='Only rebuild this GameRound id')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows per INSERT (default: 1000)')
+
+    def handle(self, *args, **options):
+        round_id = options['round_id']
+        responses = Response.objects.all()
+        weights = RoundAugmentWeight.objects.all()
+        existing = WordFrequencyByRound.objects.all()
+        if round_id is not None:
+            responses = responses.filter(round_id=round_id)
+            weights = weights.filter(round_id=round_id)
+            existing = existing.filter(round_id=round_id)
+
+        totals: dict[tuple[int, str], int] = {}
+        counted = responses.values_list('round_id', 'word').annotate(n=Count('id')).order_by()
+        for rid, word, n in [*counted.iterator(), *weights.values_list('round_id', 'word', 'weight').iterator()]:
+            word = normalize_cloud_word(word)
+            if word is not None and n:
+                totals[(rid, word)] = totals.get((rid, word), 0) + n
+
+        with transaction.atomic():
+            deleted, _ = existing.delete()
+            created = WordFrequencyByRound.objects.bulk_create(
+                (WordFrequencyByRound(round_id=rid, word=word, frequency=n) for (rid, word), n in totals.items()),
+                batch_size=options['batch_size'],
+            )
+
+        self.stdout.write(f'Removed {deleted} stale rows')
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {len(created)} round word frequencies.'))
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Sum
+
+from hackathon.counters import SAMPLE_WORD_COUNTER, bump_counter_version
+from hackathon.models import SampleWordTotal, WordCloudResponse
+
+
+class Command(BaseCommand):
+    help = 'Recompute hackathon_sample_word_total from every WordCloudResponse row'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows per INSERT (default: 1000)')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        totals = (
+            WordCloudResponse.objects.exclude(word='')
+            .values('word')
+            .annotate(total=Sum('count'))
+            .order_by()
+        )
+
+        with transaction.atomic():
+            deleted, _ = SampleWordTotal.objects.all().delete()
+            created = SampleWordTotal.objects.bulk_create(
+                (SampleWordTotal(word=row['word'], total=row['total'] or 0) for row in totals.iterator()),
+                batch_size=batch_size,
+            )
+            bump_counter_version(SAMPLE_WORD_COUNTER.name)
+
+        self.stdout.write(f'Removed {deleted} stale totals')
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {len(created)} sample word totals.'))
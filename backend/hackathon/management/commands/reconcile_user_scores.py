@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from hackathon.models import AnswerEvent, ShareEvent, UserScore
+
+
+class Command(BaseCommand):
+    help = 'Recompute hackathon_user_score from the AnswerEvent and ShareEvent tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Report drift without writing')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows per write (default: 1000)')
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        batch_size = options['batch_size']
+
+        with transaction.atomic():
+            expected: dict[str, list[int]] = {}
+            answers = AnswerEvent.objects.values('user_id').annotate(n=Count('id')).order_by()
+            for row in answers.iterator():
+                expected.setdefault(str(row['user_id']), [0, 0])[0] = row['n']
+            shares = ShareEvent.objects.exclude(player_id=None).values('player_id').annotate(n=Count('id')).order_by()
+            for row in shares.iterator():
+                expected.setdefault(row['player_id'], [0, 0])[1] = row['n']
+
+            stored = {score.user_id: score for score in UserScore.objects.select_for_update()}
+
+            to_create = []
+            to_update = []
+            for user_id, (answer_count, share_count) in expected.items():
+                score = stored.pop(user_id, None)
+                if score is None:
+                    to_create.append(UserScore(user_id=user_id, answer_count=answer_count, share_count=share_count))
+                elif (score.answer_count, score.share_count) != (answer_count, share_count):
+                    score.answer_count = answer_count
+                    score.share_count = share_count
+                    to_update.append(score)
+            # Whatever is left has no events behind it any more
+            to_delete = list(stored)
+
+            if not dry_run:
+                UserScore.objects.bulk_create(to_create, batch_size=batch_size)
+                UserScore.objects.bulk_update(to_update, ['answer_count', 'share_count'], batch_size=batch_size)
+                for start in range(0, len(to_delete), batch_size):
+                    UserScore.objects.filter(user_id__in=to_delete[start : start + batch_size]).delete()
+
+        prefix = 'Would fix' if dry_run else 'Fixed'
+        self.stdout.write(
+            f'{prefix}: {len(to_create)} missing, {len(to_update)} drifted, {len(to_delete)} orphaned user scores'
+        )
+        if not dry_run:
+            self.stdout.write(self.style.SUCCESS(f'Reconciled {len(expected)} user scores.'))
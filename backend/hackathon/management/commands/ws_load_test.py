@@ -0,0 +1,122 @@
+import asyncio
+import gc
+import os
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand, CommandError
+
+from hackathon.models import GameRound
+from hackathon.ws import round_socket
+
+
+def _rss_bytes() -> int:
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return 0
+
+
+class _Client:
+    """An in-process WebSocket peer speaking the ASGI message protocol to the hub."""
+
+    def __init__(self, path: str):
+        self.scope = {'type': 'websocket', 'path': path, 'headers': [], 'subprotocols': []}
+        self.inbox: asyncio.Queue = asyncio.Queue()
+        self.accepted = asyncio.Event()
+        self.closed = False
+        self.messages = 0
+        self.task: asyncio.Task | None = None
+
+    async def receive(self):
+        return await self.inbox.get()
+
+    async def send(self, message):
+        kind = message['type']
+        if kind == 'websocket.accept':
+            self.accepted.set()
+        elif kind == 'websocket.send':
+            self.messages += 1
+        elif kind == 'websocket.close':
+            self.closed = True
+            self.accepted.set()
+            self.inbox.put_nowait({'type': 'websocket.disconnect', 'code': message.get('code', 1000)})
+
+    def connect(self) -> None:
+        self.inbox.put_nowait({'type': 'websocket.connect'})
+        self.task = asyncio.ensure_future(round_socket(self.scope, self.receive, self.send))
+
+    def disconnect(self) -> None:
+        if not self.closed:
+            self.inbox.put_nowait({'type': 'websocket.disconnect', 'code': 1000})
+
+
+class Command(BaseCommand):
+    help = 'Hold many idle round WebSockets open against the hub in-process and report the memory each one costs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--share-token', default='', help='Round to connect to (default: newest active round)')
+        parser.add_argument('--connections', type=int, default=2000, help='Sockets to open (default: 2000)')
+        parser.add_argument('--batch', type=int, default=200, help='Sockets opened concurrently (default: 200)')
+        parser.add_argument('--hold', type=float, default=5, help='Seconds to hold them idle (default: 5)')
+
+    def handle(self, *args, **options):
+        share_token = options['share_token']
+        if not share_token:
+            share_token = (
+                GameRound.objects.filter(status='active').order_by('-id').values_list('share_token', flat=True).first()
+            )
+            if not share_token:
+                raise CommandError('No active round; pass --share-token')
+        asyncio.run(self._run(f'/ws/rounds/{share_token}', options))
+
+    async def _run(self, path: str, options) -> None:
+        n = max(1, options['connections'])
+        batch = max(1, options['batch'])
+
+        # Warm up imports, the token cache and the round's topic so the baseline excludes them.
+        warm = _Client(path)
+        warm.connect()
+        await asyncio.wait_for(warm.accepted.wait(), timeout=30)
+        if warm.closed:
+            raise CommandError(f'The hub refused {path}')
+
+        gc.collect()
+        tracemalloc.start()
+        base_traced, _ = tracemalloc.get_traced_memory()
+        base_rss = _rss_bytes()
+
+        clients = []
+        started = time.perf_counter()
+        for start in range(0, n, batch):
+            chunk = [_Client(path) for _ in range(min(batch, n - start))]
+            for client in chunk:
+                client.connect()
+            await asyncio.gather(*(client.accepted.wait() for client in chunk))
+            clients.extend(chunk)
+        while any(client.messages == 0 for client in clients):
+            await asyncio.sleep(0.05)
+        connect_time = time.perf_counter() - started
+
+        await asyncio.sleep(options['hold'])
+        gc.collect()
+        traced, peak = tracemalloc.get_traced_memory()
+        rss = _rss_bytes()
+        tracemalloc.stop()
+
+        open_count = sum(not client.closed for client in clients)
+        self.stdout.write(f'Opened {open_count}/{n} sockets on {path} in {connect_time:.2f}s')
+        self.stdout.write(
+            f'Python heap per connection (hub plus this harness\'s queue): {(traced - base_traced) / n / 1024:.1f} KiB '
+            f'(peak {(peak - base_traced) / n / 1024:.1f} KiB)'
+        )
+        if rss and base_rss:
+            self.stdout.write(f'RSS per connection: {(rss - base_rss) / n / 1024:.1f} KiB (includes tracemalloc overhead)')
+        received = sum(client.messages for client in clients)
+        self.stdout.write(f'Messages delivered while idle: {received} ({received / n:.2f} per socket)')
+
+        for client in [warm, *clients]:
+            client.disconnect()
+        await asyncio.gather(*(client.task for client in [warm, *clients]), return_exceptions=True)
+        self.stdout.write(self.style.SUCCESS('Closed all sockets.'))
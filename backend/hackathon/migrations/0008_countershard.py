@@ -0,0 +1,27 @@
+# Generated by Django 5.2.3 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathon', '0007_alter_question_table_alter_roundscore_table_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CounterShard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('counter', models.CharField(max_length=32)),
+                ('word', models.CharField(max_length=100)),
+                ('shard', models.PositiveSmallIntegerField()),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'hackathon_counter_shard',
+                'constraints': [models.UniqueConstraint(fields=('counter', 'word', 'shard'), name='uniq_counter_word_shard')],
+            },
+        ),
+    ]
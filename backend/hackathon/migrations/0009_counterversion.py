@@ -0,0 +1,24 @@
+# Generated by Django 5.2.3 on 2026-10-18 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathon', '0008_countershard'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CounterVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=32, unique=True)),
+                ('version', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'hackathon_counter_version',
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathon', '0009_counterversion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SampleWordTotal',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('word', models.CharField(max_length=100, unique=True)),
+                ('total', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'hackathon_sample_word_total',
+                'indexes': [models.Index(fields=['-total'], name='sample_word_total_desc')],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.3 on 2026-10-18 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathon', '0010_samplewordtotal'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserScore',
+            fields=[
+                ('user_id', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('answer_count', models.IntegerField(db_default=0, default=0)),
+                ('share_count', models.IntegerField(db_default=0, default=0)),
+            ],
+            options={
+                'db_table': 'hackathon_user_score',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='answerevent',
+            index=models.Index(fields=['user_id'], name='answer_event_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shareevent',
+            index=models.Index(fields=['player_id'], name='share_event_player_idx'),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.3 on 2026-10-18 14:05
+
+from django.db import migrations, models
+
+
+def backfill_email_normalized(apps, schema_editor):
+    AppUserMember = apps.get_model('hackathon', 'AppUserMember')
+    members = []
+    for member in AppUserMember.objects.exclude(email=None).only('id', 'email').iterator(chunk_size=2000):
+        email = (member.email or '').strip().lower()
+        if email:
+            member.email_normalized = email
+            members.append(member)
+    AppUserMember.objects.bulk_update(members, ['email_normalized'], batch_size=500)
+
+
+def _member_table_has_phone(schema_editor) -> bool:
+    # Migration 0006 dropped ``phone`` from the migration state while the model (and live
+    # schema) kept it, so the index is only created where the column really exists. The
+    # state side of the operation below restores the field and records the index.
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        columns = connection.introspection.get_table_description(cursor, 'hackathon_appusermember')
+    return any(column.name == 'phone' for column in columns)
+
+
+def add_phone_index(apps, schema_editor):
+    if _member_table_has_phone(schema_editor):
+        schema_editor.execute('CREATE INDEX member_phone_idx ON hackathon_appusermember (phone)')
+
+
+def drop_phone_index(apps, schema_editor):
+    if _member_table_has_phone(schema_editor):
+        AppUserMember = apps.get_model('hackathon', 'AppUserMember')
+        schema_editor.execute(schema_editor._delete_index_sql(AppUserMember, 'member_phone_idx'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathon', '0011_userscore_event_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appusermember',
+            name='email_normalized',
+            field=models.CharField(blank=True, editable=False, max_length=254, null=True),
+        ),
+        migrations.RunPython(backfill_email_normalized, migrations.RunPython.noop),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(add_phone_index, drop_phone_index),
+            ],
+            state_operations=[
+                migrations.AddField(
+                    model_name='appusermember',
+                    name='phone',
+                    field=models.CharField(max_length=32),
+                ),
+                migrations.AddIndex(
+                    model_name='appusermember',
+                    index=models.Index(fields=['phone'], name='member_phone_idx'),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='appusermember',
+            index=models.Index(fields=['email_normalized'], name='member_email_norm_idx'),
+        ),
+    ]
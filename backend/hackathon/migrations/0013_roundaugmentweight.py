@@ -0,0 +1,61 @@
+# Generated by Django 5.2.3 on 2026-10-18 14:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fold_augmented_responses(apps, schema_editor):
+    # Turn existing synthetic Response rows into per-word weights, then drop them.
+    Response = apps.get_model('hackathon', 'Response')
+    RoundAugmentWeight = apps.get_model('hackathon', 'RoundAugmentWeight')
+
+    augmented = Response.objects.filter(is_augmented=True)
+    totals = augmented.values('round_id', 'word').annotate(weight=Count('id')).order_by()
+    RoundAugmentWeight.objects.bulk_create(
+        (RoundAugmentWeight(round_id=t['round_id'], word=t['word'], weight=t['weight']) for t in totals.iterator()),
+        batch_size=500,
+    )
+    while True:
+        ids = list(augmented.values_list('id', flat=True)[:5000])
+        if not ids:
+            return
+        Response.objects.filter(id__in=ids).delete()
+
+
+def expand_augment_weights(apps, schema_editor):
+    Response = apps.get_model('hackathon', 'Response')
+    RoundAugmentWeight = apps.get_model('hackathon', 'RoundAugmentWeight')
+
+    for w in RoundAugmentWeight.objects.iterator():
+        Response.objects.bulk_create(
+            [
+                Response(round_id=w.round_id, player_id=f'augmented_{w.id}_{i}', word=w.word, is_augmented=True)
+                for i in range(w.weight)
+            ],
+            batch_size=500,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathon', '0012_member_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoundAugmentWeight',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('word', models.CharField(max_length=100)),
+                ('weight', models.IntegerField(db_default=0, default=0)),
+                ('round', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='augment_weights', to='hackathon.gameround')),
+            ],
+            options={
+                'db_table': 'hackathon_round_augment_weight',
+                'constraints': [models.UniqueConstraint(fields=('round', 'word'), name='uniq_round_augment_word')],
+            },
+        ),
+        migrations.RunPython(fold_augmented_responses, expand_augment_weights),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.3 on 2026-10-18 15:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def clear_legacy_frequencies(apps, schema_editor):
+    # Rows pointed at WordCloudRound ids and were never read; they mean nothing for GameRound.
+    apps.get_model('hackathon', 'WordFrequencyByRound').objects.all().delete()
+
+
+def _normalize(word):
+    word = (word or '').upper()
+    if not word or ' ' in word or not word.isalnum():
+        return None
+    return word
+
+
+def backfill_round_frequencies(apps, schema_editor):
+    Response = apps.get_model('hackathon', 'Response')
+    RoundAugmentWeight = apps.get_model('hackathon', 'RoundAugmentWeight')
+    WordFrequencyByRound = apps.get_model('hackathon', 'WordFrequencyByRound')
+
+    totals: dict[tuple[int, str], int] = {}
+    counted = Response.objects.values('round_id', 'word').annotate(n=Count('id')).order_by()
+    weights = RoundAugmentWeight.objects.values('round_id', 'word', n=models.F('weight'))
+    for row in [*counted.iterator(), *weights.iterator()]:
+        word = _normalize(row['word'])
+        if word is not None and row['n']:
+            key = (row['round_id'], word)
+            totals[key] = totals.get(key, 0) + row['n']
+
+    WordFrequencyByRound.objects.bulk_create(
+        (WordFrequencyByRound(round_id=round_id, word=word, frequency=n) for (round_id, word), n in totals.items()),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathon', '0013_roundaugmentweight'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_legacy_frequencies, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='wordfrequencybyround',
+            name='round',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='word_frequencies', to='hackathon.gameround'),
+        ),
+        migrations.AlterField(
+            model_name='wordfrequencybyround',
+            name='frequency',
+            field=models.IntegerField(db_default=0, default=0),
+        ),
+        migrations.AddConstraint(
+            model_name='wordfrequencybyround',
+            constraint=models.UniqueConstraint(fields=('round', 'word'), name='uniq_round_word_frequency'),
+        ),
+        migrations.AddIndex(
+            model_name='wordfrequencybyround',
+            index=models.Index(fields=['round', '-frequency', 'word'], name='round_word_freq_rank_idx'),
+        ),
+        migrations.RunPython(backfill_round_frequencies, clear_legacy_frequencies),
+    ]
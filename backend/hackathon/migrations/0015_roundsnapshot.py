@@ -0,0 +1,27 @@
+# Generated by Django 5.2.3 on 2026-10-18 15:45
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathon', '0014_wordfrequencybyround_gameround'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoundSnapshot',
+            fields=[
+                ('round', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='snapshot', serialize=False, to='hackathon.gameround')),
+                ('body_gz', models.BinaryField()),
+                ('etag', models.CharField(max_length=64)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': 'hackathon_round_snapshot',
+            },
+        ),
+    ]
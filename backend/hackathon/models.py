@@ -28,6 +28,8 @@ class AppUserMember(models.Model):
     member_id = models.CharField(max_length=64, unique=True, null=True, blank=True)
     name = models.CharField(max_length=255)
     email = models.EmailField(null=True, blank=True)
+    # Lowercased copy of ``email`` for indexed OTP lookups; kept in step by hackathon.signals.
+    email_normalized = models.CharField(max_length=254, null=True, blank=True, editable=False)
     phone = models.CharField(max_length=32)
     
     created_at = models.DateTimeField(default=timezone.now)
@@ -37,6 +39,15 @@ class AppUserMember(models.Model):
         constraints = [
             models.UniqueConstraint(fields=['user', 'phone'], name='uniq_member_phone_per_team')
         ]
+        indexes = [
+            models.Index(fields=['phone'], name='member_phone_idx'),
+            models.Index(fields=['email_normalized'], name='member_email_norm_idx'),
+        ]
+
+    @staticmethod
+    def normalize_email(email: str | None) -> str | None:
+        email = (email or '').strip().lower()
+        return email or None
 
     def __str__(self):
         return self.name
@@ -144,9 +155,17 @@ class WordCloudResponse(models.Model):
 
 
 class WordFrequencyByRound(models.Model):
-    round = models.ForeignKey('WordCloudRound', on_delete=models.CASCADE)
+    # Per-GameRound cloud totals (real answers plus augmentation weights), keyed by the
+    # normalized upper-case word and maintained on write by hackathon.signals and the respond view.
+    round = models.ForeignKey('GameRound', on_delete=models.CASCADE, related_name='word_frequencies')
     word = models.CharField(max_length=100, default='')
-    frequency = models.IntegerField(default=0)
+    frequency = models.IntegerField(default=0, db_default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['round', 'word'], name='uniq_round_word_frequency')
+        ]
+        indexes = [models.Index(fields=['round', '-frequency', 'word'], name='round_word_freq_rank_idx')]
 
 
 class ShareEvent(models.Model):
@@ -155,6 +174,9 @@ class ShareEvent(models.Model):
     player_id = models.CharField(max_length=255, null=True, blank=True)
     created_at = models.DateTimeField(default=timezone.now)
 
+    class Meta:
+        indexes = [models.Index(fields=['player_id'], name='share_event_player_idx')]
+
 
 class RoundScore(models.Model):
     round = models.ForeignKey('WordCloudRound', on_delete=models.CASCADE)
@@ -186,6 +208,36 @@ class Response(models.Model):
         return f"{self.word} by {self.player_id}"
 
 
+class RoundSnapshot(models.Model):
+    # Final state of an ended GameRound (details, cloud, leaderboard) as gzip-compressed JSON.
+    round = models.OneToOneField('GameRound', on_delete=models.CASCADE, primary_key=True, related_name='snapshot')
+    body_gz = models.BinaryField()
+    etag = models.CharField(max_length=64)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'hackathon_round_snapshot'
+
+    def __str__(self):
+        return f"Snapshot of round {self.round_id}"
+
+
+class RoundAugmentWeight(models.Model):
+    # Simulated answers for a GameRound, one weight per word instead of augmented Response rows.
+    round = models.ForeignKey('GameRound', on_delete=models.CASCADE, related_name='augment_weights')
+    word = models.CharField(max_length=100)
+    weight = models.IntegerField(default=0, db_default=0)
+
+    class Meta:
+        db_table = 'hackathon_round_augment_weight'
+        constraints = [
+            models.UniqueConstraint(fields=['round', 'word'], name='uniq_round_augment_word')
+        ]
+
+    def __str__(self):
+        return f"{self.word} x{self.weight} (round {self.round_id})"
+
+
 class GameSession(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     questions = models.JSONField(default=list)
@@ -208,6 +260,9 @@ class AnswerEvent(models.Model):
     answer = models.CharField(max_length=100)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [models.Index(fields=['user_id'], name='answer_event_user_idx')]
+
 
 class Word(models.Model):
     text = models.CharField(max_length=50, unique=True)
@@ -218,3 +273,63 @@ class Word(models.Model):
 
     def __str__(self):
         return f"{self.text} ({self.frequency})"
+
+
+class CounterShard(models.Model):
+    # Extra shard rows for hot counters; shard 0 is the counter's own table row.
+    counter = models.CharField(max_length=32)
+    word = models.CharField(max_length=100)
+    shard = models.PositiveSmallIntegerField()
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'hackathon_counter_shard'
+        constraints = [
+            models.UniqueConstraint(fields=['counter', 'word', 'shard'], name='uniq_counter_word_shard')
+        ]
+
+    def __str__(self):
+        return f"{self.counter}:{self.word}#{self.shard} ({self.count})"
+
+
+class CounterVersion(models.Model):
+    # Bumped after every counter flush commits, on "<name>" or a "<name>:<shard>" row; the
+    # counter's version is their sum. Used for ETags and deltas.
+    name = models.CharField(max_length=32, unique=True)
+    version = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'hackathon_counter_version'
+
+    def __str__(self):
+        return f"{self.name} v{self.version}"
+
+
+class SampleWordTotal(models.Model):
+    # Per-word Sum('count') over WordCloudResponse, maintained by hackathon.signals.
+    word = models.CharField(max_length=100, unique=True)
+    total = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'hackathon_sample_word_total'
+        indexes = [models.Index(fields=['-total'], name='sample_word_total_desc')]
+
+    def __str__(self):
+        return f"{self.word} ({self.total})"
+
+
+class UserScore(models.Model):
+    # Per-player AnswerEvent / ShareEvent counts, maintained by hackathon.signals.
+    user_id = models.CharField(max_length=255, primary_key=True)
+    answer_count = models.IntegerField(default=0, db_default=0)
+    share_count = models.IntegerField(default=0, db_default=0)
+
+    class Meta:
+        db_table = 'hackathon_user_score'
+
+    @property
+    def total_score(self) -> int:
+        return self.answer_count + self.share_count
+
+    def __str__(self):
+        return f"{self.user_id} ({self.total_score})"
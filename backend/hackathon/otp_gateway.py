@@ -0,0 +1,134 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import urllib3
+
+
+class GatewayError(RuntimeError):
+    pass
+
+
+class CircuitOpenError(GatewayError):
+    pass
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures and rejects calls
+    for ``reset_timeout`` seconds. After that a single trial call is let
+    through: success closes the circuit again, failure re-opens it.
+    """
+
+    def __init__(self, *, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                return 'half-open'
+            return 'open'
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if time.monotonic() - self._opened_at < self.reset_timeout or self._trial_in_flight:
+                raise CircuitOpenError('OTP gateway temporarily unavailable')
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+class GatewayClient:
+    """Form-encoded POST client for the OTP gateway.
+
+    One urllib3 pool keeps up to ``pool_size`` keep-alive connections to the
+    gateway for every thread in the process. Each call has a total deadline of
+    ``timeout`` seconds covering connect and read, and goes through a circuit
+    breaker, so a dead or slow gateway costs callers at most that long until
+    the breaker opens, and nothing at all while it is open.
+    """
+
+    def __init__(self, url: str, *, auth_header: str = '', timeout: float, pool_size: int, breaker: CircuitBreaker):
+        self.url = url
+        self.auth_header = auth_header
+        self.timeout = timeout
+        self.breaker = breaker
+
+        headers = {'Accept': 'application/json'}
+        if auth_header:
+            headers['Authorization'] = auth_header
+        self._pool = urllib3.PoolManager(num_pools=1, maxsize=max(1, pool_size), headers=headers, retries=False)
+
+        # Async callers park the blocking call here so the event loop never waits on a socket.
+        self._executor = ThreadPoolExecutor(max_workers=max(1, pool_size), thread_name_prefix='otp-gateway')
+
+    def post(self, payload: dict, *, timeout: float | None = None) -> dict:
+        timeout = self.timeout if timeout is None else timeout
+        self.breaker.before_call()
+        try:
+            resp = self._pool.request(
+                'POST',
+                self.url,
+                fields=payload,
+                encode_multipart=False,
+                timeout=urllib3.Timeout(total=timeout),
+            )
+        except urllib3.exceptions.TimeoutError as exc:
+            self.breaker.record_failure()
+            raise GatewayError('OTP gateway timed out') from exc
+        except urllib3.exceptions.HTTPError as exc:
+            self.breaker.record_failure()
+            raise GatewayError('Unable to reach OTP gateway') from exc
+        except Exception:
+            # Anything else still ends a half-open trial, or the breaker would never close again
+            self.breaker.record_failure()
+            raise
+
+        if resp.status >= 500:
+            self.breaker.record_failure()
+            raise GatewayError(f'OTP gateway returned HTTP {resp.status}')
+
+        # The gateway answered; 4xx and malformed bodies are the caller's problem, not an outage.
+        self.breaker.record_success()
+        if resp.status < 200 or resp.status >= 300:
+            raise GatewayError(f'OTP gateway returned HTTP {resp.status}')
+        try:
+            return json.loads(resp.data.decode('utf-8'))
+        except ValueError as exc:
+            raise GatewayError('OTP gateway returned invalid JSON') from exc
+
+    async def post_async(self, payload: dict, *, timeout: float | None = None) -> dict:
+        timeout = self.timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, lambda: self.post(payload, timeout=timeout))
+        try:
+            # post() enforces the deadline itself; the margin only covers time queued for a worker.
+            return await asyncio.wait_for(future, timeout=timeout + 1)
+        except asyncio.TimeoutError as exc:
+            raise GatewayError('OTP gateway timed out') from exc
+
+    def close(self) -> None:
+        self._pool.clear()
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,88 @@
+import json
+import random
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, like the real gateway
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        stub: StubGateway = self.server.stub
+        length = int(self.headers.get('Content-Length') or 0)
+        form = urllib.parse.parse_qs(self.rfile.read(length).decode('utf-8'))
+        with stub._lock:
+            stub.requests += 1
+
+        if stub.latency:
+            time.sleep(stub.latency)
+
+        if random.random() < stub.fail_rate:
+            self._reply(503, {'status': 'error', 'message': 'stub failure'})
+        elif form.get('login_verfication') == ['yes']:
+            ok = form.get('otp', [''])[0] == stub.otp
+            self._reply(200, {'status': 'success' if ok else 'failed'})
+        else:
+            self._reply(200, {'status': 'success'})
+
+    def _reply(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client timed out and hung up before the reply
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubGateway:
+    """Local stand-in for the OTP gateway, for tests and latency benchmarks.
+
+    Accepts the same form posts as the real gateway, always "sends" an OTP and
+    verifies only ``otp``. ``latency`` (seconds) delays every reply and
+    ``fail_rate`` answers that fraction of requests with HTTP 503.
+    """
+
+    def __init__(self, *, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0, fail_rate: float = 0.0, otp: str = '123456'):
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.otp = otp
+        self.requests = 0
+        # Handlers run on one thread per connection
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/'
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def start(self) -> 'StubGateway':
+        self._thread = threading.Thread(target=self._server.serve_forever, name='otp-stub-gateway', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'StubGateway':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,42 @@
+# PBKDF2 password hashing. Kept free of Django imports so it can run in process-pool workers
+# started with "spawn" (the default on Windows and macOS), where the app registry is not set up.
+import base64
+import hashlib
+import hmac
+import secrets
+
+
+PBKDF2_ITERATIONS = 260000
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.b64encode(raw).decode('ascii')
+
+
+def _b64decode(val: str) -> bytes:
+    return base64.b64decode(val.encode('ascii'))
+
+
+def hash_password(password: str, *, salt_b64: str | None = None, iterations: int = PBKDF2_ITERATIONS) -> tuple[str, str, int]:
+    if salt_b64 is None:
+        salt = secrets.token_bytes(16)
+        salt_b64 = _b64encode(salt)
+    else:
+        salt = _b64decode(salt_b64)
+
+    dk = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations)
+    return salt_b64, _b64encode(dk), iterations
+
+
+def verify_password(password: str, *, salt_b64: str, password_hash_b64: str, iterations: int) -> bool:
+    _, computed_hash_b64, _ = hash_password(password, salt_b64=salt_b64, iterations=iterations)
+    return hmac.compare_digest(computed_hash_b64, password_hash_b64)
+
+
+def format_team_password(team_no: int) -> str:
+    return f'Team@{team_no:03d}'
+
+
+def hash_team_password(team_no: int) -> tuple[int, tuple[str, str, int]]:
+    # Runs in import_teams' worker processes, so it only takes and returns picklable values.
+    return team_no, hash_password(format_team_password(team_no), iterations=PBKDF2_ITERATIONS)
@@ -0,0 +1,153 @@
+import contextlib
+import functools
+import io
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+from django.conf import settings
+from PIL import Image, ImageDraw, ImageFont
+
+from .cache import MISSING, render_cache
+from .layout import Placement
+
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPES = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+}
+
+BACKGROUND = '#FFFFFF'
+
+
+@functools.lru_cache(maxsize=32)
+def _font(size: int) -> ImageFont.FreeTypeFont:
+    if settings.WORDCLOUD_RENDER_FONT:
+        return ImageFont.truetype(settings.WORDCLOUD_RENDER_FONT, size)
+    return ImageFont.load_default(size=size)
+
+
+def render_png(width: int, height: int, placements: list[Placement]) -> bytes:
+    image = Image.new('RGB', (width, height), BACKGROUND)
+    for p in placements:
+        text = p.text.upper()
+        font = _font(p.size)
+        left, top, right, bottom = font.getbbox(text)
+        tile = Image.new('RGBA', (max(1, right - left), max(1, bottom - top)), (0, 0, 0, 0))
+        ImageDraw.Draw(tile).text((-left, -top), text, font=font, fill=p.color)
+        if p.rotation:
+            # Clockwise, as SVG's rotate() with y pointing down
+            tile = tile.rotate(-p.rotation, expand=True)
+        image.paste(tile, (p.x - tile.width // 2, p.y - tile.height // 2), tile)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
+
+
+def render_svg(width: int, height: int, placements: list[Placement]) -> bytes:
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">',
+        f'<rect width="100%" height="100%" fill="{BACKGROUND}"/>',
+    ]
+    for p in placements:
+        transform = f' transform="rotate({p.rotation} {p.x} {p.y})"' if p.rotation else ''
+        parts.append(
+            f'<text x="{p.x}" y="{p.y}" font-size="{p.size}" fill={quoteattr(p.color)}'
+            f' font-family="sans-serif" font-weight="bold" text-anchor="middle"'
+            f' dominant-baseline="central"{transform}>{escape(p.text.upper())}</text>'
+        )
+    parts.append('</svg>')
+    return '\n'.join(parts).encode('utf-8')
+
+
+RENDERERS = {
+    'png': render_png,
+    'svg': render_svg,
+}
+
+
+class RenderCache:
+    """Rendered cloud images by key, in memory (``render_cache``) and on disk.
+
+    Keys name an immutable image (cloud and version), so any process can reuse
+    a file another one wrote. Concurrent requests for a missing key wait for a
+    single render instead of each starting their own. The directory is capped
+    at ``max_files`` images, removing the oldest first.
+    """
+
+    def __init__(self, directory: str, *, max_files: int):
+        self.directory = Path(directory)
+        self.max_files = max(1, max_files)
+        self._lock = threading.Lock()
+        self._inflight: dict[str, list] = {}
+
+    def get(self, key: str, render) -> bytes:
+        # render() -> bytes, called at most once per key at a time in this process
+        body = render_cache.get(key)
+        if body is not MISSING:
+            return body
+
+        with self._lock:
+            entry = self._inflight.get(key)
+            if entry is None:
+                entry = self._inflight[key] = [threading.Lock(), 0]
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                body = render_cache.get(key)
+                if body is MISSING:
+                    body = self._read(key)
+                    if body is None:
+                        body = render()
+                        self._write(key, body)
+                    render_cache.set(key, body)
+                return body
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._inflight[key]
+
+    def _read(self, key: str) -> bytes | None:
+        try:
+            return (self.directory / key).read_bytes()
+        except OSError:
+            return None
+
+    def _write(self, key: str, body: bytes) -> None:
+        # The disk tier is best effort; a failed write only costs a later re-render
+        tmp = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, prefix='.tmp-')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(body)
+            os.replace(tmp, self.directory / key)
+            tmp = None
+            self._prune()
+        except OSError:
+            logger.exception('Writing cloud render %s failed', key)
+            if tmp is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp)
+
+    def _prune(self) -> None:
+        files = [entry for entry in os.scandir(self.directory) if entry.is_file() and not entry.name.startswith('.')]
+        if len(files) <= self.max_files:
+            return
+        files.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in files[: len(files) - self.max_files]:
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
+
+
+cloud_renders = RenderCache(settings.WORDCLOUD_RENDER_DIR, max_files=settings.WORDCLOUD_RENDER_MAX_FILES)
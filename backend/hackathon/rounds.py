@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from .cache import MISSING, round_token_cache
+from .models import GameRound
+
+
+@dataclass(frozen=True)
+class RoundRef:
+    id: int
+    status: str
+    question: str
+
+
+def resolve_share_token(share_token: str) -> RoundRef | None:
+    """The round a share token points at, from ``round_token_cache`` when possible"""
+    ref = round_token_cache.get(share_token)
+    if ref is not MISSING:
+        return ref
+
+    row = (
+        GameRound.objects.filter(share_token=share_token)
+        .values_list('id', 'status', 'question__text')
+        .first()
+    )
+    if row is None:
+        round_token_cache.set(share_token, None, settings.ROUND_TOKEN_NEGATIVE_CACHE_TTL_SECONDS)
+        return None
+    ref = RoundRef(*row)
+    round_token_cache.set(share_token, ref)
+    return ref
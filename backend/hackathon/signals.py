@@ -0,0 +1,92 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .cache import round_token_cache, session_cache
+from .counters import SAMPLE_WORD_COUNTER, increment_counter, increment_round_words, increment_user_score
+from .models import AnswerEvent, AppUserMember, AuthSession, GameRound, Response, ShareEvent, WordCloudResponse
+
+
+def _sample_contribution(word, count) -> dict[str, int]:
+    if not word or not count:
+        return {}
+    return {word: count}
+
+
+@receiver(pre_save, sender=WordCloudResponse)
+def remember_sample_contribution(sender, instance, raw=False, **kwargs):
+    if raw or instance.pk is None:
+        instance._sample_previous = {}
+        return
+    previous = WordCloudResponse.objects.filter(pk=instance.pk).values_list('word', 'count').first()
+    instance._sample_previous = _sample_contribution(*previous) if previous else {}
+
+
+@receiver(post_save, sender=WordCloudResponse)
+def update_sample_totals_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    increments = {word: -count for word, count in getattr(instance, '_sample_previous', {}).items()}
+    for word, count in _sample_contribution(instance.word, instance.count).items():
+        increments[word] = increments.get(word, 0) + count
+    increments = {word: n for word, n in increments.items() if n}
+    increment_counter(SAMPLE_WORD_COUNTER, increments)
+
+
+@receiver(post_delete, sender=WordCloudResponse)
+def update_sample_totals_on_delete(sender, instance, **kwargs):
+    increments = {word: -count for word, count in _sample_contribution(instance.word, instance.count).items()}
+    increment_counter(SAMPLE_WORD_COUNTER, increments)
+
+
+@receiver(post_save, sender=AnswerEvent)
+def count_answer_event(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        increment_user_score(instance.user_id, 'answer_count')
+
+
+@receiver(post_delete, sender=AnswerEvent)
+def uncount_answer_event(sender, instance, **kwargs):
+    increment_user_score(instance.user_id, 'answer_count', -1)
+
+
+@receiver(post_save, sender=ShareEvent)
+def count_share_event(sender, instance, created, raw=False, **kwargs):
+    if created and not raw and instance.player_id:
+        increment_user_score(instance.player_id, 'share_count')
+
+
+@receiver(post_delete, sender=ShareEvent)
+def uncount_share_event(sender, instance, **kwargs):
+    if instance.player_id:
+        increment_user_score(instance.player_id, 'share_count', -1)
+
+
+@receiver(post_save, sender=Response)
+def count_round_word(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        increment_round_words(instance.round_id, {instance.word: 1})
+
+
+@receiver(post_delete, sender=Response)
+def uncount_round_word(sender, instance, **kwargs):
+    increment_round_words(instance.round_id, {instance.word: -1})
+
+
+@receiver(post_save, sender=AuthSession)
+@receiver(post_delete, sender=AuthSession)
+def forget_cached_session(sender, instance, **kwargs):
+    # Covers revocation and expiry changes; QuerySet.update() callers discard the entry themselves.
+    session_cache.discard(instance.token_hash)
+
+
+@receiver(pre_save, sender=AppUserMember)
+def normalize_member_email(sender, instance, raw=False, **kwargs):
+    # bulk_create / bulk_update skip signals; callers using them set email_normalized themselves.
+    instance.email_normalized = AppUserMember.normalize_email(instance.email)
+
+
+@receiver(post_save, sender=GameRound)
+@receiver(post_delete, sender=GameRound)
+def forget_cached_round_token(sender, instance, **kwargs):
+    # Ending a round must stop this process accepting answers for it straight away.
+    round_token_cache.discard(instance.share_token)
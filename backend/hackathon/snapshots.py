@@ -0,0 +1,225 @@
+import gzip
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from .cache import MISSING, round_snapshot_cache
+from .counters import SAMPLE_WORD_COUNTER, WORD_COUNTER, counter_version, read_counter_totals
+from .models import RoundSnapshot
+
+
+@dataclass(frozen=True)
+class CloudSnapshot:
+    version: int
+    words: tuple[tuple[str, int], ...]
+    body: bytes
+
+
+@dataclass(frozen=True)
+class CloudChange:
+    from_version: int
+    to_version: int
+    words: dict[str, int]
+
+
+def _serialize_words(words) -> list[dict]:
+    return [{'text': text, 'frequency': frequency} for text, frequency in words]
+
+
+class VersionedCloud:
+    """Caches the serialized word cloud behind a counter version.
+
+    Each new snapshot is diffed against the previous one and the change set is
+    kept in a bounded ring, so clients that are a few versions behind can be
+    sent just the words that changed.
+    """
+
+    def __init__(self, name: str, loader, *, history: int):
+        # loader() -> [(text, frequency), ...] in display order
+        self.name = name
+        self.loader = loader
+        self._lock = threading.Lock()
+        self._latest: CloudSnapshot | None = None
+        self._changes: deque[CloudChange] = deque(maxlen=max(1, history))
+        self._delta_bodies: dict[int, bytes] = {}
+
+    def current_version(self) -> int:
+        return counter_version(self.name)
+
+    def etag(self, version: int) -> str:
+        return f'"{self.name}-{version}"'
+
+    def snapshot(self, version: int | None = None) -> CloudSnapshot:
+        if version is None:
+            version = self.current_version()
+
+        latest = self._latest
+        if latest is not None and latest.version >= version:
+            return latest
+
+        with self._lock:
+            latest = self._latest
+            if latest is not None and latest.version >= version:
+                return latest
+
+            words = tuple(self.loader())
+            body = json.dumps({'version': version, 'full': True, 'words': _serialize_words(words)}).encode('utf-8')
+            snapshot = CloudSnapshot(version=version, words=words, body=body)
+
+            if latest is not None:
+                previous = dict(latest.words)
+                current = dict(words)
+                changed = {text: frequency for text, frequency in words if previous.get(text) != frequency}
+                changed.update({text: 0 for text in previous.keys() - current.keys()})
+                self._changes.append(CloudChange(latest.version, version, changed))
+
+            self._latest = snapshot
+            self._delta_bodies = {}
+            return snapshot
+
+    def delta(self, since: int, version: int | None = None) -> bytes:
+        snapshot = self.snapshot(version)
+
+        with self._lock:
+            if snapshot is not self._latest:
+                return snapshot.body
+
+            cached = self._delta_bodies.get(since)
+            if cached is not None:
+                return cached
+
+            if since == snapshot.version:
+                changed: dict[str, int] | None = {}
+            elif since > snapshot.version or not self._changes or self._changes[0].from_version > since:
+                changed = None
+            else:
+                # Change sets may span versions this process never saw; merging every set that ends
+                # after ``since`` can resend a few unchanged words but never misses one.
+                changed = {}
+                for change in self._changes:
+                    if change.to_version > since:
+                        changed.update(change.words)
+
+            if changed is None:
+                body = snapshot.body
+            else:
+                words = sorted(changed.items(), key=lambda item: (-item[1], item[0]))
+                body = json.dumps(
+                    {'version': snapshot.version, 'since': since, 'full': False, 'words': _serialize_words(words)}
+                ).encode('utf-8')
+
+            if len(self._delta_bodies) < self._changes.maxlen:
+                self._delta_bodies[since] = body
+            return body
+
+
+@dataclass(frozen=True)
+class FrozenRound:
+    etag: str
+    body_gz: bytes
+    data: dict
+
+
+def _frozen_from_row(row: RoundSnapshot) -> FrozenRound:
+    body_gz = bytes(row.body_gz)
+    return FrozenRound(etag=row.etag, body_gz=body_gz, data=json.loads(gzip.decompress(body_gz)))
+
+
+def freeze_round(round_id: int, payload: dict) -> FrozenRound:
+    """Store ``payload`` as the round's immutable snapshot and cache it.
+
+    The first snapshot written for a round wins; later calls return it unchanged.
+    """
+    body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    etag = f'"round-{round_id}-{hashlib.sha1(body).hexdigest()[:16]}"'
+    row, _ = RoundSnapshot.objects.get_or_create(
+        round_id=round_id,
+        defaults={'body_gz': gzip.compress(body, mtime=0), 'etag': etag},
+    )
+    frozen = _frozen_from_row(row)
+    round_snapshot_cache.set(round_id, frozen)
+    return frozen
+
+
+def frozen_round(round_id: int) -> FrozenRound | None:
+    frozen = round_snapshot_cache.get(round_id)
+    if frozen is not MISSING:
+        return frozen
+    row = RoundSnapshot.objects.filter(round_id=round_id).first()
+    if row is None:
+        return None
+    frozen = _frozen_from_row(row)
+    round_snapshot_cache.set(round_id, frozen)
+    return frozen
+
+
+@dataclass(frozen=True)
+class SharedSnapshot:
+    version: str
+    body: bytes
+    built_at: float
+
+
+class SharedSnapshots:
+    """Builds each key's JSON body at most once per ``interval`` seconds per
+    process and hands the same bytes to every caller in that window.
+
+    Callers that arrive while a key is being rebuilt wait for that build
+    rather than starting their own. ``version`` is a hash of the payload, so
+    it is the same in every process for the same data and can back ETags.
+    """
+
+    def __init__(self, build, *, interval: float, maxsize: int):
+        # build(key) -> payload dict; exceptions propagate and nothing is cached
+        self.build = build
+        self.interval = interval
+        self.maxsize = max(1, maxsize)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key) -> SharedSnapshot:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = [threading.Lock(), None]
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(key)
+
+        snapshot = entry[1]
+        if snapshot is not None and time.monotonic() - snapshot.built_at < self.interval:
+            return snapshot
+
+        with entry[0]:
+            snapshot = entry[1]
+            if snapshot is not None and time.monotonic() - snapshot.built_at < self.interval:
+                return snapshot
+            payload = self.build(key)
+            version = hashlib.sha1(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+            body = json.dumps({'version': version, **payload}).encode('utf-8')
+            snapshot = entry[1] = SharedSnapshot(version=version, body=body, built_at=time.monotonic())
+            return snapshot
+
+
+def _top_sample_words() -> list[tuple[str, int]]:
+    model = SAMPLE_WORD_COUNTER.model
+    top = model.objects.filter(total__gt=0).order_by('-total', 'word').values_list('word', 'total')
+    return list(top[: settings.SAMPLE_WORDCLOUD_LIMIT])
+
+
+word_cloud = VersionedCloud(
+    WORD_COUNTER.name,
+    lambda: read_counter_totals(WORD_COUNTER),
+    history=settings.WORDCLOUD_DELTA_HISTORY,
+)
+sample_word_cloud = VersionedCloud(
+    SAMPLE_WORD_COUNTER.name,
+    _top_sample_words,
+    history=settings.WORDCLOUD_DELTA_HISTORY,
+)
@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import threading
+from contextlib import contextmanager
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+
+logger = logging.getLogger(__name__)
+
+
+def _fetch_in_thread(fetch, since):
+    close_old_connections()
+    try:
+        return fetch(since)
+    finally:
+        close_old_connections()
+
+
+def format_event(token, body: bytes) -> bytes:
+    return b'id: ' + str(token).encode('utf-8') + b'\ndata: ' + body + b'\n\n'
+
+
+class _Topic:
+    def __init__(self, fetch):
+        # fetch(since) -> (token, body); ``since`` is the last token a subscriber saw or None.
+        self.fetch = fetch
+        self.token = None
+        self.bodies: dict = {}
+        self.subscribers: set[asyncio.Event] = set()
+        self.lock = asyncio.Lock()
+
+    async def body_for(self, since):
+        async with self.lock:
+            if since not in self.bodies:
+                token, body = await sync_to_async(_fetch_in_thread, thread_sensitive=False)(self.fetch, since)
+                if token != self.token:
+                    self.token = token
+                    self.bodies = {}
+                    self.wake_all()
+                self.bodies[since] = body
+            return self.token, self.bodies[since]
+
+    async def refresh(self) -> None:
+        async with self.lock:
+            token, body = await sync_to_async(_fetch_in_thread, thread_sensitive=False)(self.fetch, None)
+            if token == self.token:
+                return
+            self.token = token
+            self.bodies = {None: body}
+            self.wake_all()
+
+    def wake_all(self) -> None:
+        for wake in self.subscribers:
+            wake.set()
+
+
+class Broadcaster:
+    """Shares one polling loop per process across every connected stream.
+
+    Each topic is refreshed at most once per ``interval`` seconds no matter how
+    many clients are subscribed, and every subscriber is woken when its token
+    changes. Subscribers that were asleep for several changes get one event
+    built from the last token they saw, so updates are coalesced.
+    """
+
+    def __init__(self, *, interval: float, keepalive: float):
+        self.interval = interval
+        self.keepalive = keepalive
+        self._topics: dict[str, _Topic] = {}
+        self._task: asyncio.Task | None = None
+
+    async def subscribe(self, key: str, fetch, since=None):
+        """Yields ``(token, body)`` for the current state and then for every
+        change, and ``None`` after each ``keepalive`` seconds without one.
+        """
+        topic = self._topics.get(key)
+        if topic is None:
+            topic = self._topics[key] = _Topic(fetch)
+
+        wake = asyncio.Event()
+        topic.subscribers.add(wake)
+        self._ensure_running()
+
+        try:
+            token, body = await topic.body_for(since)
+            yield token, body
+            sent = token
+
+            while True:
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=self.keepalive)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+
+                wake.clear()
+                if topic.token == sent:
+                    continue
+                token, body = await topic.body_for(sent)
+                yield token, body
+                sent = token
+        finally:
+            topic.subscribers.discard(wake)
+            if not topic.subscribers and self._topics.get(key) is topic:
+                del self._topics[key]
+
+    async def stream(self, key: str, fetch, since=None):
+        events = self.subscribe(key, fetch, since)
+        try:
+            async for event in events:
+                yield b': keepalive\n\n' if event is None else format_event(*event)
+        finally:
+            await events.aclose()
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while self._topics:
+            await asyncio.sleep(self.interval)
+            for key, topic in list(self._topics.items()):
+                if not topic.subscribers:
+                    continue
+                try:
+                    await topic.refresh()
+                except Exception:
+                    logger.exception('Refreshing stream topic %s failed', key)
+
+
+class _Listener:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.event = asyncio.Event()
+
+    async def wait(self, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(self.event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        self.event.clear()
+        return True
+
+
+class Notifier:
+    """Wakes coroutines waiting on a key; ``notify`` may be called from any thread.
+
+    Listen before reading the state being waited on, so a notification that
+    lands between the read and the wait is not lost. Only listeners in this
+    process are woken.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._listeners: dict[str, set[_Listener]] = {}
+
+    @contextmanager
+    def listen(self, key: str):
+        listener = _Listener(asyncio.get_running_loop())
+        with self._lock:
+            self._listeners.setdefault(key, set()).add(listener)
+        try:
+            yield listener
+        finally:
+            with self._lock:
+                listeners = self._listeners.get(key)
+                if listeners is not None:
+                    listeners.discard(listener)
+                    if not listeners:
+                        del self._listeners[key]
+
+    def notify(self, key: str) -> None:
+        with self._lock:
+            listeners = list(self._listeners.get(key, ()))
+        for listener in listeners:
+            listener.loop.call_soon_threadsafe(listener.event.set)
+
+
+broadcaster = Broadcaster(
+    interval=settings.STREAM_PUSH_INTERVAL_MS / 1000,
+    keepalive=settings.STREAM_KEEPALIVE_SECONDS,
+)
+
+# user_id -> long-polling /api/user-score requests
+score_notifier = Notifier()
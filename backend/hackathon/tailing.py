@@ -0,0 +1,36 @@
+class RowTail:
+    """Returns each row of a growing table once, in id order, across repeated reads.
+
+    Ids are handed out when a row is inserted but the row only becomes visible
+    when its transaction commits, so concurrent writers can make a lower id
+    appear after a higher one was already read. Every read therefore re-scans
+    the last ``lookback`` ids below the highest one seen and returns the rows in
+    that window it has not returned before. A row committed more than
+    ``lookback`` ids late is still missed; callers that must be exact rebuild
+    from scratch now and then.
+    """
+
+    def __init__(self, lookback: int):
+        self.lookback = max(0, lookback)
+        self.last_id = 0
+        # Ids above the window floor that were already returned
+        self._seen: set[int] = set()
+
+    def read(self, queryset, *fields, batch_size: int) -> list[tuple]:
+        """New rows as ``(id, *fields)`` tuples"""
+        # Each batch holds at most ``lookback`` re-scanned rows, so it must be larger to make progress
+        batch_size = max(batch_size, self.lookback + 1)
+        fresh: list[tuple] = []
+        while True:
+            floor = max(0, self.last_id - self.lookback)
+            rows = list(queryset.filter(id__gt=floor).order_by('id').values_list('id', *fields)[:batch_size])
+            for row in rows:
+                if row[0] not in self._seen:
+                    self._seen.add(row[0])
+                    fresh.append(row)
+            if rows:
+                self.last_id = max(self.last_id, rows[-1][0])
+                floor = self.last_id - self.lookback
+                self._seen = {row_id for row_id in self._seen if row_id > floor}
+            if len(rows) < batch_size:
+                return fresh
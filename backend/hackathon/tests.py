@@ -1,3 +1,1008 @@
-from django.test import TestCase
+import asyncio
+import csv
+import io
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from PIL import Image
+
+from . import views
+from .auth import PasswordHasher, PasswordHasherBusy, check_password, hash_session_token, password_needs_rehash
+from .otp_gateway import CircuitBreaker, CircuitOpenError, GatewayClient, GatewayError
+from .otp_stub import StubGateway
+from .cache import MISSING, TTLCache, render_cache, session_cache
+from .counters import (
+    WORD_COUNTER,
+    CounterBacklogFull,
+    WriteBehindCounter,
+    increment_counter,
+    increment_round_words,
+    read_counter_totals,
+)
+from .layout import SIZE_STEP, CloudLayouts, Placement, SpiralLayout, _box, spiral_layout
+from .leaderboard import IndexableSkiplist, RankedLeaderboard, RoundLeaderboards, exact_leaderboard, warm_round_leaderboards
+from .models import (
+    AnswerEvent,
+    AppUser,
+    AppUserMember,
+    AuthSession,
+    GameRound,
+    Question,
+    Response,
+    SampleWordTotal,
+    ShareEvent,
+    UserScore,
+    WordCloud,
+    WordCloudResponse,
+    WordCloudRound,
+    WordFrequencyByRound,
+)
+from .passwords import PBKDF2_ITERATIONS, hash_password
+from .render import RenderCache, cloud_renders, render_png, render_svg
+from .snapshots import SharedSnapshots, VersionedCloud
+from .streams import Broadcaster, Notifier
+
+
+RESET_TIMEOUT = 0.2
+SEND = {'GenerateOTP': 'yes', 'type': 'whatsapp', 'email_mobile': '9999999999'}
+
+
+def verify(otp: str) -> dict:
+    return {'login_verfication': 'yes', 'email_mobile': '9999999999', 'otp': otp, 'password': ''}
+
+
+class GatewayTestCase(SimpleTestCase):
+    def setUp(self):
+        self.stub = StubGateway(otp='654321').start()
+        self.addCleanup(self.stub.stop)
+
+    def gateway(self, *, failure_threshold: int = 2, timeout: float = 2.0) -> GatewayClient:
+        breaker = CircuitBreaker(failure_threshold=failure_threshold, reset_timeout=RESET_TIMEOUT)
+        gateway = GatewayClient(self.stub.url, timeout=timeout, pool_size=4, breaker=breaker)
+        self.addCleanup(gateway.close)
+        return gateway
+
+    def trip(self, gateway: GatewayClient) -> None:
+        self.stub.fail_rate = 1.0
+        for _ in range(gateway.breaker.failure_threshold):
+            with self.assertRaises(GatewayError):
+                gateway.post(SEND)
+        self.assertEqual(gateway.breaker.state, 'open')
+
+
+class GatewayClientTests(GatewayTestCase):
+    def test_send_and_verify(self):
+        gateway = self.gateway()
+        self.assertEqual(gateway.post(SEND), {'status': 'success'})
+        self.assertEqual(gateway.post(verify('654321')), {'status': 'success'})
+        self.assertEqual(gateway.post(verify('000000')), {'status': 'failed'})
+        self.assertEqual(self.stub.requests, 3)
+        self.assertEqual(gateway.breaker.state, 'closed')
+
+    def test_post_async(self):
+        gateway = self.gateway()
+        self.assertEqual(asyncio.run(gateway.post_async(SEND)), {'status': 'success'})
+
+    def test_slow_gateway_times_out(self):
+        self.stub.latency = 0.5
+        gateway = self.gateway(timeout=0.1)
+        with self.assertRaisesMessage(GatewayError, 'timed out'):
+            gateway.post(SEND)
+
+    def test_stub_counts_concurrent_requests(self):
+        gateway = self.gateway(failure_threshold=100)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: gateway.post(SEND), range(40)))
+        self.assertEqual(self.stub.requests, 40)
+
+
+class CircuitBreakerTests(GatewayTestCase):
+    def test_opens_after_consecutive_failures(self):
+        gateway = self.gateway(failure_threshold=3)
+        self.trip(gateway)
+
+        with self.assertRaises(CircuitOpenError):
+            gateway.post(SEND)
+        # Rejected without reaching the gateway
+        self.assertEqual(self.stub.requests, 3)
+
+    def test_success_resets_failure_count(self):
+        gateway = self.gateway(failure_threshold=2)
+        self.stub.fail_rate = 1.0
+        with self.assertRaises(GatewayError):
+            gateway.post(SEND)
+        self.stub.fail_rate = 0.0
+        gateway.post(SEND)
+        self.stub.fail_rate = 1.0
+        with self.assertRaises(GatewayError):
+            gateway.post(SEND)
+        self.assertEqual(gateway.breaker.state, 'closed')
+
+    def test_half_open_trial_success_closes(self):
+        gateway = self.gateway()
+        self.trip(gateway)
+        time.sleep(RESET_TIMEOUT * 1.5)
+        self.assertEqual(gateway.breaker.state, 'half-open')
+
+        self.stub.fail_rate = 0.0
+        self.assertEqual(gateway.post(SEND), {'status': 'success'})
+        self.assertEqual(gateway.breaker.state, 'closed')
+
+    def test_failed_trial_reopens(self):
+        gateway = self.gateway(failure_threshold=3)
+        self.trip(gateway)
+        time.sleep(RESET_TIMEOUT * 1.5)
+
+        # A single failed trial is enough, whatever the threshold
+        with self.assertRaises(GatewayError) as cm:
+            gateway.post(SEND)
+        self.assertNotIsInstance(cm.exception, CircuitOpenError)
+        self.assertEqual(gateway.breaker.state, 'open')
+        self.assertEqual(self.stub.requests, 4)
+
+        with self.assertRaises(CircuitOpenError):
+            gateway.post(SEND)
+        self.assertEqual(self.stub.requests, 4)
+
+    def test_unexpected_error_ends_the_trial(self):
+        gateway = self.gateway()
+        self.trip(gateway)
+        time.sleep(RESET_TIMEOUT * 1.5)
+
+        with mock.patch.object(gateway._pool, 'request', side_effect=ValueError('bad payload')):
+            with self.assertRaises(ValueError):
+                gateway.post(SEND)
+        self.assertEqual(gateway.breaker.state, 'open')
+
+        # The trial was released, so the next one goes through and closes the circuit
+        time.sleep(RESET_TIMEOUT * 1.5)
+        self.stub.fail_rate = 0.0
+        self.assertEqual(gateway.post(SEND), {'status': 'success'})
+        self.assertEqual(gateway.breaker.state, 'closed')
+
+    def test_one_trial_at_a_time(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=RESET_TIMEOUT)
+        breaker.record_failure()
+        time.sleep(RESET_TIMEOUT * 1.5)
+
+        breaker.before_call()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_success()
+        breaker.before_call()
+
+
+class PasswordHasherTests(SimpleTestCase):
+    def test_check_password(self):
+        salt_b64, password_hash_b64, iterations = hash_password('hunter2', iterations=1000)
+        self.assertTrue(check_password('hunter2', salt_b64=salt_b64, password_hash_b64=password_hash_b64, iterations=iterations))
+        self.assertFalse(check_password('hunter3', salt_b64=salt_b64, password_hash_b64=password_hash_b64, iterations=iterations))
+
+    def test_needs_rehash(self):
+        self.assertFalse(password_needs_rehash(PBKDF2_ITERATIONS))
+        self.assertTrue(password_needs_rehash(1000))
+
+    def test_full_pool_fails_fast(self):
+        hasher = PasswordHasher(workers=1, max_queued=1)
+        release = threading.Event()
+        running = [hasher.submit(release.wait), hasher.submit(release.wait)]
+        with self.assertRaises(PasswordHasherBusy):
+            hasher.submit(release.wait)
+
+        release.set()
+        for future in running:
+            future.result(timeout=5)
+        # Slots are handed back by done-callbacks, which may run just after result() returns
+        deadline = time.monotonic() + 5
+        while True:
+            try:
+                self.assertEqual(hasher.run(lambda: 'done'), 'done')
+                break
+            except PasswordHasherBusy:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.01)
+
+
+class IndexableSkiplistTests(SimpleTestCase):
+    def test_insert_rank_and_slice(self):
+        keys = list(range(0, 200, 2))
+        skiplist = IndexableSkiplist()
+        for key in reversed(keys):
+            skiplist.insert(key)
+        self.assertEqual(len(skiplist), 100)
+        self.assertEqual(skiplist.slice(0, 100), keys)
+        self.assertEqual(skiplist.slice(10, 13), [20, 22, 24])
+        self.assertEqual(skiplist.slice(98, 500), [196, 198])
+        self.assertEqual(skiplist.slice(-5, 2), [0, 2])
+        self.assertEqual(skiplist.slice(7, 7), [])
+        for i, key in enumerate(keys):
+            self.assertEqual(skiplist.rank(key), i)
+        with self.assertRaises(KeyError):
+            skiplist.rank(3)
+
+    def test_remove(self):
+        skiplist = IndexableSkiplist()
+        for key in range(50):
+            skiplist.insert(key)
+        for key in range(0, 50, 3):
+            skiplist.remove(key)
+        remaining = [key for key in range(50) if key % 3]
+        self.assertEqual(len(skiplist), len(remaining))
+        self.assertEqual(skiplist.slice(0, 50), remaining)
+        self.assertEqual([skiplist.rank(key) for key in remaining], list(range(len(remaining))))
+        with self.assertRaises(KeyError):
+            skiplist.remove(3)
+        with self.assertRaises(KeyError):
+            skiplist.remove(99)
+
+    def test_ties_rank_by_player_id(self):
+        board = RankedLeaderboard()
+        for player_id, delta in (('cat', 2), ('ann', 2), ('bob', 3), ('dan', 1), ('ann', -1), ('dan', 1)):
+            board.add(player_id, delta)
+        self.assertEqual(
+            board.page(),
+            [
+                {'rank': 1, 'player_id': 'bob', 'score': 3},
+                {'rank': 2, 'player_id': 'cat', 'score': 2},
+                {'rank': 3, 'player_id': 'dan', 'score': 2},
+                {'rank': 4, 'player_id': 'ann', 'score': 1},
+            ],
+        )
+        self.assertEqual(board.page(1, 2), board.page()[1:3])
+        self.assertEqual(board.rank_of('dan'), {'rank': 3, 'player_id': 'dan', 'score': 2})
+        self.assertIsNone(board.rank_of('eve'))
+
+
+class WriteBehindCounterTests(SimpleTestCase):
+    def counter(self, flush_fn=None, *, max_pending: int = 3, flush_interval: float = 0, max_backlog: int = 10):
+        self.flushed: list[dict[str, int]] = []
+        counter = WriteBehindCounter(
+            flush_fn or self.flushed.append,
+            max_pending=max_pending,
+            flush_interval=flush_interval,
+            max_backlog=max_backlog,
+        )
+        self.addCleanup(counter.close)
+        return counter
+
+    def test_flushes_when_full(self):
+        counter = self.counter()
+        counter.add('go')
+        counter.add('rust')
+        self.assertEqual(self.flushed, [])
+        counter.add('go')
+        self.assertEqual(self.flushed, [{'go': 2, 'rust': 1}])
+        self.assertEqual(counter.pending_total, 0)
+
+    def test_flushes_on_interval(self):
+        counter = self.counter(max_pending=100, flush_interval=0.05)
+        counter.add('go', 2)
+        deadline = time.monotonic() + 5
+        while not self.flushed and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.flushed, [{'go': 2}])
+
+    def test_failed_flush_keeps_increments_until_backlog_is_full(self):
+        fail = True
+
+        def flush(batch):
+            if fail:
+                raise ConnectionError('database unreachable')
+            self.flushed.append(batch)
+
+        counter = self.counter(flush, max_pending=2, max_backlog=4)
+        with self.assertLogs('hackathon.counters', 'ERROR'):
+            for word in ('go', 'go', 'rust', 'zig'):
+                counter.add(word)
+        self.assertEqual(counter.pending_total, 4)
+        with self.assertRaises(CounterBacklogFull):
+            counter.add('go')
+
+        fail = False
+        self.assertEqual(counter.flush(), 4)
+        self.assertEqual(self.flushed, [{'go': 2, 'rust': 1, 'zig': 1}])
+
+    def test_full_backlog_answers_503(self):
+        counter = self.counter(mock.Mock(side_effect=ConnectionError), max_pending=1, max_backlog=1)
+        with self.assertLogs('hackathon.counters', 'ERROR'):
+            counter.add('go')
+        with mock.patch.object(views, 'word_frequencies', counter):
+            response = self.client.post('/api/submit-answer', {'answer': 'python'}, content_type='application/json')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(counter.pending_total, 1)
+        counter.flush_fn = self.flushed.append
+
+
+class TTLCacheTests(SimpleTestCase):
+    def test_none_is_cached_apart_from_a_miss(self):
+        cache = TTLCache(maxsize=4, ttl=60)
+        self.assertIs(cache.get('token'), MISSING)
+        cache.set('token', None)
+        self.assertIsNone(cache.get('token'))
+        cache.discard('token')
+        self.assertIs(cache.get('token'), MISSING)
+
+    def test_least_recently_used_is_evicted(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertEqual((cache.get('a'), cache.get('b'), cache.get('c')), (1, MISSING, 3))
+
+    def test_entries_expire(self):
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set('short', 1, ttl=0.05)
+        cache.set('long', 2)
+        # ttl <= 0 stores nothing, e.g. a session that has already expired
+        cache.set('expired', 3, ttl=0)
+        time.sleep(0.1)
+        self.assertIs(cache.get('short'), MISSING)
+        self.assertIs(cache.get('expired'), MISSING)
+        self.assertEqual(cache.get('long'), 2)
+
+
+class BroadcasterTests(SimpleTestCase):
+    def setUp(self):
+        self.state = {'token': 1, 'body': b'one'}
+        self.fetches = []
+
+    def fetch(self, since):
+        self.fetches.append(since)
+        return self.state['token'], self.state['body']
+
+    async def test_subscribers_share_each_refresh(self):
+        broadcaster = Broadcaster(interval=0.02, keepalive=5)
+        first = broadcaster.subscribe('cloud', self.fetch)
+        second = broadcaster.subscribe('cloud', self.fetch)
+        self.assertEqual(await anext(first), (1, b'one'))
+        self.assertEqual(await anext(second), (1, b'one'))
+
+        self.state.update(token=2, body=b'two')
+        self.assertEqual(await asyncio.wait_for(anext(first), 5), (2, b'two'))
+        self.assertEqual(await asyncio.wait_for(anext(second), 5), (2, b'two'))
+        # The event built from token 1 is fetched once and sent to both subscribers
+        self.assertEqual(self.fetches[0], None)
+        self.assertEqual(self.fetches.count(1), 1)
+
+        await first.aclose()
+        await second.aclose()
+        self.assertEqual(broadcaster._topics, {})
+
+    async def test_resumes_from_the_last_event_id(self):
+        broadcaster = Broadcaster(interval=60, keepalive=5)
+        events = broadcaster.subscribe('cloud', self.fetch, since=0)
+        self.assertEqual(await anext(events), (1, b'one'))
+        self.assertEqual(self.fetches, [0])
+        await events.aclose()
+
+    async def test_idle_streams_send_keepalives(self):
+        broadcaster = Broadcaster(interval=60, keepalive=0.05)
+        stream = broadcaster.stream('cloud', self.fetch)
+        self.assertEqual(await anext(stream), b'id: 1\ndata: one\n\n')
+        self.assertEqual(await asyncio.wait_for(anext(stream), 5), b': keepalive\n\n')
+        await stream.aclose()
+
+    def test_streams_need_asgi(self):
+        self.assertEqual(self.client.get('/api/wordcloud/stream').status_code, 503)
+
+
+class SharedSnapshotsTests(SimpleTestCase):
+    def test_concurrent_callers_share_one_build(self):
+        builds = []
+
+        def build(key):
+            builds.append(key)
+            time.sleep(0.05)
+            return {'key': key}
+
+        snapshots = SharedSnapshots(build, interval=60, maxsize=4)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(snapshots.get, [1] * 8))
+        self.assertEqual(builds, [1])
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_rebuilt_after_the_interval(self):
+        payload = {'count': 1}
+        snapshots = SharedSnapshots(lambda key: dict(payload), interval=0.05, maxsize=4)
+        first = snapshots.get(1)
+        time.sleep(0.1)
+        # Same payload, same version, so ETags survive a rebuild
+        self.assertEqual(snapshots.get(1).version, first.version)
+        payload['count'] = 2
+        time.sleep(0.1)
+        self.assertNotEqual(snapshots.get(1).version, first.version)
+
+    def test_failed_build_is_not_cached(self):
+        build = mock.Mock(side_effect=[LookupError, {'ok': True}])
+        snapshots = SharedSnapshots(build, interval=60, maxsize=4)
+        with self.assertRaises(LookupError):
+            snapshots.get(1)
+        self.assertIn(b'"ok": true', snapshots.get(1).body)
+
+
+class SpiralLayoutTests(SimpleTestCase):
+    def setUp(self):
+        self.engine = SpiralLayout(width=400, height=300, max_words=20, min_size=12, max_size=48)
+        self.words = [(f'WORD{i}', 30 - i) for i in range(12)]
+
+    @staticmethod
+    def overlap(a, b) -> bool:
+        a, b = _box(a), _box(b)
+        return a[0] < b[2] and a[2] > b[0] and a[1] < b[3] and a[3] > b[1]
+
+    def assert_fits(self, placements):
+        for i, p in enumerate(placements):
+            x0, y0, x1, y1 = _box(p)
+            self.assertTrue(0 <= x0 and 0 <= y0 and x1 <= 400 and y1 <= 300, p)
+            for other in placements[i + 1 :]:
+                self.assertFalse(self.overlap(p, other), (p.text, other.text))
+
+    def test_words_do_not_overlap(self):
+        placements = self.engine.layout(self.words)
+        self.assert_fits(placements)
+        self.assertEqual(placements[0].text, 'WORD0')
+        self.assertEqual(placements[0].size, 48)
+        self.assertTrue(all((p.size - 12) % SIZE_STEP == 0 for p in placements))
+
+    def test_only_the_top_words_are_placed(self):
+        engine = SpiralLayout(width=400, height=300, max_words=3, min_size=12, max_size=48)
+        placements = engine.layout([*self.words, ('NEVER', 0)])
+        self.assertEqual([p.text for p in placements], ['WORD0', 'WORD1', 'WORD2'])
+
+    def test_relayout_only_moves_displaced_words(self):
+        before = {p.text: p for p in self.engine.layout(self.words)}
+        bumped = [(text, 25 if text == 'WORD11' else frequency) for text, frequency in self.words]
+        after = {p.text: p for p in self.engine.layout(bumped, before)}
+        self.assert_fits(list(after.values()))
+        self.assertGreater(after['WORD11'].size, before['WORD11'].size)
+
+        # Any other word that moved had its old spot taken by a word placed this time
+        for text, p in after.items():
+            if text == 'WORD11' or text not in before or (p.x, p.y) == (before[text].x, before[text].y):
+                continue
+            self.assertTrue(any(self.overlap(before[text], other) for other in after.values() if other.text != text), text)
+
+
+class RenderTests(SimpleTestCase):
+    placements = [
+        Placement(text='go', frequency=3, x=100, y=60, size=32, rotation=0, color='#FF1493'),
+        Placement(text='<c&d>', frequency=1, x=40, y=60, size=16, rotation=90, color='#008000'),
+    ]
+
+    def setUp(self):
+        render_cache.clear()
+        self.addCleanup(render_cache.clear)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def test_svg(self):
+        svg = render_svg(200, 120, self.placements).decode('utf-8')
+        self.assertIn('width="200" height="120"', svg)
+        self.assertIn('>GO</text>', svg)
+        self.assertIn('>&lt;C&amp;D&gt;</text>', svg)
+        self.assertIn('transform="rotate(90 40 60)"', svg)
+
+    def test_png(self):
+        png = render_png(200, 120, self.placements)
+        with Image.open(io.BytesIO(png)) as image:
+            self.assertEqual((image.format, image.size), ('PNG', (200, 120)))
+
+    def test_each_key_is_rendered_once(self):
+        renders = RenderCache(self.directory, max_files=8)
+        render = mock.Mock(return_value=b'<svg/>')
+
+        def slow_render():
+            time.sleep(0.05)
+            return render()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            bodies = list(pool.map(lambda _: renders.get('word-1.svg', slow_render), range(4)))
+        self.assertEqual(bodies, [b'<svg/>'] * 4)
+        self.assertEqual(render.call_count, 1)
+
+        # Another process (an empty memory tier) reuses the file on disk
+        render_cache.clear()
+        self.assertEqual(RenderCache(self.directory, max_files=8).get('word-1.svg', render), b'<svg/>')
+        self.assertEqual(render.call_count, 1)
+
+    def test_directory_keeps_the_newest_files(self):
+        renders = RenderCache(self.directory, max_files=2)
+        for version in range(1, 4):
+            renders.get(f'word-{version}.svg', lambda: b'<svg/>')
+            os.utime(self.directory / f'word-{version}.svg', (version, version))
+        self.assertEqual(sorted(os.listdir(self.directory)), ['word-2.svg', 'word-3.svg'])
+
+
+class NotifierTests(SimpleTestCase):
+    async def test_notify_from_another_thread_wakes_listeners(self):
+        notifier = Notifier()
+        with notifier.listen('7') as listener, notifier.listen('8') as other:
+            threading.Thread(target=notifier.notify, args=('7',)).start()
+            self.assertTrue(await listener.wait(5))
+            self.assertFalse(await other.wait(0.05))
+        self.assertEqual(notifier._listeners, {})
+
+
+@override_settings(USER_SCORE_RECHECK_SECONDS=30)
+class UserScoreLongPollTests(SimpleTestCase):
+    def setUp(self):
+        # The score read runs in a worker thread, outside the test's database connection
+        self.scores = {'7': 3}
+        patcher = mock.patch.object(views, '_read_user_score', lambda user_id: self.scores.get(user_id, 0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def get_score(self, **params) -> dict:
+        response = await self.async_client.get('/api/user-score', {'user_id': '7', **params})
+        return response.json()
+
+    async def test_changed_score_answers_straight_away(self):
+        self.assertEqual(await self.get_score(), {'total_score': 3})
+        self.assertEqual(await self.get_score(since=1, wait=10), {'total_score': 3})
+
+    async def test_held_until_notified(self):
+        async def score_later():
+            await asyncio.sleep(0.1)
+            self.scores['7'] = 4
+            views.score_notifier.notify('7')
+
+        started = time.monotonic()
+        body, _ = await asyncio.gather(self.get_score(since=3, wait=10), score_later())
+        self.assertEqual(body, {'total_score': 4})
+        self.assertLess(time.monotonic() - started, 5)
+
+    async def test_unchanged_score_waits_out_the_timeout(self):
+        started = time.monotonic()
+        self.assertEqual(await self.get_score(since=3, wait=0.2), {'total_score': 3})
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+
+    def test_wait_is_answered_straight_away_under_wsgi(self):
+        started = time.monotonic()
+        response = self.client.get('/api/user-score', {'user_id': '7', 'since': 3, 'wait': 10})
+        self.assertEqual(response.json(), {'total_score': 3})
+        self.assertLess(time.monotonic() - started, 5)
+
+
+class HackathonTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Unmanaged tables are not created by the test runner
+        existing = connection.introspection.table_names()
+        with connection.schema_editor() as editor:
+            for model in (Question, WordCloud):
+                if model._meta.db_table not in existing:
+                    editor.create_model(model)
+        super().setUpClass()
+
+
+class ImportTeamsTestCase(HackathonTestCase):
+    stream = False
+
+    def import_csv(self, rows: list[tuple[int, str, str]], **options) -> str:
+        fd, path = tempfile.mkstemp(suffix='.csv')
+        self.addCleanup(os.unlink, path)
+        with os.fdopen(fd, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Team No.', 'Member ID', 'Name', 'Email', 'Phone'])
+            for team_no, member_id, name in rows:
+                writer.writerow([f'Team {team_no}', member_id, name, f'{member_id.lower()}@example.com', f'9{member_id[1:]:0>9}'])
+        out = io.StringIO()
+        call_command('import_teams', csv=path, stream=self.stream, workers=1, stdout=out, stderr=io.StringIO(), **options)
+        return out.getvalue()
+
+    def members(self) -> dict[str, tuple[int, str]]:
+        return {m.member_id: (m.user.team_no, m.name) for m in AppUserMember.objects.select_related('user')}
+
+
+class ImportTeamsTests(ImportTeamsTestCase):
+    def test_reimport_updates_in_place(self):
+        rows = [(1, 'M1', 'Ann'), (1, 'M2', 'Bea'), (2, 'M3', 'Cid')]
+        out = self.import_csv(rows)
+        self.assertIn('Teams: 2 created, 0 updated; members: 3 created, 0 updated, 0 deleted', out)
+        m1 = AppUserMember.objects.get(member_id='M1').id
+
+        out = self.import_csv([(1, 'M1', 'Ann'), (2, 'M3', 'Cy'), (2, 'M2', 'Bea')])
+        self.assertIn('Teams: 0 created, 2 updated; members: 0 created, 2 updated, 0 deleted', out)
+        self.assertEqual(self.members(), {'M1': (1, 'Ann'), 'M2': (2, 'Bea'), 'M3': (2, 'Cy')})
+        self.assertEqual(AppUserMember.objects.get(member_id='M1').id, m1)
+
+        out = self.import_csv([(1, 'M1', 'Ann'), (2, 'M3', 'Cy')])
+        self.assertIn('members: 0 created, 0 updated, 1 deleted', out)
+        self.assertEqual(set(self.members()), {'M1', 'M3'})
+
+    def test_query_count_does_not_grow_with_the_file(self):
+        def import_queries(rows) -> int:
+            with CaptureQueriesContext(connection) as queries:
+                self.import_csv(rows)
+            return len(queries)
+
+        small = import_queries([(1, 'M1', 'Ann'), (2, 'M2', 'Bea')])
+        large = import_queries([(team_no, f'M{team_no}{i}', f'Player {i}') for team_no in range(3, 13) for i in range(3)])
+        self.assertEqual(small, large)
+
+    def test_dry_run_writes_nothing(self):
+        out = self.import_csv([(1, 'M1', 'Ann')], dry_run=True)
+        self.assertIn('Dry-run enabled: no DB changes.', out)
+        self.assertFalse(AppUser.objects.exists())
+
+    def test_append_only_keeps_existing_teams(self):
+        self.import_csv([(1, 'M1', 'Ann'), (1, 'M2', 'Bea')])
+        AppUser.objects.filter(team_no=1).update(password_hash_b64='changed')
+
+        out = self.import_csv([(1, 'M3', 'Cid'), (2, 'M4', 'Dee')], append_only=True)
+        self.assertIn('Teams: 1 created, 0 updated; members: 2 created, 0 updated, 0 deleted', out)
+        self.assertEqual(set(self.members()), {'M1', 'M2', 'M3', 'M4'})
+        self.assertEqual(AppUser.objects.get(team_no=1).password_hash_b64, 'changed')
+
+        rows = [(1, f'M{i}', f'Player {i}') for i in range(5, 8)]
+        with self.assertRaisesMessage(CommandError, 'Team 1 would have 6 members (> 5) after append-only import.'):
+            self.import_csv(rows, append_only=True)
+
+
+class ImportTeamsStreamTests(ImportTeamsTestCase):
+    stream = True
+
+    def test_multi_chunk_file(self):
+        # Teams 1 and 2 span chunks
+        rows = [(1, 'M1', 'Ann'), (2, 'M3', 'Cid'), (1, 'M2', 'Bea'), (3, 'M4', 'Dee'), (2, 'M5', 'Eve')]
+        out = self.import_csv(rows, chunk_size=2)
+        self.assertIn('Import completed in 3 chunk(s).', out)
+        self.assertEqual(set(AppUser.objects.values_list('team_no', flat=True)), {1, 2, 3})
+        self.assertEqual(
+            self.members(),
+            {'M1': (1, 'Ann'), 'M2': (1, 'Bea'), 'M3': (2, 'Cid'), 'M4': (3, 'Dee'), 'M5': (2, 'Eve')},
+        )
+
+        m1 = AppUserMember.objects.get(member_id='M1').id
+        rows = [(1, 'M1', 'Ann'), (2, 'M3', 'Cid'), (3, 'M4', 'Dee'), (2, 'M5', 'Eva')]
+        out = self.import_csv(rows, chunk_size=2)
+        self.assertIn('1 updated, 1 deleted', out)
+        self.assertEqual(self.members(), {'M1': (1, 'Ann'), 'M3': (2, 'Cid'), 'M4': (3, 'Dee'), 'M5': (2, 'Eva')})
+        self.assertEqual(AppUserMember.objects.get(member_id='M1').id, m1)
+
+    def test_duplicate_member_across_chunks(self):
+        rows = [(1, 'M1', 'Ann'), (2, 'M2', 'Bea'), (3, 'M3', 'Cid'), (2, 'M1', 'Ann')]
+        with self.assertRaisesMessage(CommandError, "Row 5: duplicate Member ID 'M1'"):
+            self.import_csv(rows, chunk_size=2)
+        # The first chunk stays committed; the second is rolled back
+        self.assertEqual(set(self.members()), {'M1', 'M2'})
+
+    def test_oversized_team_across_chunks(self):
+        rows = [(1, f'M{i}', f'Player {i}') for i in range(1, 7)]
+        with self.assertRaisesMessage(CommandError, 'Team 1 has 6 members (> 5).'):
+            self.import_csv(rows, chunk_size=3)
+        self.assertEqual(AppUserMember.objects.count(), 3)
+
+    def test_invalid_row_writes_nothing(self):
+        rows = [(1, 'M1', 'Ann'), (1, 'M2', 'Bea'), (2, 'M3', '')]
+        with self.assertRaisesMessage(CommandError, '1 validation error(s)'):
+            self.import_csv(rows, chunk_size=2)
+        self.assertFalse(AppUser.objects.exists())
+
+
+class SessionCacheTests(HackathonTestCase):
+    def setUp(self):
+        session_cache.clear()
+        self.addCleanup(session_cache.clear)
+        user = AppUser.objects.create(username='team-1', team_no=1)
+        self.session = AuthSession.objects.create(
+            user=user, token_hash=hash_session_token('secret'), expires_at=timezone.now() + timedelta(days=7)
+        )
+
+    def get_session(self, token: str = 'secret') -> AuthSession | None:
+        request = RequestFactory().get('/api/me', HTTP_AUTHORIZATION=f'Bearer {token}')
+        return views._get_session(request)
+
+    def test_session_is_read_once(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.get_session(), self.session)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_session().user.username, 'team-1')
+
+    def test_unknown_token_is_cached_as_missing(self):
+        with self.assertNumQueries(1):
+            self.assertIsNone(self.get_session('guess'))
+        with self.assertNumQueries(0):
+            self.assertIsNone(self.get_session('guess'))
+
+    def test_saving_a_revocation_discards_the_entry(self):
+        self.get_session()
+        self.session.revoked_at = timezone.now()
+        self.session.save()
+        self.assertIs(session_cache.get(self.session.token_hash), MISSING)
+        self.assertIsNone(self.get_session())
+
+    def test_logout_discards_the_entry(self):
+        self.get_session()
+        self.client.post('/api/logout', HTTP_AUTHORIZATION='Bearer secret')
+        self.assertIsNone(self.get_session())
+
+    def test_expired_cached_session_is_dropped(self):
+        cached = self.get_session()
+        cached.expires_at = timezone.now()
+        with self.assertNumQueries(0):
+            self.assertIsNone(self.get_session())
+        self.assertIs(session_cache.get(self.session.token_hash), MISSING)
+
+
+class RoundWordCloudTests(HackathonTestCase):
+    def setUp(self):
+        self.round = GameRound.objects.create(question=Question.objects.create(text='Favourite language?'), share_token='t1')
+        for word in ('go', 'go', 'rust'):
+            Response.objects.create(round=self.round, player_id=word, word=word)
+        # Augmentation weights land in the same per-round totals
+        increment_round_words(self.round.id, {'zig': 5})
+
+    @override_settings(ROUND_CLOUD_TOP_N=2)
+    def test_top_words_are_one_ranked_read(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(f'/api/round/{self.round.id}/wordcloud')
+        self.assertEqual(
+            response.json(),
+            {
+                'frequencies': [{'word': 'ZIG', 'count': 5, 'error': 0}, {'word': 'GO', 'count': 2, 'error': 0}],
+                'mode': 'top',
+                'max_error': 0,
+            },
+        )
+
+    def test_exact_mode_lists_every_word(self):
+        response = self.client.get(f'/api/round/{self.round.id}/wordcloud?mode=exact')
+        self.assertEqual(
+            response.json()['frequencies'],
+            [{'word': 'ZIG', 'count': 5}, {'word': 'GO', 'count': 2}, {'word': 'RUST', 'count': 1}],
+        )
+
+
+class RoundLeaderboardTests(HackathonTestCase):
+    def setUp(self):
+        self.boards = RoundLeaderboards(max_rounds=8, lookback=10, rebuild_interval=60)
+        patcher = mock.patch('hackathon.leaderboard.round_leaderboards', self.boards)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_round(self, share_token: str, status: str = 'active') -> GameRound:
+        round_obj = GameRound.objects.create(
+            question=Question.objects.create(text='Favourite language?'), share_token=share_token, status=status
+        )
+        for player_id in ('bob', 'ann', 'bob', 'cat'):
+            Response.objects.create(round=round_obj, player_id=player_id, word='go')
+        ShareEvent.objects.create(round=round_obj, player_id='ann')
+        return round_obj
+
+    def test_startup_builds_active_rounds(self):
+        live = self.make_round('t1')
+        ended = self.make_round('t2', status='ended')
+        warm_round_leaderboards()
+        self.assertEqual(list(self.boards._rounds), [live.id])
+
+        entries, total = self.boards.page(live.id)
+        self.assertEqual(total, 3)
+        self.assertEqual(entries, exact_leaderboard(live.id))
+        self.assertEqual(self.boards.rank_of(live.id, 'cat'), {'rank': 3, 'player_id': 'cat', 'score': 1})
+        self.assertNotIn(ended.id, self.boards._rounds)
+
+    def test_new_rows_are_folded_in(self):
+        round_obj = self.make_round('t1')
+        warm_round_leaderboards()
+        for _ in range(2):
+            Response.objects.create(round=round_obj, player_id='cat', word='go')
+        self.assertEqual(self.boards.page(round_obj.id, 0, 1)[0], [{'rank': 1, 'player_id': 'cat', 'score': 3}])
+
+
+class RoundDashboardTests(HackathonTestCase):
+    def setUp(self):
+        for name, value in (
+            ('round_dashboards', SharedSnapshots(views._round_dashboard_payload, interval=60, maxsize=8)),
+            ('round_leaderboards', RoundLeaderboards(max_rounds=8, lookback=10, rebuild_interval=60)),
+        ):
+            patcher = mock.patch.object(views, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.round = GameRound.objects.create(question=Question.objects.create(text='Favourite language?'), share_token='t1')
+        for player_id, word in (('ann', 'go'), ('bob', 'go'), ('cat', 'rust')):
+            Response.objects.create(round=self.round, player_id=player_id, word=word)
+
+    def test_one_snapshot_for_every_viewer(self):
+        response = self.client.get(f'/api/round/{self.round.id}/dashboard')
+        body = response.json()
+        self.assertEqual(body['round']['question'], 'Favourite language?')
+        self.assertEqual(body['frequencies'][0], {'word': 'GO', 'count': 2})
+        self.assertEqual(len(body['leaderboard']), 3)
+
+        with self.assertNumQueries(0):
+            again = self.client.get(f'/api/round/{self.round.id}/dashboard', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(again.status_code, 304)
+
+    def test_unknown_round(self):
+        self.assertEqual(self.client.get('/api/round/999999/dashboard').status_code, 404)
+
+
+class CounterSignalTests(HackathonTestCase):
+    def test_user_score_follows_events(self):
+        answer = AnswerEvent.objects.create(user_id=7, question_id=1, answer='python')
+        ShareEvent.objects.create(player_id='7')
+        self.assertEqual(UserScore.objects.get(user_id='7').total_score, 2)
+        answer.delete()
+        self.assertEqual(UserScore.objects.values_list('answer_count', 'share_count').get(user_id='7'), (0, 1))
+
+    def test_deleting_uncounted_rows_creates_no_negative_counts(self):
+        # bulk_create skips the post_save signals, so none of these rows were counted
+        AnswerEvent.objects.bulk_create([AnswerEvent(user_id=8, question_id=1, answer='python')])
+        ShareEvent.objects.bulk_create([ShareEvent(player_id='9')])
+        cloud_round = WordCloudRound.objects.create()
+        WordCloudResponse.objects.bulk_create([WordCloudResponse(round=cloud_round, word='calm', count=3)])
+        game_round = GameRound.objects.create(question=Question.objects.create(text='Mood?'), share_token='t2')
+        Response.objects.bulk_create([Response(round=game_round, player_id='p', word='calm')])
+
+        AnswerEvent.objects.all().delete()
+        ShareEvent.objects.all().delete()
+        WordCloudResponse.objects.all().delete()
+        Response.objects.all().delete()
+
+        self.assertFalse(UserScore.objects.exists())
+        self.assertFalse(SampleWordTotal.objects.exists())
+        self.assertFalse(WordFrequencyByRound.objects.exists())
+
+    def test_scoring_writes_wake_long_polls(self):
+        # The word itself goes to a stand-in buffer, not the process-wide one
+        with mock.patch.object(views, 'word_frequencies'), mock.patch.object(views.score_notifier, 'notify') as notify:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.post('/api/submit-answer', {'answer': 'python', 'user_id': 7}, content_type='application/json')
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.post('/api/record-share', {'user_id': 7}, content_type='application/json')
+        self.assertEqual(notify.call_args_list, [mock.call('7'), mock.call('7')])
+
+    def test_sample_totals_follow_responses(self):
+        cloud_round = WordCloudRound.objects.create()
+        first = WordCloudResponse.objects.create(round=cloud_round, word='calm', count=3)
+        WordCloudResponse.objects.create(round=cloud_round, word='calm', count=2)
+        first.delete()
+        self.assertEqual(SampleWordTotal.objects.get(word='calm').total, 2)
+
+
+class WordCloudTestCase(HackathonTestCase):
+    """Runs against fresh in-process cloud state, since the versions restart with every test."""
+
+    def setUp(self):
+        self.cloud = VersionedCloud(WORD_COUNTER.name, lambda: read_counter_totals(WORD_COUNTER), history=4)
+        self.layouts = CloudLayouts(self.cloud, spiral_layout)
+        render_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(render_dir.cleanup)
+        for target, name, value in (
+            (views, 'word_cloud', self.cloud),
+            (views, 'word_cloud_layout', self.layouts),
+            (cloud_renders, 'directory', Path(render_dir.name)),
+        ):
+            patcher = mock.patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        render_cache.clear()
+        self.addCleanup(render_cache.clear)
+
+    def count(self, **words: int) -> int:
+        """Counts words as a committed flush would and returns the new cloud version"""
+        with self.captureOnCommitCallbacks(execute=True):
+            increment_counter(WORD_COUNTER, words)
+        return self.cloud.current_version()
+
+
+class WordCloudSnapshotTests(WordCloudTestCase):
+    def test_idle_poll_is_not_modified(self):
+        version = self.count(go=2, rust=1)
+        response = self.client.get('/api/wordcloud')
+        self.assertEqual(response['ETag'], f'"word-{version}"')
+        self.assertEqual(
+            response.json(),
+            {'version': version, 'full': True, 'words': [{'text': 'go', 'frequency': 2}, {'text': 'rust', 'frequency': 1}]},
+        )
+
+        # Only the version is read
+        with self.assertNumQueries(1):
+            again = self.client.get('/api/wordcloud', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(again.status_code, 304)
+
+        self.count(go=1)
+        changed = self.client.get('/api/wordcloud', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed['ETag'], response['ETag'])
+
+
+class WordCloudDeltaTests(WordCloudTestCase):
+    def get(self, since) -> dict:
+        return self.client.get('/api/wordcloud', {'since': since}).json()
+
+    def test_replays_changes_since_a_version(self):
+        first = self.count(go=2, rust=1)
+        self.client.get('/api/wordcloud')
+        self.count(go=1)
+        self.client.get('/api/wordcloud')
+        latest = self.count(zig=4)
+
+        self.assertEqual(
+            self.get(first),
+            {
+                'version': latest,
+                'since': first,
+                'full': False,
+                'words': [{'text': 'zig', 'frequency': 4}, {'text': 'go', 'frequency': 3}],
+            },
+        )
+        self.assertEqual(self.get(latest), {'version': latest, 'since': latest, 'full': False, 'words': []})
+
+    def test_too_far_behind_gets_a_full_snapshot(self):
+        first = self.count(go=1)
+        self.client.get('/api/wordcloud')
+        for _ in range(5):
+            self.count(go=1)
+            self.client.get('/api/wordcloud')
+
+        body = self.get(first)
+        self.assertTrue(body['full'])
+        self.assertEqual(body['words'], [{'text': 'go', 'frequency': 6}])
+        self.assertTrue(self.get(0)['full'])
+
+    def test_since_must_be_a_version(self):
+        response = self.client.get('/api/wordcloud', {'since': 'yesterday'})
+        self.assertEqual(response.status_code, 400)
+
+
+class WordCloudLayoutTests(WordCloudTestCase):
+    def test_layout_mode(self):
+        version = self.count(go=3, rust=1)
+        response = self.client.get('/api/wordcloud', {'layout': 1})
+        body = response.json()
+        self.assertEqual(response['ETag'], f'"word-layout-{version}"')
+        self.assertEqual((body['version'], body['layout']), (version, True))
+        self.assertEqual([w['text'] for w in body['words']], ['go', 'rust'])
+        self.assertEqual(set(body['words'][0]), {'text', 'frequency', 'x', 'y', 'size', 'rotation', 'color'})
+
+        again = self.client.get('/api/wordcloud', {'layout': 1}, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(again.status_code, 304)
+
+    def test_laid_out_once_per_version(self):
+        version = self.count(go=3)
+        with mock.patch.object(self.layouts.engine, 'layout', wraps=self.layouts.engine.layout) as layout:
+            first = self.layouts.get(version)
+            self.assertIs(self.layouts.get(version), first)
+            self.count(rust=1)
+            second = self.layouts.get()
+        self.assertEqual(layout.call_count, 2)
+        # The new version starts from the previous placements
+        self.assertEqual(layout.call_args.args[1], {p.text: p for p in first.placements})
+        self.assertGreater(second.version, first.version)
+
+
+class WordCloudImageTests(WordCloudTestCase):
+    def test_image_is_keyed_by_the_version_it_shows(self):
+        stale = self.count(go=2)
+        fresh = self.count(rust=3)
+        # Another request lays out the newer version between this one reading the version and rendering
+        self.layouts.get(fresh)
+        with mock.patch.object(self.cloud, 'current_version', return_value=stale):
+            response = self.client.get('/api/wordcloud.svg')
+
+        self.assertEqual(response['ETag'], f'"word-{fresh}.svg"')
+        self.assertIn(b'RUST', response.content)
+        self.assertIs(render_cache.get(f'word-{stale}.svg'), MISSING)
+
+    def test_unchanged_image_is_not_modified(self):
+        self.count(go=2)
+        response = self.client.get('/api/wordcloud.png')
+        self.assertEqual(response['Content-Type'], 'image/png')
+        again = self.client.get('/api/wordcloud.png', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(again.status_code, 304)
@@ -18,9 +18,26 @@ from .views import (
     # Simple Word Cloud (USED BY StartGame + WordCloudPage)
     submit_answer,
     get_wordcloud,
+    get_wordcloud_image,
     get_sample_wordcloud,
     get_user_score,
 
+    # Live streams (SSE)
+    stream_wordcloud,
+    stream_round,
+
+    # Rounds (RoundDashboardPage / RespondPage)
+    ApiCreateRoundView,
+    ApiRoundDetailsView,
+    ApiRoundDashboardView,
+    ApiRoundSnapshotView,
+    ApiRespondView,
+    ApiWordCloudView,
+    ApiRoundWordCloudImageView,
+    ApiShareView,
+    ApiLeaderboardView,
+    ApiEndRoundView,
+
     # Optional: game / round features (keep if needed)
     create_game_session,
     join_shared_game,
@@ -43,10 +60,25 @@ urlpatterns = [
     # ---------------- WORD CLOUD (THIS IS THE IMPORTANT PART) ----------------
     path("api/submit-answer", submit_answer),   # 👈 StartGame writes here
     path("api/wordcloud", get_wordcloud),       # 👈 WordCloudPage reads here
+    path("api/wordcloud.<str:fmt>", get_wordcloud_image),  # 👈 shareable PNG / SVG
+    path("api/wordcloud/stream", stream_wordcloud),  # 👈 WordCloudPage live updates (ASGI)
     path("api/sample-wordcloud", get_sample_wordcloud),  # 👈 Sample cloud reads here
     path("api/user-score", get_user_score),
     path("api/record-share", views.record_share),
 
+    # ---------------- ROUNDS ----------------
+    path("api/create-round", ApiCreateRoundView.as_view()),
+    path("api/round/<int:round_id>", ApiRoundDetailsView.as_view()),
+    path("api/round/<int:round_id>/wordcloud", ApiWordCloudView.as_view()),
+    path("api/round/<int:round_id>/wordcloud.<str:fmt>", ApiRoundWordCloudImageView.as_view()),
+    path("api/round/<int:round_id>/leaderboard", ApiLeaderboardView.as_view()),
+    path("api/round/<int:round_id>/share", ApiShareView.as_view()),
+    path("api/round/<int:round_id>/end", ApiEndRoundView.as_view()),
+    path("api/round/<int:round_id>/snapshot", ApiRoundSnapshotView.as_view()),
+    path("api/round/<int:round_id>/dashboard", ApiRoundDashboardView.as_view()),  # 👈 RoundDashboardPage polls here
+    path("api/round/<int:round_id>/stream", stream_round),  # 👈 RoundDashboardPage live updates (ASGI)
+    path("respond/<str:share_token>", ApiRespondView.as_view()),
+
     # ---------------- OPTIONAL GAME ----------------
     path("api/game/create", create_game_session),
     path("api/game/<uuid:game_id>", join_shared_game),
@@ -1,12 +1,15 @@
+import hashlib
 import json
 import re
 import uuid
 import random
 from datetime import timedelta
 
-from django.http import HttpRequest, JsonResponse
-from django.db import transaction
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.db import connection, transaction
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_vary_headers
 from django.views import View
 
 from django.views.decorators.csrf import csrf_exempt
@@ -17,7 +20,7 @@ from django.views.decorators.csrf import csrf_exempt
 from .models import Word
 from .models import Question, WordCloud
 
-from .models import Question, WordCloud, UserAnswer, AnswerEvent, ShareEvent
+from .models import Question, WordCloud, UserAnswer, AnswerEvent, ShareEvent, UserScore
 
 from django.views.decorators.csrf import csrf_exempt
 from django.db.models import F
@@ -33,6 +36,7 @@ from .auth import (
     create_session_token,
     OtpDispatchError,
     OtpVerifyError,
+    OtpGatewayUnavailable,
     get_session_times,
     hash_session_token,
     dispatch_otp,
@@ -40,7 +44,14 @@ from .auth import (
     verify_password,
 )
 
-from .models import AppUser, AppUserMember, AuthSession, OtpChallenge, Hackathon, Submission, Question, GameRound, Response, ShareEvent
+from .models import AppUser, AppUserMember, AuthSession, OtpChallenge, Hackathon, Submission, Question, GameRound, Response, ShareEvent, WordFrequencyByRound
+from .cache import MISSING, round_token_cache, session_cache
+from .counters import increment_augment_weights, increment_round_words
+from .layout import spiral_layout
+from .leaderboard import exact_leaderboard, round_leaderboards
+from .render import CONTENT_TYPES, RENDERERS, cloud_renders
+from .rounds import resolve_share_token
+from .snapshots import FrozenRound, SharedSnapshots, freeze_round, frozen_round
 
 from .models import AppUser, AppUserMember, AuthSession, OtpChallenge
 # views.py
@@ -109,11 +120,25 @@ def _get_session(request: HttpRequest) -> AuthSession | None:
         return None
 
     token_hash = hash_session_token(token)
-    return (
-        AuthSession.objects.select_related('user', 'member')
-        .filter(token_hash=token_hash, revoked_at__isnull=True, expires_at__gt=timezone.now())
-        .first()
-    )
+    now = timezone.now()
+
+    session = session_cache.get(token_hash)
+    if session is MISSING:
+        session = (
+            AuthSession.objects.select_related('user', 'member')
+            .filter(token_hash=token_hash, revoked_at__isnull=True, expires_at__gt=now)
+            .first()
+        )
+        if session is None:
+            session_cache.set(token_hash, None, settings.SESSION_NEGATIVE_CACHE_TTL_SECONDS)
+        else:
+            # Never cache a session past its own expiry
+            session_cache.set(token_hash, session, (session.expires_at - now).total_seconds())
+    elif session is not None and (session.revoked_at is not None or session.expires_at <= now):
+        session_cache.discard(token_hash)
+        return None
+
+    return session
 
 
 
@@ -121,17 +146,31 @@ def _generate_share_token() -> str:
     return str(uuid.uuid4())
 
 
+def _round_accepts_answers(round_id: int) -> bool:
+    # Locking read inside the answer's transaction: it sees a round ended by another process even
+    # while this one still has it cached as active, and ApiEndRoundView's SELECT ... FOR UPDATE
+    # waits for it, so no answer can commit after the round's snapshot was taken. SQLite
+    # serializes writers, so a plain read after the insert is enough there.
+    lock = {'mysql': ' LOCK IN SHARE MODE', 'postgresql': ' FOR SHARE'}.get(connection.vendor, '')
+    table = connection.ops.quote_name(GameRound._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT status FROM {table} WHERE id = %s{lock}', [round_id])
+        row = cursor.fetchone()
+    return row is not None and row[0] == 'active'
+
+
+AUGMENT_WORDS = ['happy', 'sad', 'excited', 'tired', 'angry', 'joyful', 'frustrated', 'calm', 'energetic', 'relaxed']
+AUGMENT_PER_RESPONSE = 10
+
+
 def _augment_responses(round_id: int, word: str):
-    # Add 10 random words for simulation
-    random_words = ['happy', 'sad', 'excited', 'tired', 'angry', 'joyful', 'frustrated', 'calm', 'energetic', 'relaxed']
-    for _ in range(10):
-        augmented_word = random.choice(random_words)
-        Response.objects.create(
-            round_id=round_id,
-            player_id=f'augmented_{uuid.uuid4()}',
-            word=augmented_word,
-            is_augmented=True
-        )
+    # Add 10 random words for simulation, as per-word weights rather than Response rows
+    picks: dict[str, int] = {}
+    for _ in range(AUGMENT_PER_RESPONSE):
+        augmented_word = random.choice(AUGMENT_WORDS)
+        picks[augmented_word] = picks.get(augmented_word, 0) + 1
+    increment_augment_weights(round_id, picks)
+    increment_round_words(round_id, picks)
     # Word Cloud Game API Views
 import secrets
 import string
@@ -387,6 +426,7 @@ class ApiLoginView(View):
         )
 
 
+
 class ApiMeView(View):
     def get(self, request: HttpRequest) -> JsonResponse:
         # Mock authentication - just check if there's a Bearer token
@@ -470,7 +510,11 @@ class ApiLogoutView(View):
         return super().dispatch(*args, **kwargs)
 
     def post(self, request: HttpRequest) -> JsonResponse:
-        # Mock logout - just return success
+        token = _get_bearer_token(request)
+        if token:
+            token_hash = hash_session_token(token)
+            AuthSession.objects.filter(token_hash=token_hash, revoked_at__isnull=True).update(revoked_at=timezone.now())
+            session_cache.discard(token_hash)
         return JsonResponse({'ok': True})
 
 
@@ -503,7 +547,7 @@ class ApiOtpRequestView(View):
         else:
             members_qs = (
                 AppUserMember.objects.select_related('user')
-                .filter(email__iexact=email)
+                .filter(email_normalized=AppUserMember.normalize_email(email))
                 .filter(user__is_active=True)
             )
 
@@ -540,6 +584,8 @@ class ApiOtpRequestView(View):
 
         try:
             dispatch_otp(channel=channel, identifier=identifier, display_name=member.name)
+        except OtpGatewayUnavailable as exc:
+            return JsonResponse({'error': str(exc)}, status=503)
         except OtpDispatchError as exc:
             return JsonResponse({'error': str(exc)}, status=502)
 
@@ -592,6 +638,8 @@ class ApiOtpVerifyView(View):
 
         try:
             ok = verify_otp_via_gateway(identifier=challenge.identifier, otp=otp)
+        except OtpGatewayUnavailable as exc:
+            return JsonResponse({'error': str(exc)}, status=503)
         except OtpVerifyError as exc:
             return JsonResponse({'error': str(exc)}, status=502)
 
@@ -709,6 +757,92 @@ class ApiSubmissionsView(View):
         })
 
 
+def _round_details(round_obj: GameRound) -> dict:
+    response_count = Response.objects.filter(round=round_obj, is_augmented=False).count()
+
+    return {
+        'id': round_obj.id,
+        'question': round_obj.question.text,
+        'status': round_obj.status,
+        'response_count': response_count,
+        'created_at': round_obj.created_at.isoformat()
+    }
+
+
+def _round_frequencies_exact(round_obj: GameRound, limit: int | None = None) -> list[dict]:
+    # Exact totals kept on write (real answers plus augmentation weights); one range read
+    # in round_word_freq_rank_idx order
+    frequencies = (
+        WordFrequencyByRound.objects.filter(round=round_obj, frequency__gt=0)
+        .order_by('-frequency', 'word')
+        .values_list('word', 'frequency')
+    )
+    if limit is not None:
+        frequencies = frequencies[:limit]
+    return [{'word': word, 'count': count} for word, count in frequencies]
+
+
+def _round_frequencies(round_obj: GameRound) -> list[dict]:
+    return _round_frequencies_exact(round_obj, settings.ROUND_CLOUD_TOP_N)
+
+
+def _round_leaderboard(round_obj: GameRound) -> list[dict]:
+    # Scores (responses + shares per player) from the round's in-memory ranked board
+    entries, _ = round_leaderboards.page(round_obj.id, 0, settings.ROUND_LEADERBOARD_PAGE_SIZE)
+    return entries
+
+
+def _round_snapshot_payload(round_obj: GameRound) -> dict:
+    # Everything ended-round readers need, computed once when the round is frozen
+    return {
+        'round': _round_details(round_obj),
+        'frequencies': _round_frequencies_exact(round_obj),
+        # Exact totals: the in-memory board may lag behind or miss rows until its next rebuild
+        'leaderboard': exact_leaderboard(round_obj.id),
+        'share_count': ShareEvent.objects.filter(round=round_obj).count(),
+    }
+
+
+def _frozen_round(round_obj: GameRound) -> FrozenRound | None:
+    if round_obj.status != 'ended':
+        return None
+    # Rounds ended before snapshots existed are frozen on their first read
+    return frozen_round(round_obj.id) or freeze_round(round_obj.id, _round_snapshot_payload(round_obj))
+
+
+def _frozen_response(request: HttpRequest, frozen: FrozenRound, data: dict) -> HttpResponse:
+    response = get_conditional_response(request, etag=frozen.etag)
+    if response is None:
+        response = JsonResponse(data)
+    response['ETag'] = frozen.etag
+    response['Cache-Control'] = f'public, max-age={settings.ROUND_SNAPSHOT_MAX_AGE_SECONDS}, immutable'
+    return response
+
+
+def _round_dashboard_payload(round_id: int) -> dict:
+    # Details, cloud and leaderboard read together, so viewers never see them out of step
+    round_obj = GameRound.objects.select_related('question').get(id=round_id)
+    frozen = _frozen_round(round_obj)
+    if frozen is not None:
+        return {
+            'round': frozen.data['round'],
+            'frequencies': frozen.data['frequencies'][: settings.ROUND_CLOUD_TOP_N],
+            'leaderboard': frozen.data['leaderboard'][: settings.ROUND_LEADERBOARD_PAGE_SIZE],
+        }
+    return {
+        'round': _round_details(round_obj),
+        'frequencies': _round_frequencies(round_obj),
+        'leaderboard': _round_leaderboard(round_obj),
+    }
+
+
+round_dashboards = SharedSnapshots(
+    _round_dashboard_payload,
+    interval=settings.ROUND_DASHBOARD_INTERVAL_SECONDS,
+    maxsize=settings.ROUND_DASHBOARD_CACHE_SIZE,
+)
+
+
 class ApiCreateRoundView(View):
     @method_decorator(csrf_exempt)
     def dispatch(self, *args, **kwargs):
@@ -736,8 +870,8 @@ class ApiCreateRoundView(View):
                 created_by=session.user,
                 share_token=share_token
             )
-            session.user.points += 1
-            session.user.save(update_fields=['points'])
+            # session.user may be a cached instance shared with other requests
+            AppUser.objects.filter(pk=session.user_id).update(points=F('points') + 1)
 
         return JsonResponse({
             'round_id': round_obj.id,
@@ -753,15 +887,91 @@ class ApiRoundDetailsView(View):
         except GameRound.DoesNotExist:
             return JsonResponse({'error': 'Round not found'}, status=404)
 
-        response_count = Response.objects.filter(round=round_obj, is_augmented=False).count()
+        frozen = _frozen_round(round_obj)
+        if frozen is not None:
+            return _frozen_response(request, frozen, frozen.data['round'])
+        return JsonResponse(_round_details(round_obj))
 
-        return JsonResponse({
-            'id': round_obj.id,
-            'question': round_obj.question.text,
-            'status': round_obj.status,
-            'response_count': response_count,
-            'created_at': round_obj.created_at.isoformat()
-        })
+
+class ApiRoundDashboardView(View):
+    def get(self, request: HttpRequest, round_id: int) -> HttpResponse:
+        try:
+            snapshot = round_dashboards.get(round_id)
+        except GameRound.DoesNotExist:
+            return JsonResponse({'error': 'Round not found'}, status=404)
+
+        # Polls with the last version's ETag are answered 304 without a body
+        etag = f'"dashboard-{snapshot.version}"'
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(snapshot.body, content_type='application/json')
+        response['ETag'] = etag
+        response['Cache-Control'] = 'no-cache'
+        return response
+
+
+class ApiRoundSnapshotView(View):
+    def get(self, request: HttpRequest, round_id: int) -> HttpResponse:
+        try:
+            round_obj = GameRound.objects.select_related('question').get(id=round_id)
+        except GameRound.DoesNotExist:
+            return JsonResponse({'error': 'Round not found'}, status=404)
+
+        frozen = _frozen_round(round_obj)
+        if frozen is None:
+            return JsonResponse({'error': 'Round has not ended'}, status=409)
+
+        use_gzip = 'gzip' in request.headers.get('Accept-Encoding', '')
+        # The two encodings are different bytes, so each gets its own strong ETag
+        etag = frozen.etag[:-1] + '-gzip"' if use_gzip else frozen.etag
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            if use_gzip:
+                # Stored compressed; sent as-is
+                response = HttpResponse(frozen.body_gz, content_type='application/json')
+                response['Content-Encoding'] = 'gzip'
+            else:
+                response = JsonResponse(frozen.data)
+        patch_vary_headers(response, ('Accept-Encoding',))
+        response['ETag'] = etag
+        response['Cache-Control'] = f'public, max-age={settings.ROUND_SNAPSHOT_MAX_AGE_SECONDS}, immutable'
+        return response
+
+
+def _cloud_image_response(request: HttpRequest, key: str, fmt: str, placements, cache_control: str) -> HttpResponse:
+    # ``key`` names one cloud version; placements() is only called when that image must be rendered
+    etag = f'"{key}"'
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        body = cloud_renders.get(
+            key, lambda: RENDERERS[fmt](spiral_layout.width, spiral_layout.height, list(placements()))
+        )
+        response = HttpResponse(body, content_type=CONTENT_TYPES[fmt])
+    response['ETag'] = etag
+    response['Cache-Control'] = cache_control
+    return response
+
+
+class ApiRoundWordCloudImageView(View):
+    def get(self, request: HttpRequest, round_id: int, fmt: str) -> HttpResponse:
+        if fmt not in CONTENT_TYPES:
+            return JsonResponse({'error': 'Unknown image format'}, status=404)
+        try:
+            # The shared dashboard snapshot, so a share storm reads the round once per interval
+            snapshot = round_dashboards.get(round_id)
+        except GameRound.DoesNotExist:
+            return JsonResponse({'error': 'Round not found'}, status=404)
+
+        payload = json.loads(snapshot.body)
+        words = [(w['word'], w['count']) for w in payload['frequencies']]
+        version = hashlib.sha1(json.dumps(words).encode('utf-8')).hexdigest()[:16]
+        if payload['round']['status'] == 'ended':
+            cache_control = f'public, max-age={settings.ROUND_SNAPSHOT_MAX_AGE_SECONDS}, immutable'
+        else:
+            cache_control = f'public, max-age={settings.WORDCLOUD_RENDER_MAX_AGE_SECONDS}'
+        return _cloud_image_response(
+            request, f'round-{round_id}-{version}.{fmt}', fmt, lambda: spiral_layout.layout(words), cache_control
+        )
 
 
 class ApiRespondView(View):
@@ -770,20 +980,18 @@ class ApiRespondView(View):
         return super().dispatch(*args, **kwargs)
 
     def get(self, request: HttpRequest, share_token: str) -> JsonResponse:
-        try:
-            round_obj = GameRound.objects.select_related('question').get(share_token=share_token, status='active')
-        except GameRound.DoesNotExist:
+        round_ref = resolve_share_token(share_token)
+        if round_ref is None or round_ref.status != 'active':
             return JsonResponse({'error': 'Invalid or inactive round'}, status=404)
 
         return JsonResponse({
-            'round_id': round_obj.id,
-            'question': round_obj.question.text
+            'round_id': round_ref.id,
+            'question': round_ref.question
         })
 
     def post(self, request: HttpRequest, share_token: str) -> JsonResponse:
-        try:
-            round_obj = GameRound.objects.get(share_token=share_token, status='active')
-        except GameRound.DoesNotExist:
+        round_ref = resolve_share_token(share_token)
+        if round_ref is None or round_ref.status != 'active':
             return JsonResponse({'error': 'Invalid or inactive round'}, status=404)
 
         payload = _json_body(request)
@@ -801,19 +1009,23 @@ class ApiRespondView(View):
 
         with transaction.atomic():
             response, created = Response.objects.get_or_create(
-                round=round_obj,
+                round_id=round_ref.id,
                 player_id=player_id,
                 defaults={'word': word}
             )
             if not created:
                 return JsonResponse({'error': 'You have already responded to this round'}, status=400)
 
+            if not _round_accepts_answers(round_ref.id):
+                transaction.set_rollback(True)
+                round_token_cache.discard(share_token)
+                return JsonResponse({'error': 'Invalid or inactive round'}, status=404)
+
             # Augment with 10 random words
-            _augment_responses(round_obj.id, word)
+            _augment_responses(round_ref.id, word)
 
             if session:
-                session.user.points += 1
-                session.user.save(update_fields=['points'])
+                AppUser.objects.filter(pk=session.user_id).update(points=F('points') + 1)
 
         return JsonResponse({'message': 'Response submitted successfully'})
 
@@ -825,17 +1037,28 @@ class ApiWordCloudView(View):
         except GameRound.DoesNotExist:
             return JsonResponse({'error': 'Round not found'}, status=404)
 
-        # Aggregate word frequencies
-        from django.db.models import Count
-        frequencies = Response.objects.filter(round=round_obj).values('word').annotate(count=Count('word')).order_by('-count')
+        mode = request.GET.get('mode', 'top')
+        if mode not in ('top', 'exact'):
+            return JsonResponse({'error': 'mode must be "top" or "exact"'}, status=400)
 
-        data = []
-        for f in frequencies:
-            word = f['word'].upper()
-            if word.replace(' ', '').isalnum() and ' ' not in word:
-                data.append({'word': word, 'count': f['count']})
+        frozen = _frozen_round(round_obj)
+        if frozen is not None:
+            words = frozen.data['frequencies']
+            if mode == 'exact':
+                data = {'frequencies': words, 'mode': 'exact'}
+            else:
+                # Final totals are exact, so the top words carry no error
+                top = words[: settings.ROUND_CLOUD_TOP_N]
+                data = {'frequencies': [{**w, 'error': 0} for w in top], 'mode': 'top', 'max_error': 0}
+            return _frozen_response(request, frozen, data)
 
-        return JsonResponse({'frequencies': data})
+        if mode == 'exact':
+            # Audit mode: every word with its exact total
+            return JsonResponse({'frequencies': _round_frequencies_exact(round_obj), 'mode': 'exact'})
+
+        # Totals are exact, so the top words carry no error
+        top = _round_frequencies(round_obj)
+        return JsonResponse({'frequencies': [{**w, 'error': 0} for w in top], 'mode': 'top', 'max_error': 0})
 
 
 class ApiShareView(View):
@@ -852,7 +1075,8 @@ class ApiShareView(View):
         payload = _json_body(request)
         player_id = (payload.get('player_id') or str(uuid.uuid4())).strip()
 
-        ShareEvent.objects.create(round=round_obj, player_id=player_id)
+        with transaction.atomic():
+            ShareEvent.objects.create(round=round_obj, player_id=player_id)
 
         return JsonResponse({'message': 'Share recorded'})
 
@@ -864,20 +1088,27 @@ class ApiLeaderboardView(View):
         except GameRound.DoesNotExist:
             return JsonResponse({'error': 'Round not found'}, status=404)
 
-        # Calculate scores: responses + shares per player
-        response_scores = Response.objects.filter(round=round_obj, is_augmented=False).values('player_id').annotate(score=Count('player_id'))
-        share_scores = ShareEvent.objects.filter(round=round_obj).values('player_id').annotate(shares=Count('player_id'))
-
-        scores = {}
-        for r in response_scores:
-            scores[r['player_id']] = r['score']
-        for s in share_scores:
-            scores[s['player_id']] = scores.get(s['player_id'], 0) + s['shares']
-
-        leaderboard = [{'player_id': pid, 'score': score} for pid, score in scores.items()]
-        leaderboard.sort(key=lambda x: x['score'], reverse=True)
-
-        return JsonResponse({'leaderboard': leaderboard})
+        try:
+            offset = max(0, int(request.GET.get('offset') or 0))
+            limit = int(request.GET.get('limit') or settings.ROUND_LEADERBOARD_PAGE_SIZE)
+        except ValueError:
+            return JsonResponse({'error': 'offset and limit must be integers'}, status=400)
+        limit = min(max(1, limit), settings.ROUND_LEADERBOARD_MAX_PAGE_SIZE)
+        player_id = (request.GET.get('player_id') or '').strip()
+
+        frozen = _frozen_round(round_obj)
+        if frozen is not None:
+            board = frozen.data['leaderboard']
+            data = {'leaderboard': board[offset : offset + limit], 'total': len(board), 'offset': offset, 'limit': limit}
+            if player_id:
+                data['player'] = next((entry for entry in board if entry['player_id'] == player_id), None)
+            return _frozen_response(request, frozen, data)
+
+        entries, total = round_leaderboards.page(round_obj.id, offset, limit)
+        data = {'leaderboard': entries, 'total': total, 'offset': offset, 'limit': limit}
+        if player_id:
+            data['player'] = round_leaderboards.rank_of(round_obj.id, player_id)
+        return JsonResponse(data)
 
 
 class ApiEndRoundView(View):
@@ -890,13 +1121,17 @@ class ApiEndRoundView(View):
         if session is None or not session.user.is_active:
             return JsonResponse({'error': 'Unauthorized'}, status=401)
 
-        try:
-            round_obj = GameRound.objects.get(id=round_id, created_by=session.user)
-        except GameRound.DoesNotExist:
-            return JsonResponse({'error': 'Round not found'}, status=404)
+        with transaction.atomic():
+            try:
+                round_obj = GameRound.objects.select_for_update().get(id=round_id, created_by=session.user)
+            except GameRound.DoesNotExist:
+                return JsonResponse({'error': 'Round not found'}, status=404)
 
-        round_obj.status = 'ended'
-        round_obj.save()
+            if round_obj.status != 'ended':
+                round_obj.status = 'ended'
+                round_obj.save(update_fields=['status'])
+            # From here on the round is read only from its snapshot
+            _frozen_round(round_obj)
 
         return JsonResponse({'message': 'Round ended'})
 
@@ -1046,27 +1281,68 @@ from .models import Word
 
 
 # ---------------- USER SCORE ----------------
-def get_user_score(request):
+def _read_user_score(user_id: str) -> int:
+    close_old_connections()
+    try:
+        # Maintained alongside every AnswerEvent / ShareEvent write (hackathon/signals.py)
+        score = UserScore.objects.filter(user_id=user_id).first()
+        return score.total_score if score else 0
+    finally:
+        close_old_connections()
+
+
+async def get_user_score(request):
+    """Current score; with ?since=<score>&wait=<seconds> (ASGI only) the request is
+    held until the score differs from ``since`` or the wait runs out"""
     user_id = request.GET.get("user_id")
 
     if not user_id:
         return JsonResponse({"total_score": 0})
+    user_id = str(user_id)
 
-    answer_score = AnswerEvent.objects.filter(user_id=user_id).count()
-    share_score = ShareEvent.objects.filter(player_id=str(user_id)).count()
-
-    total_score = answer_score + share_score
-
-    return JsonResponse({
-        "total_score": total_score
-    })
+    try:
+        wait = min(float(request.GET.get("wait") or 0), settings.USER_SCORE_MAX_WAIT_SECONDS)
+        since_raw = request.GET.get("since")
+        since = int(since_raw) if since_raw not in (None, "") else None
+    except ValueError:
+        return JsonResponse({"error": "wait and since must be numbers"}, status=400)
+
+    read_score = sync_to_async(_read_user_score, thread_sensitive=False)
+
+    # Under WSGI a held request would pin a worker; answer straight away instead
+    if since is None or wait <= 0 or not isinstance(request, ASGIRequest):
+        return JsonResponse({"total_score": await read_score(user_id)})
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    with score_notifier.listen(user_id) as listener:
+        while True:
+            total_score = await read_score(user_id)
+            remaining = deadline - loop.time()
+            if total_score != since or remaining <= 0:
+                break
+            await listener.wait(min(remaining, settings.USER_SCORE_RECHECK_SECONDS))
+
+    return JsonResponse({"total_score": total_score})
 
 import json
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views import View
 
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.db import close_old_connections
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+
 from .models import Word
+from .counters import CounterBacklogFull, word_frequencies
+from .layout import sample_word_cloud_layout, word_cloud_layout
+from .snapshots import sample_word_cloud, word_cloud
+from .streams import broadcaster, score_notifier
 
 
 # ---------------- HEALTH ----------------
@@ -1133,28 +1409,26 @@ def submit_answer(request):
         #             status=400
         #         )
 
-        # ✅ STORE IN WORD TABLE
-        word, created = Word.objects.get_or_create(
-            text=answer,
-            defaults={"frequency": 1}
-        )
-
-        if not created:
-            word.frequency += 1
-            word.save()
+        # ✅ STORE IN WORD TABLE (buffered, flushed in batched upserts)
+        try:
+            word_frequencies.add(answer)
+        except CounterBacklogFull:
+            return JsonResponse({"error": "Server is busy, please try again."}, status=503)
 
         # ✅ RECORD SCORING EVENT
         if user_id:
-            AnswerEvent.objects.create(
-                user_id=user_id,
-                question_id=1,  # Default or dynamic
-                answer=answer
-            )
+            # The event and the player's UserScore row commit together
+            with transaction.atomic():
+                AnswerEvent.objects.create(
+                    user_id=user_id,
+                    question_id=1,  # Default or dynamic
+                    answer=answer
+                )
+            transaction.on_commit(lambda: score_notifier.notify(str(user_id)))
 
         return JsonResponse({
             "success": True,
-            "word": word.text,
-            "frequency": word.frequency
+            "word": answer
         })
 
     except Exception as e:
@@ -1173,10 +1447,12 @@ def record_share(request):
         platform = data.get("platform", "generic")
 
         if user_id:
-            ShareEvent.objects.create(
-                player_id=str(user_id),
-                event_name=f"share_{platform}"
-            )
+            with transaction.atomic():
+                ShareEvent.objects.create(
+                    player_id=str(user_id),
+                    event_name=f"share_{platform}"
+                )
+            transaction.on_commit(lambda: score_notifier.notify(str(user_id)))
             return JsonResponse({"success": True})
         
         return JsonResponse({"error": "Missing user_id"}, status=400)
@@ -1186,47 +1462,125 @@ def record_share(request):
 
 
 # ---------------- WORD CLOUD ----------------
-def get_wordcloud(request):
+def _versioned_cloud_response(request, cloud, layouts=None):
+    # Idle polls only read the cloud version and answer 304 from the ETag
+    version = cloud.current_version()
+
+    if layouts is not None and request.GET.get("layout") == "1":
+        # Positioned words, laid out once per version for every viewer
+        etag = layouts.etag(version)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(layouts.get(version).body, content_type="application/json")
+        response["ETag"] = etag
+        response["Cache-Control"] = "no-cache"
+        return response
+
+    etag = cloud.etag(version)
+
+    since_raw = request.GET.get("since")
     try:
-        words = Word.objects.all().order_by("-frequency")
+        since = int(since_raw) if since_raw not in (None, "") else None
+    except ValueError:
+        return JsonResponse({"error": "since must be an integer version"}, status=400)
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        if since is None:
+            body = cloud.snapshot(version).body
+        else:
+            # Only the words that changed since the client's version (full snapshot if too far behind)
+            body = cloud.delta(since, version)
+        response = HttpResponse(body, content_type="application/json")
 
-        return JsonResponse({
-            "words": [
-                {
-                    "text": w.text,
-                    "frequency": w.frequency
-                }
-                for w in words
-            ]
-        })
+    response["ETag"] = etag
+    response["Cache-Control"] = "no-cache"
+    return response
 
+
+def get_wordcloud(request):
+    try:
+        return _versioned_cloud_response(request, word_cloud, word_cloud_layout)
     except Exception as e:
         return JsonResponse({"error": str(e)}, status=500)
 
 
+def get_wordcloud_image(request, fmt):
+    """The word cloud as a shareable PNG or SVG, rendered once per cloud version"""
+    if fmt not in CONTENT_TYPES:
+        return JsonResponse({"error": "Unknown image format"}, status=404)
+    # The layout may be newer than the version just read, so the key comes from the layout
+    layout = word_cloud_layout.get(word_cloud.current_version())
+    return _cloud_image_response(
+        request,
+        f"{word_cloud.name}-{layout.version}.{fmt}",
+        fmt,
+        lambda: layout.placements,
+        f"public, max-age={settings.WORDCLOUD_RENDER_MAX_AGE_SECONDS}",
+    )
+
+
+# ---------------- LIVE STREAMS (SSE, ASGI only) ----------------
+def _event_stream(events):
+    response = StreamingHttpResponse(events, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+def _streaming_unavailable():
+    # Under WSGI an endless async stream would pin a worker; clients fall back to polling
+    return JsonResponse({"error": "Live updates require the ASGI server"}, status=503)
+
+
+def _fetch_wordcloud_event(since):
+    version = word_cloud.current_version()
+    if since is None:
+        return version, word_cloud.snapshot(version).body
+    return version, word_cloud.delta(since, version)
+
+
+def _round_event_fetcher(round_id):
+    def fetch(since):
+        # Same shared snapshot as /api/round/<id>/dashboard
+        snapshot = round_dashboards.get(round_id)
+        return snapshot.version, snapshot.body
+
+    return fetch
+
+
+async def stream_wordcloud(request):
+    """Push word cloud updates (full snapshot first, then deltas) as Server-Sent Events"""
+    if request.method != "GET":
+        return JsonResponse({"error": "Method not allowed"}, status=405)
+    if not isinstance(request, ASGIRequest):
+        return _streaming_unavailable()
+
+    # EventSource resends the last event id on reconnect, so resume with a delta
+    try:
+        since = int(request.headers.get("Last-Event-ID", ""))
+    except ValueError:
+        since = None
+
+    return _event_stream(broadcaster.stream("wordcloud", _fetch_wordcloud_event, since))
+
+
+async def stream_round(request, round_id):
+    """Push round details, cloud and leaderboard as Server-Sent Events"""
+    if request.method != "GET":
+        return JsonResponse({"error": "Method not allowed"}, status=405)
+    if not isinstance(request, ASGIRequest):
+        return _streaming_unavailable()
+
+    if not await GameRound.objects.filter(id=round_id).aexists():
+        return JsonResponse({"error": "Round not found"}, status=404)
+
+    return _event_stream(broadcaster.stream(f"round:{round_id}", _round_event_fetcher(round_id)))
+
+
 def get_sample_wordcloud(request):
-    """Get all words from WordCloudResponse table for sample cloud"""
+    """Top words across every WordCloudResponse, read from hackathon_sample_word_total"""
     try:
-        from django.db.models import Sum
-        from .models import WordCloudResponse
-        
-        # Get top 500 unique words with their total count (sum of count field) from WordCloudResponse table
-        word_data = (
-            WordCloudResponse.objects
-            .values('word')
-            .annotate(frequency=Sum('count'))
-            .order_by('-frequency')[:500]  # Get top 500 words
-        )
-        
-        words = [
-            {
-                "text": item['word'],
-                "frequency": item['frequency'] or 0
-            }
-            for item in word_data
-        ]
-        
-        return JsonResponse({"words": words})
-    
+        return _versioned_cloud_response(request, sample_word_cloud, sample_word_cloud_layout)
     except Exception as e:
         return JsonResponse({"error": str(e)}, status=500)
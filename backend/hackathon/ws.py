@@ -0,0 +1,93 @@
+import asyncio
+import json
+import logging
+import re
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+
+from .rounds import resolve_share_token
+from .streams import broadcaster
+from .views import round_dashboards
+
+
+logger = logging.getLogger(__name__)
+
+ROUND_SOCKET_PATH = re.compile(r'^/ws/rounds/(?P<share_token>[^/]+)/?$')
+
+# Application close codes (4000-4999 are free for apps to use)
+CLOSE_NOT_FOUND = 4404
+
+
+def _resolve_in_thread(share_token: str):
+    close_old_connections()
+    try:
+        return resolve_share_token(share_token)
+    finally:
+        close_old_connections()
+
+
+def _round_message_fetcher(round_id: int):
+    def fetch(since):
+        # Built once per change for every socket on the round; the dashboard snapshot
+        # underneath is shared with /dashboard polls and the SSE stream.
+        snapshot = round_dashboards.get(round_id)
+        payload = json.loads(snapshot.body)
+        ended = payload['round']['status'] == 'ended'
+        message = json.dumps({'type': 'ended' if ended else 'update', **payload})
+        return (snapshot.version, ended), message
+
+    return fetch
+
+
+async def _push(events, send) -> None:
+    try:
+        async for event in events:
+            if event is None:
+                continue
+            (_, ended), message = event
+            await send({'type': 'websocket.send', 'text': message})
+            if ended:
+                await send({'type': 'websocket.close', 'code': 1000})
+                return
+    finally:
+        await events.aclose()
+
+
+async def round_socket(scope, receive, send) -> None:
+    """One round's live feed over a WebSocket at ``/ws/rounds/<share_token>``.
+
+    Every socket on a round subscribes to the same broadcaster topic, so the
+    round is read once per change however many dashboards and respondents are
+    connected. Each message carries the dashboard payload under ``type``
+    ``update``; the last one is ``ended`` and the server then closes the socket.
+    Anything clients send is ignored.
+    """
+    message = await receive()
+    if message['type'] != 'websocket.connect':
+        return
+
+    match = ROUND_SOCKET_PATH.match(scope['path'])
+    round_ref = None
+    if match is not None:
+        round_ref = await sync_to_async(_resolve_in_thread, thread_sensitive=False)(match['share_token'])
+    if round_ref is None:
+        await send({'type': 'websocket.close', 'code': CLOSE_NOT_FOUND})
+        return
+
+    await send({'type': 'websocket.accept'})
+    events = broadcaster.subscribe(f'ws:round:{round_ref.id}', _round_message_fetcher(round_ref.id))
+    pusher = asyncio.ensure_future(_push(events, send))
+    try:
+        while True:
+            message = await receive()
+            if message['type'] == 'websocket.disconnect':
+                return
+    finally:
+        pusher.cancel()
+        try:
+            await pusher
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception('Round socket for round %s failed', round_ref.id)
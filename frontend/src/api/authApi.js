@@ -1,4 +1,4 @@
-import { httpJson } from "./http.js";
+import { httpJson, resolveUrl } from "./http.js";
 
 export function apiLogin({ username, password }) {
   return httpJson("/api/login", {
@@ -86,6 +86,16 @@ export function apiGetLeaderboard({ roundId }) {
   });
 }
 
+export function apiGetRoundDashboard({ roundId }) {
+  return httpJson(`/api/round/${roundId}/dashboard`, {
+    method: "GET",
+  });
+}
+
+export function apiRoundStreamUrl({ roundId }) {
+  return resolveUrl(`/api/round/${roundId}/stream`);
+}
+
 export function apiEndRound({ token, roundId }) {
   return httpJson(`/api/round/${roundId}/end`, {
     method: "POST",
@@ -1,4 +1,40 @@
-export default function WordCloud({ words = [] }) {
+// `layout` is a server-side placement from /api/wordcloud?layout=1:
+// { width, height, words: [{ text, frequency, x, y, size, rotation, color }] }
+// with x/y the centre of each word on a width x height canvas.
+function PlacedCloud({ layout }) {
+  return (
+    <div style={cloudStyle}>
+      <svg
+        viewBox={`0 0 ${layout.width} ${layout.height}`}
+        style={{ width: "100%", height: "auto", display: "block" }}
+      >
+        {layout.words.map((w) => (
+          <text
+            key={w.text}
+            x={w.x}
+            y={w.y}
+            fontSize={w.size}
+            fill={w.color}
+            fontWeight={w.size > 40 ? "bold" : w.size > 28 ? "600" : "500"}
+            textAnchor="middle"
+            dominantBaseline="central"
+            transform={w.rotation ? `rotate(${w.rotation} ${w.x} ${w.y})` : undefined}
+            style={{ textTransform: "uppercase", userSelect: "none", transition: "all 0.3s ease" }}
+          >
+            <title>{`"${w.text}" used ${w.frequency} times`}</title>
+            {w.text.toUpperCase()}
+          </text>
+        ))}
+      </svg>
+    </div>
+  );
+}
+
+export default function WordCloud({ words = [], layout = null }) {
+  if (layout?.words?.length) {
+    return <PlacedCloud layout={layout} />;
+  }
+
   if (!words || words.length === 0) {
     return (
       <div style={cloudStyle}>
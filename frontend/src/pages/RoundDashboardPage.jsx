@@ -1,7 +1,7 @@
 import { useState, useEffect, useCallback } from 'react'
 import { useParams } from 'react-router-dom'
 import { useAuth } from '../auth/useAuth.js'
-import { apiGetRoundDetails, apiGetWordCloud, apiGetLeaderboard, apiRecordShare, apiEndRound } from '../api/authApi.js'
+import { apiGetRoundDashboard, apiRecordShare, apiEndRound, apiRoundStreamUrl } from '../api/authApi.js'
 
 function RoundDashboardPage() {
   const { id: roundId } = useParams()
@@ -14,14 +14,11 @@ function RoundDashboardPage() {
 
   const loadData = useCallback(async () => {
     try {
-      const [roundRes, cloudRes, leaderRes] = await Promise.all([
-        apiGetRoundDetails({ roundId }),
-        apiGetWordCloud({ roundId }),
-        apiGetLeaderboard({ roundId })
-      ])
-      setRound(roundRes)
-      setFrequencies(cloudRes.frequencies)
-      setLeaderboard(leaderRes.leaderboard)
+      // One request for details, cloud and leaderboard from the same server snapshot
+      const data = await apiGetRoundDashboard({ roundId })
+      setRound(data.round)
+      setFrequencies(data.frequencies)
+      setLeaderboard(data.leaderboard)
     } catch (error) {
       setError(error.message || 'Failed to load data')
     } finally {
@@ -30,10 +27,42 @@ function RoundDashboardPage() {
   }, [roundId])
 
   useEffect(() => {
-    loadData()
-    const interval = setInterval(loadData, 5000) // Poll every 5 seconds
-    return () => clearInterval(interval)
-  }, [loadData])
+    let interval = null
+    const startPolling = () => {
+      if (!interval) interval = setInterval(loadData, 5000) // Poll every 5 seconds
+    }
+    const stopPolling = () => {
+      clearInterval(interval)
+      interval = null
+    }
+
+    // Live updates over one long-lived connection; polling is only the fallback
+    if (typeof EventSource === 'undefined') {
+      loadData()
+      startPolling()
+      return stopPolling
+    }
+
+    const source = new EventSource(apiRoundStreamUrl({ roundId }))
+    source.onmessage = (event) => {
+      stopPolling()
+      const data = JSON.parse(event.data)
+      setRound(data.round)
+      setFrequencies(data.frequencies)
+      setLeaderboard(data.leaderboard)
+      setLoading(false)
+    }
+    source.onerror = () => {
+      // EventSource keeps reconnecting on its own unless the server refused the stream
+      if (source.readyState === EventSource.CLOSED) loadData()
+      startPolling()
+    }
+
+    return () => {
+      source.close()
+      stopPolling()
+    }
+  }, [loadData, roundId])
 
   function handleShare() {
     const playerId = `sharer_${Date.now()}`
@@ -21,11 +21,43 @@ function StartGame() {
     // Reset score on fresh login/mount
     setScore(0);
     loadQuestion();
-    loadScore();
-    const interval = setInterval(loadScore, 2000);
-    return () => clearInterval(interval);
+    return watchScore();
   }, []);
 
+  // Long-polls /api/user-score: the server holds each request until the score
+  // moves (or ~25s pass). Servers that answer straight away are re-polled every 2s.
+  function watchScore() {
+    let stopped = false;
+    const controller = new AbortController();
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+    (async () => {
+      let since = null;
+      while (!stopped) {
+        const query = since === null ? "" : `&since=${since}&wait=25`;
+        try {
+          const res = await fetch(`${apiUrl}/api/user-score?user_id=${userId}${query}`, {
+            signal: controller.signal,
+          });
+          const data = await res.json();
+          const total = data.total_score || 0;
+          setScore(total);
+          const changed = total !== since;
+          since = total;
+          if (!changed) await sleep(2000);
+        } catch (e) {
+          if (stopped) return;
+          await sleep(2000);
+        }
+      }
+    })();
+
+    return () => {
+      stopped = true;
+      controller.abort();
+    };
+  }
+
   async function loadQuestion() {
     const res = await fetch(`${apiUrl}/api/questions`);
     const data = await res.json();
@@ -1,15 +1,23 @@
 import { useEffect, useRef, useState } from "react";
 import { useNavigate } from "react-router-dom";
+import WordCloudChart from "../components/WordCloudChart.jsx";
 
 function WordCloudPage() {
   const navigate = useNavigate();
   const [words, setWords] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState("");
+  // Server-side placement of the current cloud (/api/wordcloud?layout=1)
+  const [layout, setLayout] = useState(null);
 
   // 🔥 Store previous frequencies safely
   const prevFreqRef = useRef({});
 
+  // Current cloud as applied from full snapshots and deltas
+  const wordMapRef = useRef({});
+  const versionRef = useRef(null);
+  const layoutFetchRef = useRef({ inFlight: false, stale: false });
+
   const apiUrl =
     import.meta.env.VITE_BACKEND_URL || "http://127.0.0.1:8000";
 
@@ -24,25 +32,95 @@ function WordCloudPage() {
 
   /* ---------- LOAD WORD CLOUD ---------- */
   useEffect(() => {
-    loadWordCloud();
+    let interval = null;
+    const startPolling = () => {
+      if (!interval) interval = setInterval(loadWordCloud, 3000);
+    };
+    const stopPolling = () => {
+      clearInterval(interval);
+      interval = null;
+    };
+
+    // 🔁 live updates pushed by the server; polling is only the fallback
+    if (typeof EventSource === "undefined") {
+      loadWordCloud();
+      startPolling();
+      return stopPolling;
+    }
+
+    const source = new EventSource(`${apiUrl}/api/wordcloud/stream`);
+    source.onmessage = (event) => {
+      stopPolling();
+      applyCloud(JSON.parse(event.data));
+      setLoading(false);
+    };
+    source.onerror = () => {
+      // EventSource keeps reconnecting on its own unless the server refused the stream
+      if (source.readyState === EventSource.CLOSED) loadWordCloud();
+      startPolling();
+    };
 
-    // 🔁 live refresh for animation
-    const interval = setInterval(loadWordCloud, 3000);
-    return () => clearInterval(interval);
+    return () => {
+      source.close();
+      stopPolling();
+    };
   }, []);
 
+  function applyCloud(data) {
+    if (data.full !== false) wordMapRef.current = {};
+    for (const w of data.words || []) {
+      const freq = w.value || w.frequency || 0;
+      if (freq > 0) wordMapRef.current[w.text] = w;
+      else delete wordMapRef.current[w.text];
+    }
+    if (data.version !== undefined) versionRef.current = data.version;
+
+    const sorted = Object.values(wordMapRef.current).sort(
+      (a, b) =>
+        (b.value || b.frequency || 1) -
+        (a.value || a.frequency || 1)
+    );
+
+    setWords(sorted);
+    refreshLayout();
+  }
+
+  async function refreshLayout() {
+    // One request at a time; versions applied meanwhile are covered by a single follow-up
+    const state = layoutFetchRef.current;
+    if (state.inFlight) {
+      state.stale = true;
+      return;
+    }
+    state.inFlight = true;
+    try {
+      do {
+        state.stale = false;
+        const res = await fetch(`${apiUrl}/api/wordcloud?layout=1`);
+        if (res.ok) {
+          const data = await res.json();
+          if (data.layout) setLayout(data);
+        }
+      } while (state.stale);
+    } catch {
+      // Keep showing the grid
+    } finally {
+      state.inFlight = false;
+    }
+  }
+
   async function loadWordCloud() {
     try {
-      const res = await fetch(`${apiUrl}/api/wordcloud`);
+      // Ask only for words changed since the last version we applied
+      const since = versionRef.current;
+      const url =
+        since === null
+          ? `${apiUrl}/api/wordcloud`
+          : `${apiUrl}/api/wordcloud?since=${since}`;
+      const res = await fetch(url);
       const data = await res.json();
 
-      const sorted = (data.words || []).sort(
-        (a, b) =>
-          (b.value || b.frequency || 1) -
-          (a.value || a.frequency || 1)
-      );
-
-      setWords(sorted);
+      applyCloud(data);
     } catch {
       setError("Failed to load word cloud");
     } finally {
@@ -197,7 +275,10 @@ function WordCloudPage() {
               100% { background-position: 200% 0%; }
             }
           `}</style>
-          {/* GRID – NO OVERLAP */}
+          {layout?.words?.length ? (
+            <WordCloudChart layout={layout} />
+          ) : (
+          /* GRID – NO OVERLAP */
           <div
             className="word-cloud-grid"
             style={{
@@ -263,6 +344,7 @@ function WordCloudPage() {
               );
             })}
           </div>
+          )}
         </div>
 
         {/* BACK */}